@@ -0,0 +1,279 @@
+"""Benchmark suite for LoadingButton paint and animation cost.
+
+Runs on the offscreen platform and writes machine-readable results:
+
+    python -m benchmarks.loading_button_benchmark --output results.json
+    python -m benchmarks.loading_button_benchmark --compare results.json
+"""
+
+import os
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+from qtpy import API_NAME, QT_VERSION
+from qtpy.QtCore import QRect, QEventLoop, QTimer
+from qtpy.QtWidgets import QApplication, QWidget
+from src.pyqt_loading_button import LoadingButton, AnimationType
+
+
+def process_events_for(duration: float):
+    """Run the event loop for the given time without busy waiting
+
+    :param duration: time to run the event loop for (in s)
+    """
+
+    loop = QEventLoop()
+    QTimer.singleShot(int(duration * 1000), loop.quit)
+    loop.exec()
+
+
+def start_blocking_action(buttons: list) -> threading.Event:
+    """Start an action on every button that runs until the returned event gets set
+
+    :param buttons: buttons to start
+    :return: event stopping all actions
+    """
+
+    release = threading.Event()
+    for button in buttons:
+        button.setAction(release.wait)
+        button.clicked.emit()
+    return release
+
+
+def stop_blocking_action(buttons: list, release: threading.Event):
+    """Stop the actions started by start_blocking_action() and wait for the buttons to finish
+
+    :param buttons: buttons to stop
+    :param release: event returned by start_blocking_action()
+    """
+
+    release.set()
+    while any(button.isRunning() for button in buttons):
+        QApplication.processEvents()
+
+
+def benchmark_paint(animation_type: AnimationType, size: int, duration: float, frame_cache: bool) -> dict:
+    """Measure how many frames per second a running button can paint
+
+    :param animation_type: animation type
+    :param size: animation width
+    :param duration: measuring time (in s)
+    :param frame_cache: whether pre-rendered frames are used
+    :return: result entry
+    """
+
+    button = LoadingButton()
+    button.resize(size * 8, size * 2)
+    button.setStyleSheet('background: #23395d; border-radius: 5px;')
+    button.setAnimationType(animation_type)
+    button.setAnimationWidth(size)
+    button.setAnimationStrokeWidth(max(1, size // 5))
+    button.setFrameCacheEnabled(frame_cache)
+    button.show()
+
+    release = start_blocking_action([button])
+    process_events_for(0.05)
+
+    # Repaint the area the animation invalidates between two frames
+    side = size * 2
+    rect = QRect((button.width() - side) // 2, (button.height() - side) // 2, side, side)
+
+    paints = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        button.repaint(rect)
+        paints += 1
+    elapsed = time.perf_counter() - start
+
+    stop_blocking_action([button], release)
+    button.deleteLater()
+
+    return {
+        'name': 'paint',
+        'params': {'animation_type': animation_type.name, 'size': size, 'frame_cache': frame_cache},
+        'value': paints / elapsed,
+        'unit': 'paints/s'
+    }
+
+
+def benchmark_concurrent(count: int, duration: float) -> dict:
+    """Measure the CPU time used while many buttons are animating at the same time
+
+    :param count: number of running buttons
+    :param duration: measuring time (in s)
+    :return: result entry
+    """
+
+    window = QWidget()
+    window.resize(800, 600)
+    buttons = []
+    for index in range(count):
+        button = LoadingButton(window)
+        button.setGeometry((index % 8) * 100, (index // 8) * 35, 95, 30)
+        button.setAnimationType(AnimationType.Circle if index % 2 else AnimationType.Dots)
+        buttons.append(button)
+    window.show()
+
+    release = start_blocking_action(buttons)
+    process_events_for(0.1)
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    process_events_for(duration)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    stop_blocking_action(buttons, release)
+    window.deleteLater()
+
+    return {
+        'name': 'concurrent_cpu',
+        'params': {'buttons': count},
+        'value': cpu / wall,
+        'unit': 'cpu s/s'
+    }
+
+
+def benchmark_construction(count: int) -> dict:
+    """Measure the time it takes to construct a button
+
+    :param count: number of buttons to construct
+    :return: result entry
+    """
+
+    parent = QWidget()
+
+    start = time.perf_counter()
+    for _ in range(count):
+        LoadingButton(parent)
+    elapsed = time.perf_counter() - start
+
+    parent.deleteLater()
+
+    return {
+        'name': 'construction',
+        'params': {'buttons': count},
+        'value': elapsed / count * 1e6,
+        'unit': 'us/button'
+    }
+
+
+def benchmark_click_latency(repetitions: int) -> dict:
+    """Measure the time between a click and the action starting to execute
+
+    :param repetitions: number of clicks
+    :return: result entry
+    """
+
+    button = LoadingButton()
+    button.show()
+    latencies = []
+    started = []
+
+    button.setAction(lambda: started.append(time.perf_counter()))
+
+    for _ in range(repetitions):
+        started.clear()
+        clicked = time.perf_counter()
+        button.clicked.emit()
+        while button.isRunning():
+            QApplication.processEvents()
+        latencies.append((started[0] - clicked) * 1e6)
+
+    button.deleteLater()
+
+    return {
+        'name': 'click_latency',
+        'params': {'repetitions': repetitions},
+        'value': statistics.median(latencies),
+        'unit': 'us (median)'
+    }
+
+
+def run(quick: bool = False) -> dict:
+    """Run all benchmarks
+
+    :param quick: whether to use shorter measuring times and fewer repetitions
+    :return: benchmark report
+    """
+
+    duration = 0.2 if quick else 1.0
+    results = []
+
+    for animation_type in (AnimationType.Circle, AnimationType.Dots):
+        for size in (15, 30, 60):
+            for frame_cache in (False, True):
+                results.append(benchmark_paint(animation_type, size, duration, frame_cache))
+
+    for count in (1, 10, 60):
+        results.append(benchmark_concurrent(count, duration * 2))
+
+    results.append(benchmark_construction(100 if quick else 1000))
+    results.append(benchmark_click_latency(20 if quick else 200))
+
+    return {
+        'python': platform.python_version(),
+        'qt_api': API_NAME,
+        'qt_version': QT_VERSION,
+        'platform': platform.platform(),
+        'results': results
+    }
+
+
+def result_key(result: dict) -> str:
+    """Get a key identifying a result across reports
+
+    :param result: result entry
+    :return: key
+    """
+
+    return result['name'] + json.dumps(result['params'], sort_keys=True)
+
+
+def compare(report: dict, baseline: dict):
+    """Print the ratio of every result to the same result in the baseline report
+
+    :param report: current report
+    :param baseline: baseline report
+    """
+
+    baseline_results = {result_key(result): result for result in baseline['results']}
+    for result in report['results']:
+        previous = baseline_results.get(result_key(result))
+        ratio = result['value'] / previous['value'] if previous and previous['value'] else float('nan')
+        print('{:<16} {:<60} {:>12.2f} {:<12} x{:.2f}'.format(
+            result['name'], json.dumps(result['params'], sort_keys=True), result['value'], result['unit'], ratio))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark LoadingButton paint and animation cost')
+    parser.add_argument('--output', help='file the JSON report gets written to (stdout if omitted)')
+    parser.add_argument('--compare', help='JSON report of a previous run to compare against')
+    parser.add_argument('--quick', action='store_true', help='shorter measuring times and fewer repetitions')
+    arguments = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    report = run(arguments.quick)
+
+    if arguments.compare:
+        with open(arguments.compare, 'r') as fh:
+            compare(report, json.load(fh))
+
+    if arguments.output:
+        with open(arguments.output, 'w') as fh:
+            json.dump(report, fh, indent=2)
+    elif not arguments.compare:
+        json.dump(report, sys.stdout, indent=2)
+
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,13 @@
-from .loading_button import LoadingButton, AnimationType
\ No newline at end of file
+from .loading_button import LoadingButton, AnimationType
+from .loading_button_group import LoadingButtonGroup
+from .loading_button_delegate import LoadingButtonDelegate
+from .click_policy import ClickPolicy
+from .execution_mode import ExecutionMode
+from .animation_clock import AnimationClock
+from .frame_cache import FrameCache
+from .spinner_renderer import SpinnerRenderer
+from .stats import LoadingButtonStats
+from .worker import Worker
+from .action_cache import ActionCache
+from .retry_policy import RetryPolicy
+from .pipeline import Pipeline
\ No newline at end of file
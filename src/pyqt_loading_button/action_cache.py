@@ -0,0 +1,155 @@
+import time
+from collections import OrderedDict
+
+
+class ActionCache:
+
+    def __init__(self, time_to_live: int = 60000, maximum_size: int = 128,
+                 stale_time: int = 0, key: callable = None):
+        """Create a new ActionCache instance
+
+        :param time_to_live: time a result stays fresh (in ms)
+        :param maximum_size: maximum number of cached results before the least recently used one is dropped
+        :param stale_time: time an expired result is still returned while it gets refreshed in the background (in ms)
+        :param key: callable returning the key of the current call (the action is used as key if None)
+        """
+
+        # ActionCache attributes
+        self.__time_to_live = max(0, time_to_live)
+        self.__maximum_size = max(1, maximum_size)
+        self.__stale_time = max(0, stale_time)
+        self.__key = key
+
+        # Cached results and the time they were stored, least recently used first
+        self.__entries = OrderedDict()
+        self.__revalidating = set()
+
+    def getKey(self, action: callable) -> object:
+        """Get the key the result of the given action is cached under
+
+        :param action: action about to be executed
+        :return: cache key
+        """
+
+        return self.__key() if self.__key is not None else action
+
+    def get(self, key: object) -> tuple:
+        """Get a cached result
+
+        :param key: cache key
+        :return: whether a result was found, the result and whether the result is stale
+        """
+
+        entry = self.__entries.get(key)
+        if entry is None:
+            return False, None, False
+
+        result, stored_time = entry
+        age = (time.monotonic() - stored_time) * 1000
+        if age >= self.__time_to_live + self.__stale_time:
+            del self.__entries[key]
+            return False, None, False
+
+        self.__entries.move_to_end(key)
+        return True, result, age >= self.__time_to_live
+
+    def set(self, key: object, result: object):
+        """Store a result, dropping the least recently used results if the cache is full
+
+        :param key: cache key
+        :param result: result to be stored
+        """
+
+        self.__entries[key] = (result, time.monotonic())
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__maximum_size:
+            self.__entries.popitem(last=False)
+
+    def invalidate(self, key: object = None):
+        """Remove a cached result, so the next call executes the action again
+
+        :param key: cache key (all results get removed if None)
+        """
+
+        if key is None:
+            self.__entries.clear()
+        else:
+            self.__entries.pop(key, None)
+
+    def startRevalidation(self, key: object) -> bool:
+        """Mark a stale result as being refreshed, so only one refresh per key runs at a time
+
+        :param key: cache key
+        :return: whether the caller should refresh the result
+        """
+
+        if key in self.__revalidating:
+            return False
+        self.__revalidating.add(key)
+        return True
+
+    def finishRevalidation(self, key: object):
+        """Mark a stale result as no longer being refreshed
+
+        :param key: cache key
+        """
+
+        self.__revalidating.discard(key)
+
+    def getSize(self) -> int:
+        """Get the number of cached results
+
+        :return: number of cached results
+        """
+
+        return len(self.__entries)
+
+    def getTimeToLive(self) -> int:
+        """Get the time a result stays fresh
+
+        :return: time to live (in ms)
+        """
+
+        return self.__time_to_live
+
+    def setTimeToLive(self, time_to_live: int):
+        """Set the time a result stays fresh
+
+        :param time_to_live: new time to live (in ms)
+        """
+
+        self.__time_to_live = max(0, time_to_live)
+
+    def getMaximumSize(self) -> int:
+        """Get the maximum number of cached results
+
+        :return: maximum number of cached results
+        """
+
+        return self.__maximum_size
+
+    def setMaximumSize(self, maximum_size: int):
+        """Set the maximum number of cached results, dropping the least recently used results if necessary
+
+        :param maximum_size: new maximum number of cached results
+        """
+
+        self.__maximum_size = max(1, maximum_size)
+        while len(self.__entries) > self.__maximum_size:
+            self.__entries.popitem(last=False)
+
+    def getStaleTime(self) -> int:
+        """Get the time an expired result is still returned while it gets refreshed in the background
+
+        :return: stale time (in ms)
+        """
+
+        return self.__stale_time
+
+    def setStaleTime(self, stale_time: int):
+        """Set the time an expired result is still returned while it gets refreshed in the background
+
+        :param stale_time: new stale time (in ms, 0 to never return expired results)
+        """
+
+        self.__stale_time = max(0, stale_time)
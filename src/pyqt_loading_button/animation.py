@@ -0,0 +1,254 @@
+import functools
+import math
+from array import array
+from qtpy.QtCore import QEasingCurve
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Span limits of the circle (in degrees)
+CIRCLE_MINIMUM_SPAN = 30
+CIRCLE_MAXIMUM_SPAN = 280
+
+# Durations of a single span change of the circle and a single movement of a dot, relative to the animation speed
+CIRCLE_SPAN_SPEED_COEFFICIENT = 0.35
+DOTS_SPEED_COEFFICIENT = 0.3
+
+# Number of easing table samples per frame, keeping lookups within a quarter frame of the exact value
+EASING_SAMPLES_PER_FRAME = 4
+
+
+@functools.lru_cache(maxsize=None)
+def get_easing_curve(easing_curve: QEasingCurve.Type) -> QEasingCurve:
+    """Get a shared QEasingCurve instance for the given curve type
+
+    :param easing_curve: easing curve type
+    :return: easing curve
+    """
+
+    return QEasingCurve(easing_curve)
+
+
+@functools.lru_cache(maxsize=None)
+def get_easing_table(easing_curve: QEasingCurve.Type, duration: int, frame_rate: int = 60):
+    """Get the precomputed values of an easing curve for a movement with the given duration.
+    Tables are built once and shared by all animations using the same curve, duration and frame rate.
+
+    :param easing_curve: easing curve type
+    :param duration: duration of the movement (in ms)
+    :param frame_rate: frame rate the movement is shown at (in frames per second)
+    :return: eased values for evenly spaced progress values from 0 to 1 (numpy array if available)
+    """
+
+    size = max(2, math.ceil(duration * frame_rate / 1000) * EASING_SAMPLES_PER_FRAME + 1)
+    curve = get_easing_curve(easing_curve)
+    values = [curve.valueForProgress(index / (size - 1)) for index in range(size)]
+
+    if numpy is not None:
+        table = numpy.array(values)
+        table.flags.writeable = False
+        return table
+    return array('d', values)
+
+
+def ease(table, progress: float) -> float:
+    """Look up the eased value of a single progress value
+
+    :param table: table returned by get_easing_table()
+    :param progress: linear progress between 0 and 1
+    :return: eased value
+    """
+
+    return float(table[int(progress * (len(table) - 1) + 0.5)])
+
+
+def ease_many(table, progress_values) -> list:
+    """Look up the eased values of many progress values at once
+
+    :param table: table returned by get_easing_table()
+    :param progress_values: linear progress values between 0 and 1
+    :return: eased values
+    """
+
+    last = len(table) - 1
+    if numpy is not None:
+        indices = (numpy.asarray(progress_values, dtype=float) * last + 0.5).astype(int)
+        return table[indices].tolist()
+    return [table[int(progress * last + 0.5)] for progress in progress_values]
+
+
+@functools.lru_cache(maxsize=None)
+def get_handoff_progress(easing_curve: QEasingCurve.Type, threshold: float) -> float:
+    """Get the linear progress at which the eased value first exceeds the threshold
+
+    :param easing_curve: easing curve type
+    :param threshold: eased value between 0 and 1
+    :return: linear progress between 0 and 1
+    """
+
+    curve = get_easing_curve(easing_curve)
+    low, high = 0.0, 1.0
+    for _ in range(32):
+        middle = (low + high) / 2
+        if curve.valueForProgress(middle) > threshold:
+            high = middle
+        else:
+            low = middle
+    return high
+
+
+def dots_cycle(duration: int, easing_curve: QEasingCurve.Type = QEasingCurve.Type.InOutSine,
+               threshold: float = 0.75) -> float:
+    """Get the time it takes the dots animation to complete one loop
+
+    :param duration: time it takes a single dot to move up (in ms)
+    :param easing_curve: easing curve of a single movement
+    :param threshold: eased value at which the next dot starts moving
+    :return: duration of one loop (in ms)
+    """
+
+    return 2 * duration + 2 * get_handoff_progress(easing_curve, threshold) * duration
+
+
+def _dots_phases(elapsed: float, duration: int, easing_curve: QEasingCurve.Type, threshold: float) -> tuple:
+    """Get how far each dot is through its movement
+
+    :return: phase of every dot (0 to 1 moving up, 1 to 2 moving down, None resting)
+    """
+
+    stagger = get_handoff_progress(easing_curve, threshold) * duration
+    phase = elapsed % dots_cycle(duration, easing_curve, threshold)
+
+    phases = []
+    for index in range(3):
+        local = (phase - index * stagger) / duration
+        phases.append(local if 0 <= local < 2 else None)
+    return tuple(phases)
+
+
+def _dots_offset(phase: float, eased: float, stroke_width: int) -> int:
+    """Convert the phase and eased value of a dot to its offset
+
+    :return: offset of the dot
+    """
+
+    if phase is None:
+        return 0
+    if phase < 1:
+        return int(stroke_width * eased)
+    return stroke_width + int(-stroke_width * eased)
+
+
+def dots_offsets(elapsed: int, duration: int, stroke_width: int,
+                 easing_curve: QEasingCurve.Type = QEasingCurve.Type.InOutSine,
+                 threshold: float = 0.75, frame_rate: int = 60) -> tuple:
+    """Compute the offsets of all three dots from a single time value.
+    Every dot moves up and back down, each dot starting once the previous one
+    has moved past the threshold on its way up. The first dot starts again
+    once the third one is back down.
+
+    :param elapsed: time since the animation started (in ms)
+    :param duration: time it takes a single dot to move up (in ms)
+    :param stroke_width: maximum offset of a dot
+    :param easing_curve: easing curve of a single movement
+    :param threshold: eased value at which the next dot starts moving
+    :param frame_rate: frame rate the animation is shown at (in frames per second)
+    :return: offsets of the first, second and third dot
+    """
+
+    if duration <= 0:
+        return 0, 0, 0
+
+    table = get_easing_table(easing_curve, duration, frame_rate)
+    return tuple(_dots_offset(phase, ease(table, phase % 1) if phase is not None else 0, stroke_width)
+                 for phase in _dots_phases(elapsed, duration, easing_curve, threshold))
+
+
+def dots_offsets_many(elapsed_values, duration: int, stroke_width: int,
+                      easing_curve: QEasingCurve.Type = QEasingCurve.Type.InOutSine,
+                      threshold: float = 0.75, frame_rate: int = 60) -> list:
+    """Compute the offsets of all three dots for many time values with a single table lookup
+
+    :param elapsed_values: times since the animation started (in ms)
+    :param duration: time it takes a single dot to move up (in ms)
+    :param stroke_width: maximum offset of a dot
+    :param easing_curve: easing curve of a single movement
+    :param threshold: eased value at which the next dot starts moving
+    :param frame_rate: frame rate the animation is shown at (in frames per second)
+    :return: offsets of the first, second and third dot for every time value
+    """
+
+    if duration <= 0:
+        return [(0, 0, 0) for _ in elapsed_values]
+
+    phases = [phase for elapsed in elapsed_values
+              for phase in _dots_phases(elapsed, duration, easing_curve, threshold)]
+    eased = ease_many(get_easing_table(easing_curve, duration, frame_rate),
+                      [phase % 1 if phase is not None else 0 for phase in phases])
+    offsets = [_dots_offset(phase, value, stroke_width) for phase, value in zip(phases, eased)]
+    return [tuple(offsets[index:index + 3]) for index in range(0, len(offsets), 3)]
+
+
+def circle_cycle(duration: int, span_duration: int, minimum_span: int = CIRCLE_MINIMUM_SPAN,
+                 maximum_span: int = CIRCLE_MAXIMUM_SPAN) -> int:
+    """Get the time after which the circle animation repeats itself exactly.
+    Every shrink and grow of the span moves the arc forward by the difference of both spans,
+    so the arc only returns to its initial position once this adds up to full turns at the
+    same time as the rotation completes.
+
+    :param duration: time it takes the arc to rotate once (in ms)
+    :param span_duration: time it takes the span to shrink or grow once (in ms)
+    :param minimum_span: minimum span of the arc (in degrees)
+    :param maximum_span: maximum span of the arc (in degrees)
+    :return: duration of one loop (in ms)
+    """
+
+    if span_duration <= 0:
+        return duration
+    span_range = maximum_span - minimum_span
+    span_cycle = 2 * span_duration * (360 // math.gcd(span_range, 360))
+    return duration * span_cycle // math.gcd(duration, span_cycle) if duration > 0 else span_cycle
+
+
+def circle_frame(elapsed: float, duration: int, span_duration: int,
+                 minimum_span: int = CIRCLE_MINIMUM_SPAN, maximum_span: int = CIRCLE_MAXIMUM_SPAN,
+                 easing_curve: QEasingCurve.Type = QEasingCurve.Type.InOutCubic, frame_rate: int = 60) -> tuple:
+    """Compute the rotation and span of the circle from a single time value.
+    The arc rotates once per duration while its span shrinks to the minimum and grows
+    back to the maximum. Every time the span grows, the tail of the arc stays in place,
+    moving the start of the arc forward by the difference of both spans.
+
+    :param elapsed: time since the animation started (in ms)
+    :param duration: time it takes the arc to rotate once (in ms)
+    :param span_duration: time it takes the span to shrink or grow once (in ms)
+    :param minimum_span: minimum span of the arc (in degrees)
+    :param maximum_span: maximum span of the arc (in degrees)
+    :param easing_curve: easing curve of the span
+    :param frame_rate: frame rate the animation is shown at (in frames per second)
+    :return: start angle and span of the arc (in degrees)
+    """
+
+    span_range = maximum_span - minimum_span
+    rotation = 360 - 360 * (elapsed % duration) / duration if duration > 0 else 0
+
+    if span_duration <= 0:
+        return rotation % 360, maximum_span
+
+    table = get_easing_table(easing_curve, span_duration, frame_rate)
+    cycles, local = divmod(elapsed, span_duration * 2)
+    offset = span_range * cycles
+
+    # Shrinking span
+    if local < span_duration:
+        span = maximum_span - span_range * ease(table, local / span_duration)
+
+    # Growing span
+    else:
+        eased = ease(table, local / span_duration - 1)
+        span = minimum_span + span_range * eased
+        offset += span_range * eased
+
+    return (rotation - offset) % 360, span
@@ -0,0 +1,138 @@
+from qtpy.QtCore import QObject, QTimer, QElapsedTimer, Qt
+
+
+class AnimationClock(QObject):
+
+    # Shared instance used by all LoadingButtons
+    __instance = None
+
+    def __init__(self, parent=None):
+        """Create a new AnimationClock instance
+
+        :param parent: the parent object
+        """
+
+        super(AnimationClock, self).__init__(parent)
+
+        # AnimationClock attributes
+        self.__frame_rate = 60
+        self.__subscribers = []
+        self.__last_tick_time = None
+        self.__lag = 0.0
+
+        self.__elapsed_timer = QElapsedTimer()
+        self.__elapsed_timer.start()
+
+        self.__timer = QTimer(self)
+        self.__timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.__timer.setInterval(self.__get_interval())
+        self.__timer.timeout.connect(self.__handle_tick)
+
+    @staticmethod
+    def instance() -> 'AnimationClock':
+        """Get the shared AnimationClock instance
+
+        :return: shared animation clock
+        """
+
+        if AnimationClock.__instance is None:
+            AnimationClock.__instance = AnimationClock()
+        return AnimationClock.__instance
+
+    def __get_interval(self) -> int:
+        """Get the timer interval (in ms) for the current frame rate
+
+        :return: timer interval (in ms)
+        """
+
+        return max(1, round(1000 / self.__frame_rate))
+
+    def __handle_tick(self):
+        """Advances every subscriber once per frame"""
+
+        now = self.__elapsed_timer.elapsed()
+
+        # Smoothed delay of the ticks compared to the timer interval
+        if self.__last_tick_time is not None:
+            lag = max(0, now - self.__last_tick_time - self.__timer.interval())
+            self.__lag = self.__lag * 0.9 + lag * 0.1
+        self.__last_tick_time = now
+
+        for subscriber in list(self.__subscribers):
+            subscriber(now)
+
+    def subscribe(self, subscriber: callable):
+        """Register a callable that gets advanced on every frame.
+        The clock only runs while it has at least one subscriber.
+
+        :param subscriber: callable receiving the current time (in ms)
+        """
+
+        if subscriber not in self.__subscribers:
+            self.__subscribers.append(subscriber)
+        if not self.__timer.isActive():
+            self.__last_tick_time = None
+            self.__lag = 0.0
+            self.__timer.start()
+
+    def unsubscribe(self, subscriber: callable):
+        """Remove a previously registered subscriber.
+        The clock stops once the last subscriber is removed.
+
+        :param subscriber: subscriber to be removed
+        """
+
+        if subscriber in self.__subscribers:
+            self.__subscribers.remove(subscriber)
+        if not self.__subscribers:
+            self.__timer.stop()
+
+    def isActive(self) -> bool:
+        """Get whether the clock is currently ticking
+
+        :return: whether the clock is currently ticking
+        """
+
+        return self.__timer.isActive()
+
+    def getSubscriberCount(self) -> int:
+        """Get the number of registered subscribers
+
+        :return: number of registered subscribers
+        """
+
+        return len(self.__subscribers)
+
+    def getTime(self) -> int:
+        """Get the current clock time (in ms)
+
+        :return: current clock time (in ms)
+        """
+
+        return self.__elapsed_timer.elapsed()
+
+    def getLag(self) -> float:
+        """Get the smoothed delay (in ms) of the ticks compared to the frame interval.
+        A high lag means the event loop is too busy to keep up with the frame rate.
+
+        :return: event loop lag (in ms)
+        """
+
+        return self.__lag
+
+    def getFrameRate(self) -> int:
+        """Get the current frame rate (in frames per second)
+
+        :return: frame rate (in frames per second)
+        """
+
+        return self.__frame_rate
+
+    def setFrameRate(self, frame_rate: int):
+        """Set the frame rate (in frames per second)
+
+        :param frame_rate: new frame rate (in frames per second)
+        """
+
+        self.__frame_rate = max(1, frame_rate)
+        self.__timer.setInterval(self.__get_interval())
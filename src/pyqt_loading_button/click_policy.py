@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class ClickPolicy(Enum):
+    Drop = 1
+    QueueLatest = 2
+    QueueAll = 3
+    Debounce = 4
+    Throttle = 5
@@ -0,0 +1,33 @@
+import asyncio
+import threading
+
+
+class EventLoopThread(threading.Thread):
+
+    def __init__(self):
+        """Create a new EventLoopThread instance.
+        Runs an asyncio event loop in the background that coroutine actions get scheduled on."""
+
+        super(EventLoopThread, self).__init__(name='LoadingButtonEventLoop', daemon=True)
+
+        self.__loop = asyncio.new_event_loop()
+
+    def run(self):
+        """Runs the event loop until it gets stopped"""
+
+        asyncio.set_event_loop(self.__loop)
+        self.__loop.run_forever()
+
+    def getLoop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop running in this thread
+
+        :return: event loop
+        """
+
+        return self.__loop
+
+    def stop(self):
+        """Stops the event loop and waits for the thread to finish"""
+
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.join()
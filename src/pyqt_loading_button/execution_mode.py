@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ExecutionMode(Enum):
+    Thread = 1
+    Process = 2
@@ -0,0 +1,213 @@
+import math
+from collections import OrderedDict
+from qtpy.QtCore import QRectF, QSizeF, Qt
+from qtpy.QtGui import QPainter, QPixmap, QColor, QBrush
+from .animation import CIRCLE_MINIMUM_SPAN, CIRCLE_MAXIMUM_SPAN, dots_cycle, dots_offsets_many
+from .animation_type import AnimationType
+from .painting import create_circle_pen, draw_circle, draw_dots
+
+
+class FrameCache:
+
+    # Shared instance used by all LoadingButtons
+    __instance = None
+
+    def __init__(self, maximum_size: int = 32, frame_count: int = 60):
+        """Create a new FrameCache instance.
+        Pre-renders the frames of an animation into a single pixmap (atlas) and keeps
+        the most recently used atlases around.
+
+        :param maximum_size: maximum number of atlases kept in the cache
+        :param frame_count: number of frames rendered per atlas
+        """
+
+        # FrameCache attributes
+        self.__maximum_size = maximum_size
+        self.__frame_count = frame_count
+        self.__atlases = OrderedDict()
+
+    @staticmethod
+    def instance() -> 'FrameCache':
+        """Get the shared FrameCache instance
+
+        :return: shared frame cache
+        """
+
+        if FrameCache.__instance is None:
+            FrameCache.__instance = FrameCache()
+        return FrameCache.__instance
+
+    @staticmethod
+    def getFrameSize(animation_type: AnimationType, width: int, stroke_width: int) -> QSizeF:
+        """Get the size of a single frame
+
+        :param animation_type: animation type
+        :param width: animation width
+        :param stroke_width: animation stroke width
+        :return: size of a single frame
+        """
+
+        if animation_type == AnimationType.Circle:
+            side = width - stroke_width + stroke_width * 2
+            return QSizeF(side, side)
+
+        spacing = math.ceil(width / 3)
+        return QSizeF(spacing * 2 + stroke_width * 3, stroke_width * 4)
+
+    def getCircleFrameIndex(self, span: int) -> int:
+        """Get the index of the frame showing the given circle span
+
+        :param span: span of the arc (in degrees)
+        :return: frame index
+        """
+
+        progress = (span - CIRCLE_MINIMUM_SPAN) / (CIRCLE_MAXIMUM_SPAN - CIRCLE_MINIMUM_SPAN)
+        return min(self.__frame_count - 1, max(0, round(progress * (self.__frame_count - 1))))
+
+    def getDotsFrameIndex(self, elapsed: int, duration: int) -> int:
+        """Get the index of the frame showing the dots at the given time
+
+        :param elapsed: time since the animation started (in ms)
+        :param duration: time it takes a single dot to move up (in ms)
+        :return: frame index
+        """
+
+        if duration <= 0:
+            return 0
+        cycle = dots_cycle(duration)
+        return int((elapsed % cycle) / cycle * self.__frame_count) % self.__frame_count
+
+    def __render_atlas(self, animation_type: AnimationType, width: int, stroke_width: int,
+                       color: QColor, device_pixel_ratio: float) -> QPixmap:
+        """Render all frames of an animation next to each other into a single pixmap
+
+        :return: rendered atlas
+        """
+
+        frame_size = FrameCache.getFrameSize(animation_type, width, stroke_width)
+        atlas = QPixmap(math.ceil(frame_size.width() * self.__frame_count * device_pixel_ratio),
+                        math.ceil(frame_size.height() * device_pixel_ratio))
+        atlas.setDevicePixelRatio(device_pixel_ratio)
+        atlas.fill(Qt.GlobalColor.transparent)
+
+        # All dots frames are computed in a single batch
+        if animation_type == AnimationType.Dots:
+            frame_offsets = dots_offsets_many([index * dots_cycle(1000) / self.__frame_count
+                                               for index in range(self.__frame_count)], 1000, stroke_width)
+
+        pen = create_circle_pen(color, stroke_width)
+        brush = QBrush(color)
+        painter = QPainter(atlas)
+        for index in range(self.__frame_count):
+            left = int(frame_size.width() * index)
+
+            # Circle frames start at 0 degrees and get rotated into place when drawn
+            if animation_type == AnimationType.Circle:
+                span = CIRCLE_MINIMUM_SPAN + round((CIRCLE_MAXIMUM_SPAN - CIRCLE_MINIMUM_SPAN) *
+                                                   index / max(1, self.__frame_count - 1))
+                draw_circle(painter, left + stroke_width, stroke_width, width - stroke_width,
+                            0, span, pen)
+
+            # Dots frames cover one loop of the animation
+            else:
+                spacing = math.ceil(width / 3)
+                x_positions = (left + stroke_width, left + stroke_width + spacing, left + stroke_width + spacing * 2)
+                draw_dots(painter, x_positions, stroke_width * 2, frame_offsets[index], brush, stroke_width)
+        painter.end()
+
+        return atlas
+
+    def getAtlas(self, animation_type: AnimationType, width: int, stroke_width: int,
+                 color: QColor, device_pixel_ratio: float) -> QPixmap:
+        """Get the atlas for the given animation settings, rendering it if necessary
+
+        :param animation_type: animation type
+        :param width: animation width
+        :param stroke_width: animation stroke width
+        :param color: animation color
+        :param device_pixel_ratio: device pixel ratio of the target
+        :return: atlas containing all frames next to each other
+        """
+
+        key = (animation_type, width, stroke_width, color.rgba(), device_pixel_ratio)
+        atlas = self.__atlases.get(key)
+
+        if atlas is None:
+            atlas = self.__render_atlas(animation_type, width, stroke_width, color, device_pixel_ratio)
+            self.__atlases[key] = atlas
+            while len(self.__atlases) > self.__maximum_size:
+                self.__atlases.popitem(last=False)
+        else:
+            self.__atlases.move_to_end(key)
+
+        return atlas
+
+    def drawFrame(self, painter: QPainter, target: QRectF, animation_type: AnimationType, width: int,
+                  stroke_width: int, color: QColor, device_pixel_ratio: float, index: int):
+        """Draw a single cached frame
+
+        :param painter: painter to draw with
+        :param target: rect the frame gets drawn into
+        :param animation_type: animation type
+        :param width: animation width
+        :param stroke_width: animation stroke width
+        :param color: animation color
+        :param device_pixel_ratio: device pixel ratio of the target
+        :param index: frame index
+        """
+
+        atlas = self.getAtlas(animation_type, width, stroke_width, color, device_pixel_ratio)
+        frame_size = FrameCache.getFrameSize(animation_type, width, stroke_width)
+        source = QRectF(int(frame_size.width() * index) * device_pixel_ratio, 0,
+                        frame_size.width() * device_pixel_ratio, frame_size.height() * device_pixel_ratio)
+        painter.drawPixmap(target, atlas, source)
+
+    def getSize(self) -> int:
+        """Get the number of atlases currently in the cache
+
+        :return: number of cached atlases
+        """
+
+        return len(self.__atlases)
+
+    def clear(self):
+        """Remove all atlases from the cache"""
+
+        self.__atlases.clear()
+
+    def getMaximumSize(self) -> int:
+        """Get the maximum number of atlases kept in the cache
+
+        :return: maximum number of cached atlases
+        """
+
+        return self.__maximum_size
+
+    def setMaximumSize(self, maximum_size: int):
+        """Set the maximum number of atlases kept in the cache.
+        Evicts the least recently used atlases if necessary.
+
+        :param maximum_size: new maximum number of cached atlases
+        """
+
+        self.__maximum_size = maximum_size
+        while len(self.__atlases) > self.__maximum_size:
+            self.__atlases.popitem(last=False)
+
+    def getFrameCount(self) -> int:
+        """Get the number of frames rendered per atlas
+
+        :return: number of frames per atlas
+        """
+
+        return self.__frame_count
+
+    def setFrameCount(self, frame_count: int):
+        """Set the number of frames rendered per atlas.
+        Clears the cache since all atlases have to be rendered again.
+
+        :param frame_count: new number of frames per atlas
+        """
+
+        self.__frame_count = max(1, frame_count)
+        self.clear()
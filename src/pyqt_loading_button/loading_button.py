@@ -1,16 +1,37 @@
 import math
-from qtpy.QtCore import QTimeLine, QEasingCurve, Qt, Signal
-from qtpy.QtGui import QPainter, QPen, QColor
-from qtpy.QtWidgets import QPushButton
+import time
+from qtpy.QtCore import QEasingCurve, QRect, QRectF, QThreadPool, QTimer, Qt, Signal
+from qtpy.QtGui import QPainter, QColor, QPixmap, QBrush
+from qtpy.QtWidgets import QPushButton, QStyle, QStyleOptionButton
+from .execution_mode import ExecutionMode
 from .worker import Worker
+from .animation import (CIRCLE_MINIMUM_SPAN, CIRCLE_MAXIMUM_SPAN, CIRCLE_SPAN_SPEED_COEFFICIENT,
+                        DOTS_SPEED_COEFFICIENT, circle_frame, dots_offsets)
+from .painting import create_circle_pen, draw_circle, draw_dots, get_circle_geometry, get_dots_geometry
+from .frame_cache import FrameCache
+from .action_cache import ActionCache
+from .pipeline import Pipeline
+from .retry_policy import RetryPolicy
+from .animation_clock import AnimationClock
 from .animation_type import AnimationType
+from .click_policy import ClickPolicy
+from .stats import LoadingButtonStats
 
 
 class LoadingButton(QPushButton):
 
-    # Event
+    # Events
+    result = Signal(object)
+    error = Signal(Exception)
+    cancelled = Signal()
+    progress = Signal(float)
+    timeout = Signal()
+    retrying = Signal(int, int)
     finished = Signal()
 
+    # Timeout of all buttons without a timeout of their own (in ms, 0 for no timeout)
+    __default_timeout = 0
+
     def __init__(self, parent=None):
         """Create a new LoadingButton instance
 
@@ -23,6 +44,34 @@ class LoadingButton(QPushButton):
         self.__text = ''
         self.__action = None
         self.__running = False
+        self.__thread_pool = None
+        self.__execution_mode = ExecutionMode.Thread
+        self.__group = None
+        self.__waiting = False
+        self.__action_cache = None
+        self.__cache_key = None
+        self.__pipeline = None
+        self.__previous_tips = None
+        self.__revalidation_workers = set()
+        self.__progress = None
+
+        # Timeout settings
+        self.__timeout = 0
+        self.__watchdog_timer = None
+        self.__retry_timer = None
+
+        # Retry settings
+        self.__retry_policy = None
+        self.__attempt = 1
+        self.__retry_error = None
+
+        # Click policy settings
+        self.__click_policy = ClickPolicy.Drop
+        self.__click_queue_depth = 1
+        self.__click_interval = 300
+        self.__queued_clicks = 0
+        self.__last_click_time = None
+        self.__debounce_timer = None
 
         # Animation settings
         self.__animation_type = AnimationType.Circle
@@ -32,220 +81,607 @@ class LoadingButton(QPushButton):
         self.__animation_color = QColor(0, 0, 0)
 
         # Animation settings (Circle)
-        self.__circle_speed_coefficient = 0.35
+        self.__circle_speed_coefficient = CIRCLE_SPAN_SPEED_COEFFICIENT
         self.__circle_span_speed = int(self.__animation_speed * self.__circle_speed_coefficient)
-        self.__circle_minimum_span = 30
-        self.__circle_maximum_span = 280
+        self.__circle_minimum_span = CIRCLE_MINIMUM_SPAN
+        self.__circle_maximum_span = CIRCLE_MAXIMUM_SPAN
+        self.__circle_easing_curve = QEasingCurve.Type.InOutCubic
+        self.__circle_rotation = 0
         self.__circle_span = self.__circle_maximum_span
-        self.__circle_additional_rotation = 0
-        self.__circle_previous_additional_rotation = 0
 
         # Animation settings (Dots)
-        self.__dots_speed_coefficient = 0.3
+        self.__dots_speed_coefficient = DOTS_SPEED_COEFFICIENT
         self.__dots_single_speed = int(self.__animation_speed * self.__dots_speed_coefficient)
         self.__dots_easing_curve = QEasingCurve.Type.InOutSine
+        self.__dots_handoff_threshold = 0.75
         self.__dots_offset_1 = 0
         self.__dots_offset_2 = 0
         self.__dots_offset_3 = 0
+        self.__dots_frame_index = 0
+
+        # Clock time at which the animation started, every frame is computed from the time elapsed since
+        self.__animation_start_time = 0
+
+        # Whether the animation changed since the last frame and whether it is suspended
+        self.__dirty = False
+        self.__animation_suspended = False
+
+        # Frame rate and quality settings (paint time and lag thresholds in ms)
+        self.__maximum_frame_rate = 0
+        self.__last_frame_time = 0
+        self.__adaptive_quality_enabled = False
+        self.__adaptive_paint_time_threshold = 4.0
+        self.__adaptive_lag_threshold = 20.0
+        self.__reduced_quality = False
+        self.__paint_time = 0.0
 
-        # Animation timelines (Circle)
-        self.__timeline_circle_rotation = QTimeLine(self.__animation_speed, self)
-        self.__timeline_circle_rotation.setFrameRange(360, 0)
-        self.__timeline_circle_rotation.setLoopCount(0)
-        self.__timeline_circle_rotation.setEasingCurve(QEasingCurve.Type.Linear)
-        self.__timeline_circle_rotation.frameChanged.connect(self.update)
-
-        self.__timeline_circle_decrease_span = QTimeLine(self.__circle_span_speed, self)
-        self.__timeline_circle_decrease_span.setFrameRange(self.__circle_maximum_span, self.__circle_minimum_span)
-        self.__timeline_circle_decrease_span.setEasingCurve(QEasingCurve.Type.InOutCubic)
-        self.__timeline_circle_decrease_span.frameChanged.connect(self.__handle_timeline_circle_decrease_span)
-        self.__timeline_circle_decrease_span.finished.connect(self.__handle_timeline_circle_increase_span_start)
-
-        self.__timeline_circle_increase_span = QTimeLine(self.__circle_span_speed, self)
-        self.__timeline_circle_increase_span.setFrameRange(self.__circle_minimum_span, self.__circle_maximum_span)
-        self.__timeline_circle_increase_span.setEasingCurve(QEasingCurve.Type.InOutCubic)
-        self.__timeline_circle_increase_span.frameChanged.connect(self.__handle_timeline_circle_increase_span)
-        self.__timeline_circle_increase_span.finished.connect(self.__timeline_circle_decrease_span.start)
-
-        # Animation timelines (Dots)
-        self.__timeline_dots_up_1 = QTimeLine(self.__dots_single_speed, self)
-        self.__timeline_dots_up_1.setFrameRange(0, self.__animation_stroke_width)
-        self.__timeline_dots_up_1.setEasingCurve(self.__dots_easing_curve)
-        self.__timeline_dots_up_1.frameChanged.connect(self.__handle_timeline_dots_up_1)
-
-        self.__timeline_dots_down_1 = QTimeLine(self.__dots_single_speed, self)
-        self.__timeline_dots_down_1.setFrameRange(self.__animation_stroke_width, 0)
-        self.__timeline_dots_down_1.setEasingCurve(self.__dots_easing_curve)
-        self.__timeline_dots_down_1.frameChanged.connect(self.__handle_timeline_dots_down_1)
-        self.__timeline_dots_up_1.finished.connect(self.__timeline_dots_down_1.start)
-
-        self.__timeline_dots_up_2 = QTimeLine(self.__dots_single_speed, self)
-        self.__timeline_dots_up_2.setFrameRange(0, self.__animation_stroke_width)
-        self.__timeline_dots_up_2.setEasingCurve(self.__dots_easing_curve)
-        self.__timeline_dots_up_2.frameChanged.connect(self.__handle_timeline_dots_up_2)
-
-        self.__timeline_dots_down_2 = QTimeLine(self.__dots_single_speed, self)
-        self.__timeline_dots_down_2.setFrameRange(self.__animation_stroke_width, 0)
-        self.__timeline_dots_down_2.setEasingCurve(self.__dots_easing_curve)
-        self.__timeline_dots_down_2.frameChanged.connect(self.__handle_timeline_dots_down_2)
-        self.__timeline_dots_up_2.finished.connect(self.__timeline_dots_down_2.start)
-
-        self.__timeline_dots_up_3 = QTimeLine(self.__dots_single_speed, self)
-        self.__timeline_dots_up_3.setFrameRange(0, self.__animation_stroke_width)
-        self.__timeline_dots_up_3.setEasingCurve(self.__dots_easing_curve)
-        self.__timeline_dots_up_3.frameChanged.connect(self.__handle_timeline_dots_up_3)
-
-        self.__timeline_dots_down_3 = QTimeLine(self.__dots_single_speed, self)
-        self.__timeline_dots_down_3.setFrameRange(self.__animation_stroke_width, 0)
-        self.__timeline_dots_down_3.setEasingCurve(self.__dots_easing_curve)
-        self.__timeline_dots_down_3.frameChanged.connect(self.__handle_timeline_dots_down_3)
-        self.__timeline_dots_down_3.finished.connect(self.__timeline_dots_up_1.start)
-        self.__timeline_dots_up_3.finished.connect(self.__timeline_dots_down_3.start)
+        # Paint and action stats, None unless instrumentation is enabled
+        self.__stats = None
+
+        # Whether pre-rendered frames from the shared FrameCache are drawn
+        self.__frame_cache_enabled = False
+
+        # Button background without text, rendered once per state change while running
+        self.__background_cache = None
+
+        # Geometry, pen and brush of the animation, computed once per size and animation setting
+        self.__geometry_valid = False
 
         # Execute __start_action() every time the button is clicked
         self.clicked.connect(self.__start_action)
 
     def __start_action(self):
         """Handles the button being clicked.
-        Executes the connected method if not running already and starts the animation."""
-
-        if self.__action and not self.__running:
-            self.__running = True
-            super().setText('')
-            self.worker = Worker(self.__action)
-            self.worker.finished.connect(self.__end_action)
-            self.worker.start()
-            self.__timeline_circle_rotation.start()
-            self.__timeline_circle_decrease_span.start()
-            self.__timeline_dots_up_1.start()
-            self.update()
+        Executes the connected method according to the click policy and starts the animation."""
+
+        if not self.__action:
+            return
+
+        if self.__click_policy == ClickPolicy.Debounce:
+            if self.__debounce_timer is None:
+                self.__debounce_timer = QTimer(self)
+                self.__debounce_timer.setSingleShot(True)
+                self.__debounce_timer.timeout.connect(self.__handle_debounce_timeout)
+            self.__debounce_timer.start(self.__click_interval)
+            return
+
+        if self.__running:
+            if self.__click_policy == ClickPolicy.QueueLatest:
+                self.__queued_clicks = 1
+            elif self.__click_policy == ClickPolicy.QueueAll:
+                self.__queued_clicks = min(self.__queued_clicks + 1, self.__click_queue_depth)
+            return
+
+        if self.__click_policy == ClickPolicy.Throttle:
+            now = time.monotonic()
+            if self.__last_click_time is not None and (now - self.__last_click_time) * 1000 < self.__click_interval:
+                return
+            self.__last_click_time = now
+
+        self.__run_action()
+
+    def __handle_debounce_timeout(self):
+        """Executes the connected method once no click happened for the click interval.
+        If the action is still running, it gets executed once more after the current run."""
+
+        if not self.__action:
+            return
+        if self.__running:
+            self.__queued_clicks = 1
+        else:
+            self.__run_action()
+
+    def __run_action(self):
+        """Starts the animation and executes the connected method.
+        Cached results complete the action right away instead."""
+
+        if self.__action_cache is not None:
+            self.__cache_key = self.__action_cache.getKey(self.__action)
+            if self.__complete_from_cache():
+                self.finished.emit()
+                return
+
+        self.__running = True
+        self.__attempt = 1
+        self.__retry_error = None
+        super().setText('')
+        self.__animation_start_time = AnimationClock.instance().getTime()
+        self.__circle_rotation = 0
+        self.__circle_span = self.__circle_maximum_span
+        self.__dots_offset_1 = self.__dots_offset_2 = self.__dots_offset_3 = 0
+        self.__animation_suspended = True
+        if self.isVisible():
+            self.__resume_animation()
+        self.__start_worker()
+        self.update()
+
+    def __complete_from_cache(self) -> bool:
+        """Emits the cached result of the action without starting a worker.
+        Stale results get refreshed in the background.
+
+        :return: whether a cached result was found
+        """
+
+        found, result, stale = self.__action_cache.get(self.__cache_key)
+        if not found:
+            return False
+
+        if stale and self.__action_cache.startRevalidation(self.__cache_key):
+            self.__revalidate(self.__action_cache, self.__cache_key)
+        self.result.emit(result)
+        return True
+
+    def __revalidate(self, action_cache: ActionCache, key: object):
+        """Executes the action in the background to refresh a stale cached result
+
+        :param action_cache: cache the result gets stored in
+        :param key: key the result gets stored under
+        """
+
+        worker = Worker(self.__action, self.__thread_pool, self.__execution_mode)
+        worker.result.connect(lambda result: action_cache.set(key, result))
+        worker.finished.connect(lambda: self.__handle_revalidation_finished(worker, action_cache, key))
+        self.__revalidation_workers.add(worker)
+        worker.start()
+
+    def __handle_revalidation_finished(self, worker: Worker, action_cache: ActionCache, key: object):
+        """Handles a background refresh finishing, no matter whether it succeeded or failed
+
+        :param worker: worker of the refresh
+        :param action_cache: cache the result got stored in
+        :param key: key the result got stored under
+        """
+
+        self.__revalidation_workers.discard(worker)
+        action_cache.finishRevalidation(key)
+
+    def __start_worker(self):
+        """Executes the connected method in a new worker.
+        Buttons of a group wait for a free slot of the group first."""
+
+        self.__progress = None
+        if self.__group is not None:
+            self.__waiting = True
+            self.worker = None
+            self.__group.acquire(self, self.__execute)
+        else:
+            self.__execute(self.__action)
+
+    def __execute(self, action: callable):
+        """Executes the given action in a new worker
+
+        :param action: the button's action or the action of a batch the button is part of
+        """
+
+        self.__waiting = False
+        self.worker = Worker(action, self.__thread_pool, self.__execution_mode)
+        self.worker.result.connect(self.__handle_worker_result)
+        self.worker.error.connect(self.__handle_worker_error)
+        self.worker.progress.connect(self.__handle_worker_progress)
+        self.worker.finished.connect(self.__handle_worker_finished)
+        self.worker.start()
+
+        timeout = self.getEffectiveTimeout()
+        if timeout > 0:
+            if self.__watchdog_timer is None:
+                self.__watchdog_timer = QTimer(self)
+                self.__watchdog_timer.setSingleShot(True)
+                self.__watchdog_timer.timeout.connect(self.__handle_watchdog_timeout)
+            self.__watchdog_timer.start(timeout)
+
+    def __stop_timers(self):
+        """Stops the watchdog and a pending retry"""
+
+        if self.__watchdog_timer is not None:
+            self.__watchdog_timer.stop()
+        if self.__retry_timer is not None:
+            self.__retry_timer.stop()
+
+    def __handle_watchdog_timeout(self):
+        """Abandons an action that exceeded the timeout and retries it if the retry policy retries TimeoutError"""
+
+        if not self.__running or self.worker is None:
+            return
+
+        # The stuck worker no longer counts against the concurrency of the pool and the group.
+        # It gets detached first, since actions still queued in the pool report being cancelled right away
+        worker, self.worker = self.worker, None
+        worker.abandon()
+        if self.__group is not None:
+            self.__group.release(self)
+        self.timeout.emit()
+
+        if self.__retry_policy is not None and self.__retry_policy.shouldRetry(self.__attempt, TimeoutError()):
+            self.__retry()
+        else:
+            self.__queued_clicks = 0
+            self.__end_action()
+
+    def __retry(self):
+        """Executes the action again once the delay of the retry policy passed.
+        The animation keeps running in the meantime and no thread is blocked while waiting."""
+
+        delay = self.__retry_policy.getDelay(self.__attempt)
+        self.__attempt += 1
+        self.retrying.emit(self.__attempt, delay)
+
+        if self.__retry_timer is None:
+            self.__retry_timer = QTimer(self)
+            self.__retry_timer.setSingleShot(True)
+            self.__retry_timer.timeout.connect(self.__start_worker)
+        self.__retry_timer.start(delay)
+
+    def __is_current_worker(self) -> bool:
+        """Get whether the sender of the current signal is the worker of the running action.
+        Signals of cancelled workers may still arrive after a new action got started.
+
+        :return: whether the sender is the current worker
+        """
+
+        return self.__running and self.sender() is self.worker
+
+    def __handle_worker_result(self, result: object):
+        """Handles the worker returning a result
+
+        :param result: return value of the action
+        """
+
+        if self.__is_current_worker():
+            if self.__action_cache is not None:
+                self.__action_cache.set(self.__cache_key, result)
+            self.result.emit(result)
+
+    def __handle_worker_error(self, error: Exception):
+        """Handles the action raising an exception
+
+        :param error: exception raised by the action
+        """
+
+        if not self.__is_current_worker():
+            return
+
+        # Retried errors are only emitted if the last attempt fails as well
+        if self.__retry_policy is not None and self.__retry_policy.shouldRetry(self.__attempt, error):
+            self.__retry_error = error
+        else:
+            self.error.emit(error)
+
+    def __handle_worker_progress(self, value: float):
+        """Handles the action reporting its progress.
+        The determinate arc gets repainted with the next frame.
+
+        :param value: progress between 0 and 1
+        """
+
+        if self.__is_current_worker():
+            self.__progress = min(1.0, max(0.0, value))
+            self.__dirty = True
+            self.progress.emit(self.__progress)
+
+    def __handle_worker_finished(self):
+        """Handles the worker finishing, no matter whether it succeeded or failed.
+        Queued clicks are executed right away without stopping the animation."""
+
+        if not self.__is_current_worker():
+            return
+
+        self.__stop_timers()
+        if self.__stats is not None and self.worker.getActionTime() is not None:
+            self.__stats.recordAction(self.worker.getQueueWaitTime(), self.worker.getActionTime())
+
+        if self.__group is not None:
+            self.__group.release(self)
+
+        if self.__retry_error is not None:
+            self.__retry_error = None
+            self.worker = None
+            self.__retry()
+        elif self.__queued_clicks > 0:
+            self.__run_queued_click()
+        else:
+            self.__end_action()
+
+    def __run_queued_click(self):
+        """Executes the next queued click without stopping the animation.
+        Clicks with a cached result complete right away, the animation stops once no click is left."""
+
+        while self.__queued_clicks > 0:
+            self.__queued_clicks -= 1
+            self.__attempt = 1
+            self.finished.emit()
+            if self.__action_cache is not None:
+                self.__cache_key = self.__action_cache.getKey(self.__action)
+                if self.__complete_from_cache():
+                    continue
+            self.__start_worker()
+            return
+        self.__end_action()
+
+    def __handle_stage_changed(self, index: int, name: str):
+        """Shows the current stage of a pipeline as tool and status tip
+
+        :param index: index of the stage
+        :param name: name of the stage
+        """
+
+        if not self.__running:
+            return
+        if self.__previous_tips is None:
+            self.__previous_tips = (self.toolTip(), self.statusTip())
+        self.setToolTip(name)
+        self.setStatusTip(name)
 
     def __end_action(self):
         """Called once the executed method is finished.
         Handles stopping the animation and showing text again."""
 
         super().setText(self.__text)
+        self.__stop_timers()
 
-        self.__timeline_circle_rotation.stop()
-        self.__timeline_circle_decrease_span.stop()
-        self.__timeline_circle_increase_span.stop()
+        if self.__previous_tips is not None:
+            self.setToolTip(self.__previous_tips[0])
+            self.setStatusTip(self.__previous_tips[1])
+            self.__previous_tips = None
 
-        self.__timeline_dots_up_1.stop()
-        self.__timeline_dots_down_1.stop()
-        self.__timeline_dots_up_2.stop()
-        self.__timeline_dots_down_2.stop()
-        self.__timeline_dots_up_3.stop()
-        self.__timeline_dots_down_3.stop()
+        AnimationClock.instance().unsubscribe(self.__advance_animation)
+        self.__animation_suspended = False
 
         self.__running = False
         self.finished.emit()
         self.update()
 
-    def __handle_timeline_circle_decrease_span(self):
-        """Handles timeline for decreasing the circle span"""
+    def __suspend_animation(self):
+        """Stops advancing the animation while nobody can see it.
+        The action keeps running in the meantime."""
 
-        self.__circle_span = self.__timeline_circle_decrease_span.currentFrame()
-        self.update()
+        AnimationClock.instance().unsubscribe(self.__advance_animation)
+        self.__animation_suspended = True
 
-    def __handle_timeline_circle_increase_span(self):
-        """Handles timeline for increasing the circle span"""
+    def __resume_animation(self):
+        """Continues advancing the animation.
+        Frames only depend on the time elapsed since the animation started,
+        so the animation continues where it would be if it had been running all along."""
 
-        self.__circle_span = self.__timeline_circle_increase_span.currentFrame()
-        self.__circle_additional_rotation = self.__timeline_circle_increase_span.currentFrame() - self.__circle_minimum_span
-        self.update()
+        self.__animation_suspended = False
+        AnimationClock.instance().subscribe(self.__advance_animation)
 
-    def __handle_timeline_circle_increase_span_start(self):
-        """Handles starting the timeline for increasing the circle span"""
+    def resizeEvent(self, event):
+        """Recomputes the geometry of the animation once the button got resized
 
-        self.__circle_previous_additional_rotation = (self.__circle_previous_additional_rotation +
-                                                      self.__circle_additional_rotation) % 360
-        self.__timeline_circle_increase_span.start()
+        :param event: event sent by PyQt
+        """
 
-    def __handle_timeline_dots_up_1(self, value):
-        """Handles timeline for moving the first dot upwards"""
+        super().resizeEvent(event)
+        self.__invalidate_geometry()
 
-        self.__dots_offset_1 = self.__timeline_dots_up_1.currentFrame()
-        if value > 0.75 and self.__timeline_dots_up_2.state() == QTimeLine.State.NotRunning:
-            self.__timeline_dots_up_2.start()
-        self.update()
+    def showEvent(self, event):
+        """Resumes the animation once the button gets shown again
 
-    def __handle_timeline_dots_down_1(self):
-        """Handles timeline for moving the first dot downwards"""
+        :param event: event sent by PyQt
+        """
 
-        self.__dots_offset_1 = self.__timeline_dots_down_1.currentFrame()
-        self.update()
+        super().showEvent(event)
 
-    def __handle_timeline_dots_up_2(self, value):
-        """Handles timeline for moving the second dot upwards"""
+        if self.__running and self.__animation_suspended:
+            self.__resume_animation()
 
-        self.__dots_offset_2 = self.__timeline_dots_up_2.currentFrame()
-        if value > 0.75 and self.__timeline_dots_up_3.state() == QTimeLine.State.NotRunning:
-            self.__timeline_dots_up_3.start()
-        self.update()
+    def hideEvent(self, event):
+        """Suspends the animation while the button is hidden or its window is minimized
 
-    def __handle_timeline_dots_down_2(self):
-        """Handles timeline for moving the second dot downwards"""
+        :param event: event sent by PyQt
+        """
 
-        self.__dots_offset_2 = self.__timeline_dots_down_2.currentFrame()
-        self.update()
+        super().hideEvent(event)
 
-    def __handle_timeline_dots_up_3(self):
-        """Handles timeline for moving the third dot upwards"""
+        if self.__running and not self.__animation_suspended:
+            self.__suspend_animation()
 
-        self.__dots_offset_3 = self.__timeline_dots_up_3.currentFrame()
-        self.update()
+    def __advance_animation(self, time: int):
+        """Advances the animation to the given clock time.
+        Schedules at most one repaint per frame.
 
-    def __handle_timeline_dots_down_3(self):
-        """Handles timeline for moving the third dot downwards"""
+        :param time: current clock time (in ms)
+        """
 
-        self.__dots_offset_3 = self.__timeline_dots_down_3.currentFrame()
-        self.update()
+        if self.__adaptive_quality_enabled:
+            self.__update_quality()
 
-    def paintEvent(self, event):
-        """Method that gets called every time the widget needs to be updated.
+        # Skip frames exceeding the maximum frame rate, the animation depends on the time only
+        clock_frame_rate = AnimationClock.instance().getFrameRate()
+        frame_rate = self.__maximum_frame_rate
+        if self.__reduced_quality:
+            frame_rate = (frame_rate or clock_frame_rate) / 2
+        if frame_rate and time - self.__last_frame_time < 1000 / frame_rate - 500 / clock_frame_rate:
+            return
+        self.__last_frame_time = time
 
-        :param event: event sent by PyQt
+        if self.__animation_type == AnimationType.Dots:
+            self.__advance_dots(time)
+
+        # The determinate arc only changes when new progress gets reported
+        elif self.__progress is None:
+            self.__advance_circle(time)
+
+        # Skip repaints while the button is covered or scrolled out of view
+        if self.__dirty and not self.visibleRegion().isEmpty():
+            self.__dirty = False
+            self.update(self.__get_animation_rect())
+            if self.__stats is not None:
+                self.__stats.recordRepaintRequest()
+
+    def __update_quality(self):
+        """Reduces the quality while painting takes too long or the event loop lags behind
+        and restores it once both dropped well below their thresholds again"""
+
+        lag = AnimationClock.instance().getLag()
+
+        if not self.__reduced_quality:
+            if self.__paint_time > self.__adaptive_paint_time_threshold or lag > self.__adaptive_lag_threshold:
+                self.__reduced_quality = True
+        elif self.__paint_time < self.__adaptive_paint_time_threshold / 2 and lag < self.__adaptive_lag_threshold / 2:
+            self.__reduced_quality = False
+
+    def __advance_dots(self, time: int):
+        """Computes the offsets of all three dots for the given clock time
+
+        :param time: current clock time (in ms)
         """
 
-        super().paintEvent(event)
+        elapsed = time - self.__animation_start_time
 
-        # Handle circle
-        if self.__running and self.__animation_type == AnimationType.Circle:
+        if self.__frame_cache_enabled:
+            index = FrameCache.instance().getDotsFrameIndex(elapsed, self.__dots_single_speed)
+            if index != self.__dots_frame_index:
+                self.__dots_frame_index = index
+                self.__dirty = True
+            return
 
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            painter.setPen(QPen(self.__animation_color, self.__animation_stroke_width,
-                                Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
+        offsets = dots_offsets(elapsed, self.__dots_single_speed, self.__animation_stroke_width,
+                               self.__dots_easing_curve, self.__dots_handoff_threshold,
+                               AnimationClock.instance().getFrameRate())
+        if offsets != (self.__dots_offset_1, self.__dots_offset_2, self.__dots_offset_3):
+            self.__dots_offset_1, self.__dots_offset_2, self.__dots_offset_3 = offsets
+            self.__dirty = True
 
-            diameter = self.__animation_width - self.__animation_stroke_width
-            x = math.floor((self.width() - diameter) / 2)
-            y = math.ceil((self.height() - diameter) / 2)
-            rotation = (self.__timeline_circle_rotation.currentFrame() -
-                        self.__circle_additional_rotation -
-                        self.__circle_previous_additional_rotation) % 360 * 16
-            span = self.__circle_span * 16
+    def __advance_circle(self, time: int):
+        """Computes the rotation and span of the circle for the given clock time
 
-            painter.drawArc(x, y, diameter, diameter, rotation, span)
+        :param time: current clock time (in ms)
+        """
 
-        # Handle dots
-        elif self.__running and self.__animation_type == AnimationType.Dots:
+        self.__circle_rotation, self.__circle_span = circle_frame(
+            time - self.__animation_start_time, self.__animation_speed, self.__circle_span_speed,
+            self.__circle_minimum_span, self.__circle_maximum_span, self.__circle_easing_curve,
+            AnimationClock.instance().getFrameRate())
+        self.__dirty = True
+
+    def __update_geometry(self):
+        """Computes the geometry, pen and brush of the animation for the current size and settings"""
+
+        stroke_width = self.__animation_stroke_width
+        self.__circle_geometry = get_circle_geometry(self.rect(), self.__animation_width, stroke_width)
+        self.__dots_geometry = get_dots_geometry(self.rect(), self.__animation_width, stroke_width)
+        x, y, diameter = self.__circle_geometry
+        x_dot_1, x_dot_2, x_dot_3, y_dots = self.__dots_geometry
+
+        # Areas that change between two frames, leaving room for the pen and antialiasing
+        self.__circle_rect = QRect(x, y, diameter, diameter).adjusted(
+            -stroke_width, -stroke_width, stroke_width, stroke_width)
+        self.__dots_rect = QRect(x_dot_1, y_dots - stroke_width, x_dot_3 - x_dot_1 + stroke_width,
+                                 stroke_width * 2).adjusted(-stroke_width, -stroke_width, stroke_width, stroke_width)
+
+        # Targets of the pre-rendered frames, the circle frame is centered on the origin to be rotated
+        side = diameter + stroke_width * 2
+        self.__circle_center = (x + diameter / 2, y + diameter / 2)
+        self.__circle_frame_rect = QRectF(-side / 2, -side / 2, side, side)
+        frame_size = FrameCache.getFrameSize(AnimationType.Dots, self.__animation_width, stroke_width)
+        self.__dots_frame_rect = QRectF(x_dot_1 - stroke_width, y_dots - stroke_width * 2,
+                                        frame_size.width(), frame_size.height())
+
+        self.__circle_pen = create_circle_pen(self.__animation_color, stroke_width)
+        self.__dots_brush = QBrush(self.__animation_color)
+        self.__geometry_valid = True
+
+    def __invalidate_geometry(self):
+        """Recomputes the geometry, pen and brush of the animation before the next frame"""
 
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            painter.setBrush(self.__animation_color)
+        self.__geometry_valid = False
 
-            true_width = math.ceil(self.__animation_width / 3) * 2 + self.__animation_stroke_width
-            x_dot_1 = math.ceil((self.width() - true_width) / 2)
-            x_dot_2 = x_dot_1 + math.ceil(self.__animation_width / 3)
-            x_dot_3 = x_dot_2 + math.ceil(self.__animation_width / 3)
-            y = math.ceil((self.height() - self.__animation_stroke_width) / 2)
+    def __get_animation_rect(self) -> QRect:
+        """Get the area that changes between two frames of the animation
 
-            painter.drawEllipse(x_dot_1, y - self.__dots_offset_1,
-                                self.__animation_stroke_width, self.__animation_stroke_width)
-            painter.drawEllipse(x_dot_2, y - self.__dots_offset_2,
-                                self.__animation_stroke_width, self.__animation_stroke_width)
-            painter.drawEllipse(x_dot_3, y - self.__dots_offset_3,
-                                self.__animation_stroke_width, self.__animation_stroke_width)
+        :return: bounding rect of the animation
+        """
+
+        if not self.__geometry_valid:
+            self.__update_geometry()
+        return self.__circle_rect if self.__animation_type == AnimationType.Circle else self.__dots_rect
+
+    def __render_background(self):
+        """Renders the button without text into the background cache"""
+
+        device_pixel_ratio = self.devicePixelRatioF()
+        self.__background_cache = QPixmap(math.ceil(self.width() * device_pixel_ratio),
+                                          math.ceil(self.height() * device_pixel_ratio))
+        self.__background_cache.setDevicePixelRatio(device_pixel_ratio)
+        self.__background_cache.fill(Qt.GlobalColor.transparent)
+
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        painter = QPainter(self.__background_cache)
+        self.style().drawControl(QStyle.ControlElement.CE_PushButton, option, painter, self)
+        painter.end()
+
+    def paintEvent(self, event):
+        """Method that gets called every time the widget needs to be updated.
+
+        :param event: event sent by PyQt
+        """
+
+        if not self.__running:
+            self.__background_cache = None
+            super().paintEvent(event)
+            return
+
+        # Repaints of the whole button come from state changes (hover, press, resize, style, ...)
+        # and refresh the cached background, animation frames only repaint the animation rect
+        if self.__background_cache is None or event.rect().contains(self.rect()):
+            self.__render_background()
+
+        if self.__adaptive_quality_enabled or self.__stats is not None:
+            start = time.perf_counter()
+            self.__paint_animation()
+            paint_time = (time.perf_counter() - start) * 1000
+            self.__paint_time = self.__paint_time * 0.9 + paint_time * 0.1
+            if self.__stats is not None:
+                self.__stats.recordPaint(paint_time)
+        else:
+            self.__paint_animation()
+
+    def __paint_animation(self):
+        """Paints the cached background and the current frame of the animation"""
+
+        if not self.__geometry_valid:
+            self.__update_geometry()
+
+        antialiasing = not self.__reduced_quality
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.__background_cache)
+
+        # Handle circle
+        if self.__animation_type == AnimationType.Circle:
+
+            x, y, diameter = self.__circle_geometry
+
+            # Determinate arc growing clockwise from the top
+            if self.__progress is not None:
+                draw_circle(painter, x, y, diameter, 90, -360 * self.__progress, self.__circle_pen, antialiasing)
+            elif self.__frame_cache_enabled:
+                frame_cache = FrameCache.instance()
+                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, antialiasing)
+                painter.translate(*self.__circle_center)
+                painter.rotate(-self.__circle_rotation)
+                frame_cache.drawFrame(painter, self.__circle_frame_rect, self.__animation_type,
+                                      self.__animation_width, self.__animation_stroke_width,
+                                      self.__animation_color, self.devicePixelRatioF(),
+                                      frame_cache.getCircleFrameIndex(self.__circle_span))
+            else:
+                draw_circle(painter, x, y, diameter, self.__circle_rotation, self.__circle_span,
+                            self.__circle_pen, antialiasing)
+
+        # Handle dots
+        elif self.__animation_type == AnimationType.Dots:
+
+            if self.__frame_cache_enabled:
+                FrameCache.instance().drawFrame(painter, self.__dots_frame_rect, self.__animation_type,
+                                                self.__animation_width, self.__animation_stroke_width,
+                                                self.__animation_color, self.devicePixelRatioF(),
+                                                self.__dots_frame_index)
+            else:
+                x_dot_1, x_dot_2, x_dot_3, y = self.__dots_geometry
+                draw_dots(painter, (x_dot_1, x_dot_2, x_dot_3), y,
+                          (self.__dots_offset_1, self.__dots_offset_2, self.__dots_offset_3),
+                          self.__dots_brush, self.__animation_stroke_width, antialiasing)
 
     def text(self) -> str:
         """Get the current button text
@@ -265,13 +701,228 @@ class LoadingButton(QPushButton):
         if not self.__running:
             super().setText(self.__text)
 
-    def setAction(self, action: callable):
-        """Set the action to be executed on button press
+    def getAction(self) -> callable:
+        """Get the action executed on button press
+
+        :return: action executed on button press
+        """
+
+        return self.__action
+
+    def setAction(self, action: callable, cache: ActionCache = None):
+        """Set the action to be executed on button press.
+        With a cache, clicks while a result is cached complete right away without executing the action.
 
         :param action: new action to be executed on button press
+        :param cache: cache storing the results of the action (None to disable caching)
         """
 
         self.__action = action
+        self.__action_cache = cache
+
+        # Pipelines show their current stage as tool and status tip while running
+        if self.__pipeline is not None:
+            self.__pipeline.stageChanged.disconnect(self.__handle_stage_changed)
+        self.__pipeline = action if isinstance(action, Pipeline) else None
+        if self.__pipeline is not None:
+            self.__pipeline.stageChanged.connect(self.__handle_stage_changed)
+
+    def getActionCache(self) -> ActionCache:
+        """Get the cache storing the results of the action
+
+        :return: action cache (None if caching is disabled)
+        """
+
+        return self.__action_cache
+
+    def getThreadPool(self) -> QThreadPool:
+        """Get the thread pool the action gets executed in
+
+        :return: thread pool
+        """
+
+        return self.__thread_pool if self.__thread_pool is not None else Worker.getDefaultThreadPool()
+
+    def setThreadPool(self, thread_pool: QThreadPool):
+        """Set the thread pool the action gets executed in.
+        If None, the pool shared by all buttons is used.
+
+        :param thread_pool: new thread pool
+        """
+
+        self.__thread_pool = thread_pool
+
+    def getExecutionMode(self) -> ExecutionMode:
+        """Get whether the action gets executed in a thread or a separate process
+
+        :return: execution mode
+        """
+
+        return self.__execution_mode
+
+    def setExecutionMode(self, execution_mode: ExecutionMode):
+        """Set whether the action gets executed in a thread or a separate process.
+        Actions executed in a separate process must be picklable (e.g. module level functions)
+        and keep CPU-bound work from blocking the GUI thread.
+
+        :param execution_mode: new execution mode
+        """
+
+        self.__execution_mode = execution_mode
+
+    def getTimeout(self) -> int:
+        """Get the time after which a running action gets abandoned
+
+        :return: timeout (in ms, 0 if the default timeout is used)
+        """
+
+        return self.__timeout
+
+    def setTimeout(self, timeout: int):
+        """Set the time after which a running action gets abandoned.
+        Timeout gets emitted and the worker thread no longer counts against the thread pool or the group,
+        while the stuck action is left to finish on its own. The action is retried as a TimeoutError if the
+        retry policy allows it, otherwise the animation stops and finished gets emitted.
+        Actions executed in a separate process keep their process occupied, the process pool created
+        by default gets replaced instead, while a pool set with Worker.setDefaultProcessPool() stays as is.
+
+        :param timeout: new timeout (in ms, 0 to use the default timeout)
+        """
+
+        self.__timeout = max(0, timeout)
+
+    def getEffectiveTimeout(self) -> int:
+        """Get the timeout applied to the action, which is either the button's or the default timeout
+
+        :return: timeout (in ms, 0 for no timeout)
+        """
+
+        return self.__timeout if self.__timeout > 0 else LoadingButton.__default_timeout
+
+    @staticmethod
+    def getDefaultTimeout() -> int:
+        """Get the timeout of all buttons without a timeout of their own
+
+        :return: default timeout (in ms, 0 for no timeout)
+        """
+
+        return LoadingButton.__default_timeout
+
+    @staticmethod
+    def setDefaultTimeout(timeout: int):
+        """Set the timeout of all buttons without a timeout of their own
+
+        :param timeout: new default timeout (in ms, 0 for no timeout)
+        """
+
+        LoadingButton.__default_timeout = max(0, timeout)
+
+    def getRetryPolicy(self) -> RetryPolicy:
+        """Get the policy deciding whether a failed action gets executed again
+
+        :return: retry policy (None if failed actions are not retried)
+        """
+
+        return self.__retry_policy
+
+    def setRetryPolicy(self, retry_policy: RetryPolicy):
+        """Set the policy deciding whether a failed action gets executed again.
+        The animation keeps running across attempts, retrying emits retrying with the number of the
+        next attempt and the delay before it. Actions exceeding the timeout count as failed with a TimeoutError.
+
+        :param retry_policy: new retry policy (None to not retry failed actions)
+        """
+
+        self.__retry_policy = retry_policy
+
+    def cancel(self):
+        """Cancel the action currently being executed.
+        Stops the animation right away and emits cancelled and finished."""
+
+        if not self.__running:
+            return
+
+        self.__queued_clicks = 0
+        if self.__group is not None:
+            self.__group.release(self)
+        self.__waiting = False
+
+        # Queued actions report being cancelled right away, which must not end the action a second time
+        worker, self.worker = self.worker, None
+        if worker is not None:
+            worker.cancel()
+        self.cancelled.emit()
+        self.__end_action()
+
+    def getClickPolicy(self) -> ClickPolicy:
+        """Get the policy for handling clicks
+
+        :return: click policy
+        """
+
+        return self.__click_policy
+
+    def setClickPolicy(self, click_policy: ClickPolicy):
+        """Set the policy for handling clicks.
+        Drop ignores clicks while running, QueueLatest runs the action once more after the
+        current run if clicked in between, QueueAll runs it once more for every click in
+        between (up to the click queue depth), Debounce runs it once no click happened for
+        the click interval (after the current run if still running) and Throttle ignores clicks within the click interval of the last run.
+
+        :param click_policy: new click policy
+        """
+
+        self.__click_policy = click_policy
+        self.__queued_clicks = 0
+
+    def getClickQueueDepth(self) -> int:
+        """Get the maximum number of clicks queued while running (QueueAll only)
+
+        :return: maximum number of queued clicks
+        """
+
+        return self.__click_queue_depth
+
+    def setClickQueueDepth(self, depth: int):
+        """Set the maximum number of clicks queued while running (QueueAll only)
+
+        :param depth: new maximum number of queued clicks
+        """
+
+        self.__click_queue_depth = max(0, depth)
+        self.__queued_clicks = min(self.__queued_clicks, self.__click_queue_depth)
+
+    def getClickInterval(self) -> int:
+        """Get the click interval (in ms) used by Debounce and Throttle
+
+        :return: click interval (in ms)
+        """
+
+        return self.__click_interval
+
+    def setClickInterval(self, interval: int):
+        """Set the click interval (in ms) used by Debounce and Throttle
+
+        :param interval: new click interval (in ms)
+        """
+
+        self.__click_interval = interval
+
+    def getQueuedClickCount(self) -> int:
+        """Get the number of clicks waiting to be executed
+
+        :return: number of queued clicks
+        """
+
+        return self.__queued_clicks
+
+    def getProgress(self) -> float:
+        """Get the progress last reported by the running action
+
+        :return: progress between 0 and 1 (None if no progress was reported)
+        """
+
+        return self.__progress
 
     def isRunning(self) -> bool:
         """Get whether the button's action is currently being executed
@@ -281,6 +932,38 @@ class LoadingButton(QPushButton):
 
         return self.__running
 
+    def isWaiting(self) -> bool:
+        """Get whether the button's action is waiting for a free slot of its group.
+        The animation is already shown while waiting.
+
+        :return: whether the button's action is waiting
+        """
+
+        return self.__waiting
+
+    def getGroup(self) -> 'LoadingButtonGroup':
+        """Get the group limiting how many actions of its buttons are executed at the same time
+
+        :return: group of the button (None if the button is not part of a group)
+        """
+
+        return self.__group
+
+    def setGroup(self, group: 'LoadingButtonGroup'):
+        """Set the group limiting how many actions of its buttons are executed at the same time
+
+        :param group: new group (None to remove the button from its group)
+        """
+
+        if group is self.__group:
+            return
+
+        previous_group, self.__group = self.__group, group
+        if previous_group is not None:
+            previous_group.removeButton(self)
+        if group is not None:
+            group.addButton(self)
+
     def getAnimationType(self) -> AnimationType:
         """Get the current animation type
 
@@ -296,6 +979,7 @@ class LoadingButton(QPushButton):
         """
 
         self.__animation_type = animation_type
+        self.update()
 
     def getAnimationSpeed(self) -> int:
         """Get the current animation speed (in ms)
@@ -311,21 +995,16 @@ class LoadingButton(QPushButton):
         :param speed: new animation speed (in ms)
         """
 
+        previous_speed = self.__animation_speed
         self.__animation_speed = speed
 
         self.__circle_span_speed = int(self.__animation_speed * self.__circle_speed_coefficient)
         self.__dots_single_speed = int(self.__animation_speed * self.__dots_speed_coefficient)
 
-        self.__timeline_circle_rotation.setDuration(self.__animation_speed)
-        self.__timeline_circle_decrease_span.setDuration(self.__circle_span_speed)
-        self.__timeline_circle_increase_span.setDuration(self.__circle_span_speed)
-
-        self.__timeline_dots_up_1.setDuration(self.__dots_single_speed)
-        self.__timeline_dots_down_1.setDuration(self.__dots_single_speed)
-        self.__timeline_dots_up_2.setDuration(self.__dots_single_speed)
-        self.__timeline_dots_down_2.setDuration(self.__dots_single_speed)
-        self.__timeline_dots_up_3.setDuration(self.__dots_single_speed)
-        self.__timeline_dots_down_3.setDuration(self.__dots_single_speed)
+        # Keep the animation at the same point of its loop, all durations scale with the speed
+        if self.__running and previous_speed > 0:
+            now = AnimationClock.instance().getTime()
+            self.__animation_start_time = now - (now - self.__animation_start_time) * speed / previous_speed
 
     def getAnimationWidth(self) -> int:
         """Get the current animation width
@@ -342,6 +1021,8 @@ class LoadingButton(QPushButton):
         """
 
         self.__animation_width = width
+        self.__invalidate_geometry()
+        self.update()
 
     def getAnimationStrokeWidth(self) -> int:
         """Get the current animation stroke width
@@ -358,6 +1039,8 @@ class LoadingButton(QPushButton):
         """
 
         self.__animation_stroke_width = width
+        self.__invalidate_geometry()
+        self.update()
 
     def getAnimationColor(self) -> QColor:
         """Get the current animation color
@@ -374,3 +1057,112 @@ class LoadingButton(QPushButton):
         """
 
         self.__animation_color = color
+        self.__invalidate_geometry()
+        self.update()
+
+    def isFrameCacheEnabled(self) -> bool:
+        """Get whether pre-rendered frames are used to draw the animation
+
+        :return: whether pre-rendered frames are used
+        """
+
+        return self.__frame_cache_enabled
+
+    def setFrameCacheEnabled(self, enabled: bool):
+        """Set whether pre-rendered frames are used to draw the animation.
+        The frames are shared between all buttons with the same animation settings.
+
+        :param enabled: whether pre-rendered frames should be used
+        """
+
+        self.__frame_cache_enabled = enabled
+        self.update()
+
+    def getMaximumFrameRate(self) -> int:
+        """Get the maximum frame rate of the animation (0 means the frame rate of the animation clock)
+
+        :return: maximum frame rate (in frames per second)
+        """
+
+        return self.__maximum_frame_rate
+
+    def setMaximumFrameRate(self, frame_rate: int):
+        """Set the maximum frame rate of the animation (0 means the frame rate of the animation clock)
+
+        :param frame_rate: new maximum frame rate (in frames per second)
+        """
+
+        self.__maximum_frame_rate = max(0, frame_rate)
+
+    def isAdaptiveQualityEnabled(self) -> bool:
+        """Get whether the quality adapts to the measured paint time and event loop lag
+
+        :return: whether adaptive quality is enabled
+        """
+
+        return self.__adaptive_quality_enabled
+
+    def setAdaptiveQualityEnabled(self, enabled: bool):
+        """Set whether the quality adapts to the measured paint time and event loop lag.
+        Under load, the frame rate gets halved and antialiasing gets disabled until the load drops again.
+
+        :param enabled: whether adaptive quality should be enabled
+        """
+
+        self.__adaptive_quality_enabled = enabled
+        self.__reduced_quality = False
+        self.__paint_time = 0.0
+
+    def getAdaptiveQualityThresholds(self) -> tuple:
+        """Get the paint time and event loop lag (in ms) above which the quality gets reduced
+
+        :return: paint time threshold and lag threshold (in ms)
+        """
+
+        return self.__adaptive_paint_time_threshold, self.__adaptive_lag_threshold
+
+    def setAdaptiveQualityThresholds(self, paint_time: float, lag: float):
+        """Set the paint time and event loop lag (in ms) above which the quality gets reduced
+
+        :param paint_time: new paint time threshold (in ms)
+        :param lag: new event loop lag threshold (in ms)
+        """
+
+        self.__adaptive_paint_time_threshold = paint_time
+        self.__adaptive_lag_threshold = lag
+
+    def isReducedQuality(self) -> bool:
+        """Get whether the quality is currently reduced by adaptive quality
+
+        :return: whether the quality is currently reduced
+        """
+
+        return self.__reduced_quality
+
+    def isInstrumentationEnabled(self) -> bool:
+        """Get whether paint and action stats are recorded
+
+        :return: whether instrumentation is enabled
+        """
+
+        return self.__stats is not None
+
+    def setInstrumentationEnabled(self, enabled: bool):
+        """Set whether paint and action stats are recorded.
+        The stats of all instrumented buttons are also added up in LoadingButtonStats.getAggregate().
+
+        :param enabled: whether instrumentation should be enabled
+        """
+
+        if enabled and self.__stats is None:
+            self.__stats = LoadingButtonStats(parent=LoadingButtonStats.getAggregate())
+        elif not enabled:
+            self.__stats = None
+
+    def getStats(self) -> LoadingButtonStats:
+        """Get the paint and action stats of this button
+
+        :return: stats (None if instrumentation is disabled)
+        """
+
+        return self.__stats
@@ -0,0 +1,291 @@
+from qtpy.QtCore import QEvent, QModelIndex, QPersistentModelIndex, Qt, Signal
+from qtpy.QtGui import QBrush, QColor, QPainter
+from qtpy.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton
+from .animation import CIRCLE_SPAN_SPEED_COEFFICIENT, DOTS_SPEED_COEFFICIENT, circle_frame, dots_offsets
+from .animation_clock import AnimationClock
+from .animation_type import AnimationType
+from .painting import create_circle_pen, draw_circle, draw_dots, get_circle_geometry, get_dots_geometry
+
+
+class LoadingButtonDelegate(QStyledItemDelegate):
+
+    # Events
+    clicked = Signal(QModelIndex)
+
+    # Default model roles holding whether a cell is running and the clock time it started at
+    RunningRole = Qt.ItemDataRole.UserRole + 100
+    StartTimeRole = Qt.ItemDataRole.UserRole + 101
+
+    def __init__(self, parent=None):
+        """Create a new LoadingButtonDelegate instance
+
+        :param parent: the parent object (usually the view)
+        """
+
+        super(LoadingButtonDelegate, self).__init__(parent)
+
+        # LoadingButtonDelegate attributes
+        self.__running_role = LoadingButtonDelegate.RunningRole
+        self.__start_time_role = LoadingButtonDelegate.StartTimeRole
+        self.__margin = 2
+
+        # Animation settings
+        self.__animation_type = AnimationType.Circle
+        self.__animation_speed = 2000
+        self.__animation_width = 15
+        self.__animation_stroke_width = 3
+        self.__animation_color = QColor(0, 0, 0)
+        self.__circle_pen = create_circle_pen(self.__animation_color, self.__animation_stroke_width)
+        self.__dots_brush = QBrush(self.__animation_color)
+
+        # Running cells painted by a view, only these get repainted on every frame
+        self.__animated_indexes = {}
+
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        """Paints a cell as a push button showing either its text or the current animation frame
+
+        :param painter: painter to draw with
+        :param option: style option of the cell
+        :param index: model index of the cell
+        """
+
+        running = bool(index.data(self.__running_role))
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+
+        button_option = QStyleOptionButton()
+        button_option.rect = option.rect.adjusted(self.__margin, self.__margin, -self.__margin, -self.__margin)
+        button_option.state = option.state | QStyle.StateFlag.State_Raised
+        button_option.palette = option.palette
+        button_option.fontMetrics = option.fontMetrics
+        button_option.text = '' if running else str(index.data(Qt.ItemDataRole.DisplayRole) or '')
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button_option, painter, widget)
+
+        if not running:
+            return
+
+        painter.save()
+        self.__paint_animation(painter, button_option.rect, self.__get_elapsed(index))
+        painter.restore()
+
+        if widget is not None:
+            self.__animated_indexes[QPersistentModelIndex(index)] = widget
+            AnimationClock.instance().subscribe(self.__advance_animation)
+
+    def __get_elapsed(self, index: QModelIndex) -> int:
+        """Get the time since the cell started running
+
+        :param index: model index of the cell
+        :return: elapsed time (in ms)
+        """
+
+        start_time = index.data(self.__start_time_role)
+        return AnimationClock.instance().getTime() - (start_time or 0)
+
+    def __paint_animation(self, painter: QPainter, rect, elapsed: int):
+        """Paints the animation frame for the given time centered in the given rect
+
+        :param painter: painter to draw with
+        :param rect: rect the animation is centered in
+        :param elapsed: time since the cell started running (in ms)
+        """
+
+        frame_rate = AnimationClock.instance().getFrameRate()
+
+        if self.__animation_type == AnimationType.Circle:
+            x, y, diameter = get_circle_geometry(rect, self.__animation_width, self.__animation_stroke_width)
+            rotation, span = circle_frame(elapsed, self.__animation_speed,
+                                          int(self.__animation_speed * CIRCLE_SPAN_SPEED_COEFFICIENT),
+                                          frame_rate=frame_rate)
+            draw_circle(painter, x, y, diameter, rotation, span, self.__circle_pen)
+
+        elif self.__animation_type == AnimationType.Dots:
+            x_dot_1, x_dot_2, x_dot_3, y = get_dots_geometry(rect, self.__animation_width,
+                                                             self.__animation_stroke_width)
+            offsets = dots_offsets(elapsed, int(self.__animation_speed * DOTS_SPEED_COEFFICIENT),
+                                   self.__animation_stroke_width, frame_rate=frame_rate)
+            draw_dots(painter, (x_dot_1, x_dot_2, x_dot_3), y, offsets, self.__dots_brush,
+                      self.__animation_stroke_width)
+
+    def __advance_animation(self, time: int):
+        """Repaints all running cells that are visible in their view.
+        Cells that stopped running or got scrolled out of view are dropped until they get painted again.
+
+        :param time: current clock time (in ms)
+        """
+
+        for index, view in list(self.__animated_indexes.items()):
+            try:
+                if index.isValid() and index.data(self.__running_role):
+                    rect = view.visualRect(QModelIndex(index))
+                    if rect.intersects(view.viewport().rect()):
+                        view.viewport().update(rect)
+                        continue
+            except RuntimeError:
+                # The view got deleted
+                pass
+            del self.__animated_indexes[index]
+
+        if not self.__animated_indexes:
+            AnimationClock.instance().unsubscribe(self.__advance_animation)
+
+    def editorEvent(self, event: QEvent, model, option, index: QModelIndex) -> bool:
+        """Emits clicked when a cell that is not running gets clicked
+
+        :param event: event sent by PyQt
+        :param model: model of the cell
+        :param option: style option of the cell
+        :param index: model index of the cell
+        :return: whether the event got handled
+        """
+
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton \
+                and option.rect.contains(event.pos()):
+            if not index.data(self.__running_role):
+                self.clicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    def setRunning(self, index: QModelIndex, running: bool):
+        """Start or stop the animation of a cell by writing its state to the model
+
+        :param index: model index of the cell
+        :param running: whether the cell is running
+        """
+
+        model = index.model()
+        if running:
+            model.setData(index, AnimationClock.instance().getTime(), self.__start_time_role)
+        model.setData(index, running, self.__running_role)
+
+    def isRunning(self, index: QModelIndex) -> bool:
+        """Get whether a cell is running
+
+        :param index: model index of the cell
+        :return: whether the cell is running
+        """
+
+        return bool(index.data(self.__running_role))
+
+    def getAnimatedCellCount(self) -> int:
+        """Get the number of visible running cells that get repainted on every frame
+
+        :return: number of animated cells
+        """
+
+        return len(self.__animated_indexes)
+
+    def getRunningRole(self) -> int:
+        """Get the model role holding whether a cell is running
+
+        :return: running role
+        """
+
+        return self.__running_role
+
+    def setRunningRole(self, role: int):
+        """Set the model role holding whether a cell is running
+
+        :param role: new running role
+        """
+
+        self.__running_role = role
+
+    def getStartTimeRole(self) -> int:
+        """Get the model role holding the clock time a cell started running at
+
+        :return: start time role
+        """
+
+        return self.__start_time_role
+
+    def setStartTimeRole(self, role: int):
+        """Set the model role holding the clock time a cell started running at
+
+        :param role: new start time role
+        """
+
+        self.__start_time_role = role
+
+    def getAnimationType(self) -> AnimationType:
+        """Get the current animation type
+
+        :return: animation type
+        """
+
+        return self.__animation_type
+
+    def setAnimationType(self, animation_type: AnimationType):
+        """Set the animation type
+
+        :param animation_type: new animation type
+        """
+
+        self.__animation_type = animation_type
+
+    def getAnimationSpeed(self) -> int:
+        """Get the current animation speed
+
+        :return: animation speed (time it takes the animation to complete one loop in ms)
+        """
+
+        return self.__animation_speed
+
+    def setAnimationSpeed(self, speed: int):
+        """Set the animation speed
+
+        :param speed: new animation speed (time it takes the animation to complete one loop in ms)
+        """
+
+        self.__animation_speed = speed
+
+    def getAnimationWidth(self) -> int:
+        """Get the current animation width
+
+        :return: animation width
+        """
+
+        return self.__animation_width
+
+    def setAnimationWidth(self, width: int):
+        """Set the animation width
+
+        :param width: new animation width
+        """
+
+        self.__animation_width = width
+
+    def getAnimationStrokeWidth(self) -> int:
+        """Get the current animation stroke width
+
+        :return: animation stroke width
+        """
+
+        return self.__animation_stroke_width
+
+    def setAnimationStrokeWidth(self, width: int):
+        """Set the animation stroke width
+
+        :param width: new animation stroke width
+        """
+
+        self.__animation_stroke_width = width
+        self.__circle_pen = create_circle_pen(self.__animation_color, self.__animation_stroke_width)
+
+    def getAnimationColor(self) -> QColor:
+        """Get the current animation color
+
+        :return: animation color
+        """
+
+        return self.__animation_color
+
+    def setAnimationColor(self, color: QColor):
+        """Set the animation color
+
+        :param color: new animation color
+        """
+
+        self.__animation_color = color
+        self.__circle_pen = create_circle_pen(self.__animation_color, self.__animation_stroke_width)
+        self.__dots_brush = QBrush(self.__animation_color)
@@ -0,0 +1,309 @@
+import asyncio
+import heapq
+import itertools
+from concurrent.futures import Future
+from qtpy.QtCore import QObject
+from .worker import Worker
+
+
+class LoadingButtonGroup(QObject):
+
+    def __init__(self, maximum_concurrency: int = 1, parent=None):
+        """Create a new LoadingButtonGroup instance
+
+        :param maximum_concurrency: maximum number of actions of the group's buttons executed at the same time
+        :param parent: the parent object
+        """
+
+        super(LoadingButtonGroup, self).__init__(parent)
+
+        # LoadingButtonGroup attributes
+        self.__buttons = []
+        self.__priorities = {}
+        self.__batch_arguments = {}
+        self.__maximum_concurrency = max(1, maximum_concurrency)
+        self.__batch_action = None
+        self.__maximum_batch_size = 0
+
+        # Buttons waiting for a free slot, ordered by priority and then by the time they got queued
+        self.__queue = []
+        self.__sequence = itertools.count()
+
+        # Buttons currently executing their own action and batches currently being executed
+        self.__running_buttons = set()
+        self.__batch_workers = set()
+
+    def addButton(self, button, priority: int = None):
+        """Add a button to the group
+
+        :param button: LoadingButton to be added
+        :param priority: buttons with a higher priority get executed first (keeps the current priority or 0 if None)
+        """
+
+        if priority is not None:
+            self.__priorities[button] = priority
+        else:
+            self.__priorities.setdefault(button, 0)
+        if button not in self.__buttons:
+            self.__buttons.append(button)
+            button.setGroup(self)
+
+    def removeButton(self, button):
+        """Remove a button from the group.
+        A queued action of the button gets executed right away.
+
+        :param button: LoadingButton to be removed
+        """
+
+        if button not in self.__buttons:
+            return
+
+        self.__buttons.remove(button)
+        self.__priorities.pop(button, None)
+        self.__batch_arguments.pop(button, None)
+
+        entry = self.__take_entry(button)
+        self.release(button)
+        if button.getGroup() is self:
+            button.setGroup(None)
+        if entry is not None:
+            entry[3](button.getAction())
+
+    def getButtons(self) -> list:
+        """Get all buttons of the group
+
+        :return: buttons of the group
+        """
+
+        return list(self.__buttons)
+
+    def getPriority(self, button) -> int:
+        """Get the priority of a button
+
+        :param button: LoadingButton of the group
+        :return: priority of the button
+        """
+
+        return self.__priorities.get(button, 0)
+
+    def setPriority(self, button, priority: int):
+        """Set the priority of a button. Buttons with a higher priority get executed first,
+        buttons with the same priority in the order they were clicked.
+
+        :param button: LoadingButton of the group
+        :param priority: new priority
+        """
+
+        self.__priorities[button] = priority
+        entry = self.__take_entry(button)
+        if entry is not None:
+            heapq.heappush(self.__queue, (-priority, entry[1], button, entry[3]))
+
+    def getMaximumConcurrency(self) -> int:
+        """Get the maximum number of actions executed at the same time
+
+        :return: maximum concurrency
+        """
+
+        return self.__maximum_concurrency
+
+    def setMaximumConcurrency(self, maximum_concurrency: int):
+        """Set the maximum number of actions executed at the same time.
+        A batch counts as a single action.
+
+        :param maximum_concurrency: new maximum concurrency
+        """
+
+        self.__maximum_concurrency = max(1, maximum_concurrency)
+        self.__dispatch()
+
+    def getRunningCount(self) -> int:
+        """Get the number of actions and batches currently being executed
+
+        :return: number of running actions
+        """
+
+        return len(self.__running_buttons) + len(self.__batch_workers)
+
+    def getQueuedCount(self) -> int:
+        """Get the number of buttons waiting for a free slot
+
+        :return: number of queued buttons
+        """
+
+        return len(self.__queue)
+
+    def getBatchAction(self) -> callable:
+        """Get the action executing the queued actions of several buttons in a single call
+
+        :return: batch action
+        """
+
+        return self.__batch_action
+
+    def setBatchAction(self, batch_action: callable, maximum_batch_size: int = 0):
+        """Set an action executing the queued actions of several buttons in a single call.
+        It receives a list with the batch argument of every button and has to return a list
+        with one result per argument. Only buttons with a batch argument get batched.
+
+        :param batch_action: new batch action (None to disable batching)
+        :param maximum_batch_size: maximum number of buttons per batch (0 for no limit)
+        """
+
+        self.__batch_action = batch_action
+        self.__maximum_batch_size = max(0, maximum_batch_size)
+
+    def getBatchArgument(self, button) -> object:
+        """Get the value passed to the batch action for a button
+
+        :param button: LoadingButton of the group
+        :return: batch argument (None if the button does not get batched)
+        """
+
+        return self.__batch_arguments.get(button)
+
+    def setBatchArgument(self, button, argument: object):
+        """Set the value passed to the batch action for a button
+
+        :param button: LoadingButton of the group
+        :param argument: new batch argument (None if the button should not get batched)
+        """
+
+        if argument is None:
+            self.__batch_arguments.pop(button, None)
+        else:
+            self.__batch_arguments[button] = argument
+
+    def acquire(self, button, execute: callable):
+        """Queue a button until a slot is free. Called by the button when its action is about to start.
+
+        :param button: LoadingButton of the group
+        :param execute: callable receiving the action the button has to execute
+        """
+
+        self.__take_entry(button)
+        heapq.heappush(self.__queue, (-self.getPriority(button), next(self.__sequence), button, execute))
+        self.__dispatch()
+
+    def release(self, button):
+        """Free the slot of a button or remove it from the queue.
+        Called by the button when its action finished or got cancelled.
+
+        :param button: LoadingButton of the group
+        """
+
+        self.__take_entry(button)
+        if button in self.__running_buttons:
+            self.__running_buttons.remove(button)
+            self.__dispatch()
+
+    def __take_entry(self, button) -> tuple:
+        """Remove a button from the queue
+
+        :param button: button to be removed
+        :return: removed queue entry (None if the button was not queued)
+        """
+
+        for index, entry in enumerate(self.__queue):
+            if entry[2] is button:
+                self.__queue.pop(index)
+                heapq.heapify(self.__queue)
+                return entry
+        return None
+
+    def __dispatch(self):
+        """Executes queued actions while there are free slots"""
+
+        while self.__queue and self.getRunningCount() < self.__maximum_concurrency:
+            entry = heapq.heappop(self.__queue)
+            button, execute = entry[2], entry[3]
+
+            if self.__batch_action is not None and button in self.__batch_arguments:
+                self.__start_batch([entry] + self.__take_batch_entries())
+            else:
+                self.__running_buttons.add(button)
+                execute(button.getAction())
+
+    def __take_batch_entries(self) -> list:
+        """Remove all further batchable buttons from the queue, in queue order
+
+        :return: removed queue entries
+        """
+
+        entries = sorted(entry for entry in self.__queue if entry[2] in self.__batch_arguments)
+        if self.__maximum_batch_size:
+            entries = entries[:self.__maximum_batch_size - 1]
+        for entry in entries:
+            self.__take_entry(entry[2])
+        return entries
+
+    def __start_batch(self, entries: list):
+        """Executes the batch action for the given queue entries.
+        Every button awaits its own result on the shared event loop, so waiting does not occupy a thread.
+
+        :param entries: queue entries of the batched buttons
+        """
+
+        batch_action = self.__batch_action
+        arguments = [self.__batch_arguments[entry[2]] for entry in entries]
+        futures = [Future() for _ in entries]
+
+        worker = Worker(lambda: batch_action(arguments))
+        worker.result.connect(lambda results: self.__handle_batch_result(futures, results))
+        worker.error.connect(lambda error: self.__handle_batch_error(futures, error))
+        worker.finished.connect(lambda: self.__handle_batch_finished(worker))
+        self.__batch_workers.add(worker)
+
+        for entry, future in zip(entries, futures):
+            entry[3](get_batch_member_action(future))
+        worker.start()
+
+    def __handle_batch_result(self, futures: list, results: list):
+        """Passes the results of the batch action on to the batched buttons
+
+        :param futures: futures of the batched buttons
+        :param results: one result per batched button
+        """
+
+        if results is None or len(results) != len(futures):
+            self.__handle_batch_error(futures, ValueError(
+                'Batch action returned {} results for {} buttons'.format(
+                    'no' if results is None else len(results), len(futures))))
+            return
+
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+    def __handle_batch_error(self, futures: list, error: Exception):
+        """Passes an exception raised by the batch action on to the batched buttons
+
+        :param futures: futures of the batched buttons
+        :param error: exception raised by the batch action
+        """
+
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def __handle_batch_finished(self, worker: Worker):
+        """Frees the slot of a finished batch
+
+        :param worker: worker of the batch
+        """
+
+        self.__batch_workers.discard(worker)
+        self.__dispatch()
+
+
+def get_batch_member_action(future: Future) -> callable:
+    """Get the action a batched button executes instead of its own one
+
+    :param future: future the result of the button gets set on
+    :return: coroutine function returning the result of the button
+    """
+
+    async def action():
+        return await asyncio.wrap_future(future)
+
+    return action
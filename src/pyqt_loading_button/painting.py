@@ -0,0 +1,82 @@
+import math
+from qtpy.QtCore import QRect, Qt
+from qtpy.QtGui import QPainter, QPen, QBrush, QColor
+
+
+def get_circle_geometry(rect: QRect, width: int, stroke_width: int) -> tuple:
+    """Get the position and diameter of the circle centered in the given rect
+
+    :param rect: rect the animation is centered in
+    :param width: animation width
+    :param stroke_width: animation stroke width
+    :return: x position, y position and diameter
+    """
+
+    diameter = width - stroke_width
+    x = rect.x() + math.floor((rect.width() - diameter) / 2)
+    y = rect.y() + math.ceil((rect.height() - diameter) / 2)
+    return x, y, diameter
+
+
+def get_dots_geometry(rect: QRect, width: int, stroke_width: int) -> tuple:
+    """Get the positions of the dots centered in the given rect while resting
+
+    :param rect: rect the animation is centered in
+    :param width: animation width
+    :param stroke_width: animation stroke width
+    :return: x positions of all three dots and their shared y position
+    """
+
+    spacing = math.ceil(width / 3)
+    x_dot_1 = rect.x() + math.ceil((rect.width() - spacing * 2 - stroke_width) / 2)
+    y = rect.y() + math.ceil((rect.height() - stroke_width) / 2)
+    return x_dot_1, x_dot_1 + spacing, x_dot_1 + spacing * 2, y
+
+
+def create_circle_pen(color: QColor, stroke_width: int) -> QPen:
+    """Create the pen the arc of the circle animation is drawn with
+
+    :param color: color of the arc
+    :param stroke_width: stroke width of the arc
+    :return: pen
+    """
+
+    return QPen(color, stroke_width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+
+
+def draw_circle(painter: QPainter, x: int, y: int, diameter: int, rotation: float, span: float,
+                pen: QPen, antialiasing: bool = True):
+    """Draw a single frame of the circle animation
+
+    :param painter: painter to draw with
+    :param x: x position of the circle
+    :param y: y position of the circle
+    :param diameter: diameter of the circle
+    :param rotation: start angle of the arc (in degrees)
+    :param span: span of the arc (in degrees)
+    :param pen: pen created by create_circle_pen()
+    :param antialiasing: whether the arc gets antialiased
+    """
+
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, antialiasing)
+    painter.setPen(pen)
+    painter.drawArc(x, y, diameter, diameter, int(rotation * 16), int(span * 16))
+
+
+def draw_dots(painter: QPainter, x_positions: tuple, y: int, offsets: tuple, brush: QBrush, stroke_width: int,
+              antialiasing: bool = True):
+    """Draw a single frame of the dots animation
+
+    :param painter: painter to draw with
+    :param x_positions: x positions of the three dots
+    :param y: y position of the dots while resting
+    :param offsets: upward offsets of the three dots
+    :param brush: brush the dots are filled with
+    :param stroke_width: diameter of the dots
+    :param antialiasing: whether the dots get antialiased
+    """
+
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, antialiasing)
+    painter.setBrush(brush)
+    for x, offset in zip(x_positions, offsets):
+        painter.drawEllipse(x, y - offset, stroke_width, stroke_width)
@@ -0,0 +1,167 @@
+import inspect
+import math
+import time
+from qtpy.QtCore import QObject, QTimer, Signal
+
+
+class Pipeline(QObject):
+
+    # Events
+    stageChanged = Signal(int, str)
+    stageFinished = Signal(int, str, float)
+    stageAvailable = Signal()
+
+    # Minimum time between two stage changes (in s)
+    __stage_interval = 1 / 60
+
+    def __init__(self, stages: list = None, parent=None):
+        """Create a new Pipeline instance.
+        A pipeline is an action executing several stages one after another, so it can be passed to setAction().
+
+        :param stages: callables executed as stages, in order
+        :param parent: the parent object
+        """
+
+        super(Pipeline, self).__init__(parent)
+
+        # Pipeline attributes
+        self.__stages = []
+        self.__stage_times = []
+        self.__streaming = False
+        self.__current_stage = None
+        self.__emitted_stage = None
+        self.__stage_pending = False
+        self.__stage_time = 0.0
+        for stage in stages or []:
+            self.addStage(stage)
+
+        # Stage changes are coalesced and emitted in the thread the pipeline lives in
+        self.stageAvailable.connect(self.__handle_stageAvailable)
+
+    def addStage(self, function: callable, name: str = None):
+        """Add a stage to the end of the pipeline.
+        The first stage is called without arguments, every further stage is called once per item
+        produced by the previous stage. Stages returning a generator produce one item per yielded value,
+        which gets passed on to the next stage right away instead of being collected first.
+
+        :param function: callable executed as stage
+        :param name: name of the stage (name of the function if None)
+        """
+
+        if name is None:
+            name = getattr(function, '__name__', 'stage {}'.format(len(self.__stages) + 1))
+        self.__stages.append((name, function))
+
+    def getStages(self) -> list:
+        """Get the names of all stages
+
+        :return: stage names
+        """
+
+        return [name for name, _ in self.__stages]
+
+    def getStageCount(self) -> int:
+        """Get the number of stages
+
+        :return: number of stages
+        """
+
+        return len(self.__stages)
+
+    def getStageTimes(self) -> list:
+        """Get the time spent in every stage during the last run, excluding the time spent in other stages
+
+        :return: stage times (in ms)
+        """
+
+        return list(self.__stage_times)
+
+    def __call__(self, is_cancelled: callable = None) -> object:
+        """Executes all stages, streaming the items of every stage to the next one
+
+        :param is_cancelled: callable telling whether the action got cancelled
+        :return: item produced by the last stage, or a list of all items if any stage produced several
+        """
+
+        self.__stage_times = [0.0] * len(self.__stages)
+        self.__streaming = False
+        self.__current_stage = None
+        self.__emitted_stage = None
+
+        items = [None]
+        for index in range(len(self.__stages)):
+            items = self.__run_stage(index, items, is_cancelled)
+
+        results = list(items)
+        if self.__streaming or len(results) != 1:
+            return results
+        return results[0]
+
+    def __run_stage(self, index: int, items, is_cancelled: callable):
+        """Executes a stage once per item of the previous stage
+
+        :param index: index of the stage
+        :param items: items produced by the previous stage
+        :param is_cancelled: callable telling whether the action got cancelled
+        :return: generator producing the items of the stage
+        """
+
+        name, function = self.__stages[index]
+        started = False
+
+        for item in items:
+            if is_cancelled is not None and is_cancelled():
+                return
+            started = True
+            self.__enter_stage(index)
+
+            start_time = time.perf_counter()
+            output = function() if index == 0 else function(item)
+
+            # Time spent producing items, while the time spent by later stages consuming them is excluded
+            if inspect.isgenerator(output):
+                self.__streaming = True
+                while True:
+                    self.__enter_stage(index)
+                    try:
+                        value = next(output)
+                    except StopIteration:
+                        break
+                    finally:
+                        self.__stage_times[index] += (time.perf_counter() - start_time) * 1000
+                    yield value
+                    start_time = time.perf_counter()
+            else:
+                self.__stage_times[index] += (time.perf_counter() - start_time) * 1000
+                yield output
+
+        if started:
+            self.stageFinished.emit(index, name, self.__stage_times[index])
+
+    def __enter_stage(self, index: int):
+        """Marks a stage as the current one. Streaming stages take turns, so the current stage changes
+        back and forth while items pass through. Cheap enough to be called for every item,
+        since changes are coalesced and only forwarded at a limited rate.
+
+        :param index: index of the stage about to be executed
+        """
+
+        self.__current_stage = index
+        if index != self.__emitted_stage and not self.__stage_pending:
+            self.__stage_pending = True
+            self.stageAvailable.emit()
+
+    def __handle_stageAvailable(self):
+        """Emits stageChanged with the latest stage, at most once per stage interval"""
+
+        remaining = Pipeline.__stage_interval - (time.monotonic() - self.__stage_time)
+        if remaining > 0:
+            QTimer.singleShot(math.ceil(remaining * 1000), self.__handle_stageAvailable)
+            return
+
+        self.__stage_pending = False
+        index = self.__current_stage
+        if index is not None and index != self.__emitted_stage:
+            self.__stage_time = time.monotonic()
+            self.__emitted_stage = index
+            self.stageChanged.emit(index, self.__stages[index][0])
@@ -0,0 +1,154 @@
+import random
+
+
+class RetryPolicy:
+
+    def __init__(self, maximum_attempts: int = 3, initial_delay: int = 500, multiplier: float = 2.0,
+                 maximum_delay: int = 30000, jitter: float = 0.5, retryable: tuple = (Exception,)):
+        """Create a new RetryPolicy instance.
+        Decides whether a failed action gets executed again and how long to wait before doing so.
+
+        :param maximum_attempts: maximum number of times the action gets executed, including the first attempt
+        :param initial_delay: time waited before the first retry (in ms)
+        :param multiplier: factor the delay grows by with every further retry
+        :param maximum_delay: upper bound of the delay before jitter is applied (in ms)
+        :param jitter: fraction of the delay that is randomized (0 for fixed delays, 1 for full jitter)
+        :param retryable: exception types to retry, or a callable taking the exception and returning whether to retry
+        """
+
+        # RetryPolicy attributes
+        self.__maximum_attempts = max(1, maximum_attempts)
+        self.__initial_delay = max(0, initial_delay)
+        self.__multiplier = max(1.0, multiplier)
+        self.__maximum_delay = max(0, maximum_delay)
+        self.__jitter = min(1.0, max(0.0, jitter))
+        self.__retryable = retryable
+
+    def isRetryable(self, error: Exception) -> bool:
+        """Get whether an exception raised by the action is worth retrying
+
+        :param error: exception raised by the action
+        :return: whether the exception is retryable
+        """
+
+        if isinstance(self.__retryable, (type, tuple)):
+            return isinstance(error, self.__retryable)
+        return bool(self.__retryable(error))
+
+    def shouldRetry(self, attempt: int, error: Exception) -> bool:
+        """Get whether the action gets executed again after the given attempt failed
+
+        :param attempt: number of the failed attempt (starting at 1)
+        :param error: exception raised by the action
+        :return: whether to retry
+        """
+
+        return attempt < self.__maximum_attempts and self.isRetryable(error)
+
+    def getDelay(self, attempt: int) -> int:
+        """Get the time to wait before executing the action again.
+        The delay grows exponentially and a random part of it is dropped,
+        so buttons failing at the same time do not retry at the same time.
+
+        :param attempt: number of the failed attempt (starting at 1)
+        :return: delay (in ms)
+        """
+
+        delay = min(self.__maximum_delay, self.__initial_delay * self.__multiplier ** (attempt - 1))
+        return round(delay * (1 - self.__jitter * random.random()))
+
+    def getMaximumAttempts(self) -> int:
+        """Get the maximum number of times the action gets executed
+
+        :return: maximum number of attempts
+        """
+
+        return self.__maximum_attempts
+
+    def setMaximumAttempts(self, maximum_attempts: int):
+        """Set the maximum number of times the action gets executed, including the first attempt
+
+        :param maximum_attempts: new maximum number of attempts
+        """
+
+        self.__maximum_attempts = max(1, maximum_attempts)
+
+    def getInitialDelay(self) -> int:
+        """Get the time waited before the first retry
+
+        :return: initial delay (in ms)
+        """
+
+        return self.__initial_delay
+
+    def setInitialDelay(self, delay: int):
+        """Set the time waited before the first retry
+
+        :param delay: new initial delay (in ms)
+        """
+
+        self.__initial_delay = max(0, delay)
+
+    def getMultiplier(self) -> float:
+        """Get the factor the delay grows by with every further retry
+
+        :return: multiplier
+        """
+
+        return self.__multiplier
+
+    def setMultiplier(self, multiplier: float):
+        """Set the factor the delay grows by with every further retry
+
+        :param multiplier: new multiplier (at least 1)
+        """
+
+        self.__multiplier = max(1.0, multiplier)
+
+    def getMaximumDelay(self) -> int:
+        """Get the upper bound of the delay
+
+        :return: maximum delay (in ms)
+        """
+
+        return self.__maximum_delay
+
+    def setMaximumDelay(self, delay: int):
+        """Set the upper bound of the delay
+
+        :param delay: new maximum delay (in ms)
+        """
+
+        self.__maximum_delay = max(0, delay)
+
+    def getJitter(self) -> float:
+        """Get the fraction of the delay that is randomized
+
+        :return: jitter between 0 and 1
+        """
+
+        return self.__jitter
+
+    def setJitter(self, jitter: float):
+        """Set the fraction of the delay that is randomized
+
+        :param jitter: new jitter between 0 (fixed delays) and 1 (full jitter)
+        """
+
+        self.__jitter = min(1.0, max(0.0, jitter))
+
+    def getRetryable(self) -> object:
+        """Get the filter deciding which exceptions are retried
+
+        :return: exception types or callable
+        """
+
+        return self.__retryable
+
+    def setRetryable(self, retryable: object):
+        """Set the filter deciding which exceptions are retried
+
+        :param retryable: exception types, or a callable taking the exception and returning whether to retry
+        """
+
+        self.__retryable = retryable
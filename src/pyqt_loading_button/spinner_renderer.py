@@ -0,0 +1,315 @@
+import math
+from qtpy.QtCore import QRect, QSize, Qt
+from qtpy.QtGui import QBrush, QColor, QImage, QPainter, QPaintDevice
+from .animation import (CIRCLE_SPAN_SPEED_COEFFICIENT, DOTS_SPEED_COEFFICIENT, circle_cycle, circle_frame,
+                        dots_cycle, dots_offsets, dots_offsets_many)
+from .animation_type import AnimationType
+from .frame_cache import FrameCache
+from .painting import create_circle_pen, draw_circle, draw_dots, get_circle_geometry, get_dots_geometry
+
+
+class SpinnerRenderer:
+
+    # Maximum number of frames getFrameTimes() generates for one loop without an explicit frame count
+    MaximumLoopFrameCount = 1000
+
+    def __init__(self, animation_type: AnimationType = AnimationType.Circle, speed: int = 2000,
+                 width: int = 15, stroke_width: int = 3, color: QColor = QColor(0, 0, 0)):
+        """Create a new SpinnerRenderer instance.
+        Draws frames of the LoadingButton animations into any paint device without a widget.
+
+        :param animation_type: animation type
+        :param speed: animation speed (time it takes the animation to complete one loop in ms)
+        :param width: animation width
+        :param stroke_width: animation stroke width
+        :param color: animation color
+        """
+
+        # SpinnerRenderer attributes
+        self.__animation_type = animation_type
+        self.__animation_speed = speed
+        self.__animation_width = width
+        self.__animation_stroke_width = stroke_width
+        self.__animation_color = QColor(color)
+        self.__antialiasing = True
+        self.__update_pen()
+
+    def __update_pen(self):
+        """Creates the pen and brush for the current stroke width and color"""
+
+        self.__circle_pen = create_circle_pen(self.__animation_color, self.__animation_stroke_width)
+        self.__dots_brush = QBrush(self.__animation_color)
+
+    def getFrameSize(self) -> QSize:
+        """Get the smallest size a frame fits in without being clipped
+
+        :return: frame size
+        """
+
+        size = FrameCache.getFrameSize(self.__animation_type, self.__animation_width, self.__animation_stroke_width)
+        return QSize(math.ceil(size.width()), math.ceil(size.height()))
+
+    def getLoopDuration(self) -> float:
+        """Get the time after which the animation repeats itself exactly, so frames covering it loop seamlessly.
+        The dots repeat after one movement of all three dots. The arc of the circle moves forward with
+        every change of its span, so the circle only repeats after many rotations (126 with the default settings).
+
+        :return: loop duration (in ms)
+        """
+
+        if self.__animation_type == AnimationType.Dots:
+            return dots_cycle(int(self.__animation_speed * DOTS_SPEED_COEFFICIENT))
+        return circle_cycle(self.__animation_speed, int(self.__animation_speed * CIRCLE_SPAN_SPEED_COEFFICIENT))
+
+    def render(self, device: QPaintDevice, time: float, rect: QRect = None):
+        """Draw the frame for the given time into a paint device
+
+        :param device: paint device to draw into (e.g. QImage, QPixmap, QPicture, QSvgGenerator)
+        :param time: time since the animation started (in ms)
+        :param rect: rect the animation gets centered in (whole device if None)
+        """
+
+        if rect is None:
+            device_pixel_ratio = device.devicePixelRatioF()
+            rect = QRect(0, 0, round(device.width() / device_pixel_ratio), round(device.height() / device_pixel_ratio))
+
+        painter = QPainter(device)
+        self.renderWithPainter(painter, time, rect)
+        painter.end()
+
+    def renderWithPainter(self, painter: QPainter, time: float, rect: QRect, offsets: tuple = None):
+        """Draw the frame for the given time with an active painter
+
+        :param painter: painter to draw with
+        :param time: time since the animation started (in ms)
+        :param rect: rect the animation gets centered in
+        :param offsets: precomputed offsets of the dots (computed from the time if None)
+        """
+
+        width, stroke_width = self.__animation_width, self.__animation_stroke_width
+
+        if self.__animation_type == AnimationType.Circle:
+            x, y, diameter = get_circle_geometry(rect, width, stroke_width)
+            rotation, span = circle_frame(time, self.__animation_speed,
+                                          int(self.__animation_speed * CIRCLE_SPAN_SPEED_COEFFICIENT))
+            draw_circle(painter, x, y, diameter, rotation, span, self.__circle_pen, self.__antialiasing)
+
+        elif self.__animation_type == AnimationType.Dots:
+            x_dot_1, x_dot_2, x_dot_3, y = get_dots_geometry(rect, width, stroke_width)
+            if offsets is None:
+                offsets = dots_offsets(time, int(self.__animation_speed * DOTS_SPEED_COEFFICIENT), stroke_width)
+            painter.setPen(Qt.PenStyle.NoPen)
+            draw_dots(painter, (x_dot_1, x_dot_2, x_dot_3), y, offsets, self.__dots_brush, stroke_width,
+                      self.__antialiasing)
+
+    def renderImage(self, time: float, size: QSize = None, device_pixel_ratio: float = 1.0) -> QImage:
+        """Render the frame for the given time into a new transparent image
+
+        :param time: time since the animation started (in ms)
+        :param size: size of the image in device independent pixels (frame size if None)
+        :param device_pixel_ratio: device pixel ratio of the image
+        :return: rendered image
+        """
+
+        return self.renderFrames([time], size, device_pixel_ratio)[0]
+
+    def getFrameTimes(self, frame_count: int = None, frame_rate: int = 60, start_time: float = 0) -> list:
+        """Get evenly spaced frame times
+
+        :param frame_count: number of frames (enough frames for one seamless loop if None)
+        :param frame_rate: number of frames per second
+        :param start_time: time of the first frame (in ms)
+        :return: frame times (in ms)
+        :raises ValueError: if no frame count is given and one loop needs more than MaximumLoopFrameCount frames,
+            which is the case for the circle, since it only repeats after many rotations
+        """
+
+        if frame_count is None:
+            frame_count = max(1, round(self.getLoopDuration() * frame_rate / 1000))
+            if frame_count > SpinnerRenderer.MaximumLoopFrameCount:
+                raise ValueError('One loop of the animation takes {} frames, pass an explicit frame count '
+                                 'instead'.format(frame_count))
+        return [start_time + index * 1000 / frame_rate for index in range(frame_count)]
+
+    def renderFrames(self, times: list, size: QSize = None, device_pixel_ratio: float = 1.0) -> list:
+        """Render many frames in one call, each into a new transparent image
+
+        :param times: times since the animation started (in ms)
+        :param size: size of the images in device independent pixels (frame size if None)
+        :param device_pixel_ratio: device pixel ratio of the images
+        :return: rendered images
+        """
+
+        size = size if size is not None else self.getFrameSize()
+        rect = QRect(0, 0, size.width(), size.height())
+        all_offsets = self.__get_all_offsets(times)
+
+        images = []
+        for time, offsets in zip(times, all_offsets):
+            image = QImage(math.ceil(size.width() * device_pixel_ratio), math.ceil(size.height() * device_pixel_ratio),
+                           QImage.Format.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(device_pixel_ratio)
+            image.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(image)
+            self.renderWithPainter(painter, time, rect, offsets)
+            painter.end()
+            images.append(image)
+        return images
+
+    def renderStrip(self, times: list, size: QSize = None, device_pixel_ratio: float = 1.0) -> QImage:
+        """Render many frames next to each other into a single transparent image (sprite strip)
+
+        :param times: times since the animation started (in ms)
+        :param size: size of a single frame in device independent pixels (frame size if None)
+        :param device_pixel_ratio: device pixel ratio of the image
+        :return: rendered strip
+        """
+
+        size = size if size is not None else self.getFrameSize()
+        strip = QImage(math.ceil(size.width() * len(times) * device_pixel_ratio),
+                       math.ceil(size.height() * device_pixel_ratio), QImage.Format.Format_ARGB32_Premultiplied)
+        strip.setDevicePixelRatio(device_pixel_ratio)
+        strip.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(strip)
+        for index, (time, offsets) in enumerate(zip(times, self.__get_all_offsets(times))):
+            self.renderWithPainter(painter, time, QRect(size.width() * index, 0, size.width(), size.height()),
+                                   offsets)
+        painter.end()
+        return strip
+
+    def exportFrames(self, path_pattern: str, times: list, size: QSize = None,
+                     device_pixel_ratio: float = 1.0) -> bool:
+        """Render many frames and save each of them as an image file
+
+        :param path_pattern: file path containing {} for the frame number (e.g. 'spinner_{:03d}.png')
+        :param times: times since the animation started (in ms)
+        :param size: size of the images in device independent pixels (frame size if None)
+        :param device_pixel_ratio: device pixel ratio of the images
+        :return: whether all files were saved successfully
+        """
+
+        images = self.renderFrames(times, size, device_pixel_ratio)
+        return all([image.save(path_pattern.format(index)) for index, image in enumerate(images)])
+
+    def exportStrip(self, path: str, times: list, size: QSize = None, device_pixel_ratio: float = 1.0) -> bool:
+        """Render many frames next to each other and save them as a single image file
+
+        :param path: file path (the format is derived from the file extension, e.g. '.png')
+        :param times: times since the animation started (in ms)
+        :param size: size of a single frame in device independent pixels (frame size if None)
+        :param device_pixel_ratio: device pixel ratio of the image
+        :return: whether the file was saved successfully
+        """
+
+        return self.renderStrip(times, size, device_pixel_ratio).save(path)
+
+    def __get_all_offsets(self, times: list) -> list:
+        """Compute the offsets of the dots for all frames at once
+
+        :param times: times since the animation started (in ms)
+        :return: offsets per frame (None per frame for the circle)
+        """
+
+        if self.__animation_type != AnimationType.Dots:
+            return [None] * len(times)
+        return dots_offsets_many(times, int(self.__animation_speed * DOTS_SPEED_COEFFICIENT),
+                                 self.__animation_stroke_width)
+
+    def isAntialiasingEnabled(self) -> bool:
+        """Get whether frames are antialiased
+
+        :return: whether frames are antialiased
+        """
+
+        return self.__antialiasing
+
+    def setAntialiasingEnabled(self, enabled: bool):
+        """Set whether frames are antialiased
+
+        :param enabled: whether frames are antialiased
+        """
+
+        self.__antialiasing = enabled
+
+    def getAnimationType(self) -> AnimationType:
+        """Get the current animation type
+
+        :return: animation type
+        """
+
+        return self.__animation_type
+
+    def setAnimationType(self, animation_type: AnimationType):
+        """Set the animation type
+
+        :param animation_type: new animation type
+        """
+
+        self.__animation_type = animation_type
+
+    def getAnimationSpeed(self) -> int:
+        """Get the current animation speed
+
+        :return: animation speed (time it takes the animation to complete one loop in ms)
+        """
+
+        return self.__animation_speed
+
+    def setAnimationSpeed(self, speed: int):
+        """Set the animation speed
+
+        :param speed: new animation speed (time it takes the animation to complete one loop in ms)
+        """
+
+        self.__animation_speed = speed
+
+    def getAnimationWidth(self) -> int:
+        """Get the current animation width
+
+        :return: animation width
+        """
+
+        return self.__animation_width
+
+    def setAnimationWidth(self, width: int):
+        """Set the animation width
+
+        :param width: new animation width
+        """
+
+        self.__animation_width = width
+
+    def getAnimationStrokeWidth(self) -> int:
+        """Get the current animation stroke width
+
+        :return: animation stroke width
+        """
+
+        return self.__animation_stroke_width
+
+    def setAnimationStrokeWidth(self, width: int):
+        """Set the animation stroke width
+
+        :param width: new animation stroke width
+        """
+
+        self.__animation_stroke_width = width
+        self.__update_pen()
+
+    def getAnimationColor(self) -> QColor:
+        """Get the current animation color
+
+        :return: animation color
+        """
+
+        return self.__animation_color
+
+    def setAnimationColor(self, color: QColor):
+        """Set the animation color
+
+        :param color: new animation color
+        """
+
+        self.__animation_color = QColor(color)
+        self.__update_pen()
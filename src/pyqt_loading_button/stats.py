@@ -0,0 +1,152 @@
+import math
+from collections import deque
+
+
+class LoadingButtonStats:
+
+    # Stats of all buttons with instrumentation enabled
+    __aggregate = None
+
+    def __init__(self, sample_size: int = 1000, parent: 'LoadingButtonStats' = None):
+        """Create a new LoadingButtonStats instance
+
+        :param sample_size: number of recent paint durations used for the average and percentile
+        :param parent: stats every recorded value also gets recorded in
+        """
+
+        # LoadingButtonStats attributes
+        self.__sample_size = sample_size
+        self.__parent = parent
+        self.reset()
+
+    @staticmethod
+    def getAggregate() -> 'LoadingButtonStats':
+        """Get the stats of all buttons with instrumentation enabled
+
+        :return: aggregate stats
+        """
+
+        if LoadingButtonStats.__aggregate is None:
+            LoadingButtonStats.__aggregate = LoadingButtonStats()
+        return LoadingButtonStats.__aggregate
+
+    def reset(self):
+        """Reset all counters"""
+
+        self.__frames_painted = 0
+        self.__paint_times = deque(maxlen=self.__sample_size)
+        self.__repaints_requested = 0
+        self.__action_count = 0
+        self.__action_time = 0.0
+        self.__queue_wait_time = 0.0
+
+    def recordPaint(self, duration: float):
+        """Record a painted frame
+
+        :param duration: time it took to paint the frame (in ms)
+        """
+
+        self.__frames_painted += 1
+        self.__paint_times.append(duration)
+        if self.__parent is not None:
+            self.__parent.recordPaint(duration)
+
+    def recordRepaintRequest(self):
+        """Record a requested repaint of the animation"""
+
+        self.__repaints_requested += 1
+        if self.__parent is not None:
+            self.__parent.recordRepaintRequest()
+
+    def recordAction(self, queue_wait_time: float, action_time: float):
+        """Record an executed action
+
+        :param queue_wait_time: time the action waited for a free thread (in ms)
+        :param action_time: wall time of the action (in ms)
+        """
+
+        self.__action_count += 1
+        self.__queue_wait_time += queue_wait_time
+        self.__action_time += action_time
+        if self.__parent is not None:
+            self.__parent.recordAction(queue_wait_time, action_time)
+
+    def getFramesPainted(self) -> int:
+        """Get the number of painted frames
+
+        :return: number of painted frames
+        """
+
+        return self.__frames_painted
+
+    def getRepaintsRequested(self) -> int:
+        """Get the number of repaints requested by the animation.
+        Qt merges requests that arrive before the next paint, so more repaints may be requested than delivered.
+
+        :return: number of requested repaints
+        """
+
+        return self.__repaints_requested
+
+    def getAveragePaintTime(self) -> float:
+        """Get the average time it took to paint the recent frames
+
+        :return: average paint time (in ms)
+        """
+
+        if not self.__paint_times:
+            return 0.0
+        return sum(self.__paint_times) / len(self.__paint_times)
+
+    def getPaintTimePercentile(self, percentile: float = 99) -> float:
+        """Get a percentile of the time it took to paint the recent frames
+
+        :param percentile: percentile between 0 and 100
+        :return: paint time percentile (in ms)
+        """
+
+        if not self.__paint_times:
+            return 0.0
+        paint_times = sorted(self.__paint_times)
+        index = max(0, math.ceil(percentile / 100 * len(paint_times)) - 1)
+        return paint_times[index]
+
+    def getActionCount(self) -> int:
+        """Get the number of executed actions
+
+        :return: number of executed actions
+        """
+
+        return self.__action_count
+
+    def getAverageActionTime(self) -> float:
+        """Get the average wall time of the executed actions
+
+        :return: average action time (in ms)
+        """
+
+        return self.__action_time / self.__action_count if self.__action_count else 0.0
+
+    def getAverageQueueWaitTime(self) -> float:
+        """Get the average time the executed actions waited for a free thread
+
+        :return: average queue wait time (in ms)
+        """
+
+        return self.__queue_wait_time / self.__action_count if self.__action_count else 0.0
+
+    def toDict(self) -> dict:
+        """Get all stats as a dictionary
+
+        :return: stats
+        """
+
+        return {
+            'frames_painted': self.getFramesPainted(),
+            'repaints_requested': self.getRepaintsRequested(),
+            'average_paint_time': self.getAveragePaintTime(),
+            'p99_paint_time': self.getPaintTimePercentile(99),
+            'action_count': self.getActionCount(),
+            'average_action_time': self.getAverageActionTime(),
+            'average_queue_wait_time': self.getAverageQueueWaitTime()
+        }
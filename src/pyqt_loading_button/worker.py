@@ -1,23 +1,418 @@
-from qtpy.QtCore import QThread, Signal
+import asyncio
+import inspect
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from qtpy.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal
+from .event_loop_thread import EventLoopThread
+from .execution_mode import ExecutionMode
 
 
-class Worker(QThread):
+class Worker(QObject):
 
-    # Event
+    # Events
+    started = Signal()
+    result = Signal(object)
+    error = Signal(Exception)
+    cancelled = Signal()
+    progress = Signal(float)
     finished = Signal()
 
-    def __init__(self, action: callable):
+    # Internal event telling the GUI thread that a new progress value is available
+    progressAvailable = Signal()
+
+    # Minimum time between two progress updates (in s)
+    __progress_interval = 1 / 60
+
+    # Thread pool shared by all workers that are not given a pool of their own
+    __default_thread_pool = None
+
+    # Event loop shared by all workers executing coroutine actions
+    __default_event_loop = None
+    __event_loop_thread = None
+
+    # Process pool shared by all workers executing actions in a separate process
+    __default_process_pool = None
+    __owns_default_process_pool = False
+
+    def __init__(self, action: callable, thread_pool: QThreadPool = None,
+                 execution_mode: ExecutionMode = ExecutionMode.Thread):
         """Create a new Worker instance
 
         :param action: action to be executed
+        :param thread_pool: thread pool the action gets executed in (default pool if None)
+        :param execution_mode: whether the action gets executed in a thread or a separate process
         """
 
         super(Worker, self).__init__()
 
         self.__action = action
+        self.__thread_pool = thread_pool
+        self.__execution_mode = execution_mode
+        self.__runnable = None
+        self.__process_pool = None
+        self.__thread_lock = threading.Lock()
+        self.__running_in_pool = False
+        self.__thread_released = False
+        self.__future = None
+        self.__cancelled = False
+        self.__progress_value = None
+        self.__progress_emitted_value = None
+        self.__progress_pending = False
+        self.__progress_time = 0.0
+        self.__submit_time = None
+        self.__start_time = None
+        self.__finish_time = None
+
+        self.progressAvailable.connect(self.__handle_progressAvailable)
+
+    @staticmethod
+    def getDefaultThreadPool() -> QThreadPool:
+        """Get the thread pool shared by all workers that are not given a pool of their own
+
+        :return: default thread pool
+        """
+
+        if Worker.__default_thread_pool is None:
+            Worker.__default_thread_pool = QThreadPool()
+            Worker.__default_thread_pool.setMaxThreadCount(min(32, QThread.idealThreadCount() + 4))
+        return Worker.__default_thread_pool
+
+    @staticmethod
+    def setDefaultThreadPool(thread_pool: QThreadPool):
+        """Set the thread pool shared by all workers that are not given a pool of their own
+
+        :param thread_pool: new default thread pool
+        """
+
+        Worker.__default_thread_pool = thread_pool
+
+    @staticmethod
+    def getDefaultEventLoop() -> asyncio.AbstractEventLoop:
+        """Get the event loop coroutine actions are scheduled on.
+        Unless set otherwise, this is a loop running in a single background thread.
+
+        :return: default event loop
+        """
+
+        if Worker.__default_event_loop is None:
+            Worker.__event_loop_thread = EventLoopThread()
+            Worker.__event_loop_thread.start()
+            Worker.__default_event_loop = Worker.__event_loop_thread.getLoop()
+        return Worker.__default_event_loop
+
+    @staticmethod
+    def setDefaultEventLoop(event_loop: asyncio.AbstractEventLoop):
+        """Set the event loop coroutine actions are scheduled on, e.g. a loop integrated
+        with the Qt event loop. The loop has to be running while actions are executed.
+
+        :param event_loop: new default event loop
+        """
+
+        Worker.__default_event_loop = event_loop
+
+    @staticmethod
+    def getDefaultProcessPool() -> Executor:
+        """Get the process pool actions with the process execution mode are executed in.
+        Unless set otherwise, this is a ProcessPoolExecutor with one process per CPU.
+
+        :return: default process pool
+        """
+
+        if Worker.__default_process_pool is None:
+            # Forking a process running Qt threads is unsafe, so new processes are always spawned
+            Worker.__default_process_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+            Worker.__owns_default_process_pool = True
+        return Worker.__default_process_pool
+
+    @staticmethod
+    def setDefaultProcessPool(process_pool: Executor):
+        """Set the process pool actions with the process execution mode are executed in
+
+        :param process_pool: new default process pool
+        """
+
+        Worker.__default_process_pool = process_pool
+        Worker.__owns_default_process_pool = False
+
+    def getThreadPool(self) -> QThreadPool:
+        """Get the thread pool the action gets executed in
+
+        :return: thread pool
+        """
+
+        return self.__thread_pool if self.__thread_pool is not None else Worker.getDefaultThreadPool()
+
+    def getExecutionMode(self) -> ExecutionMode:
+        """Get whether the action gets executed in a thread or a separate process
+
+        :return: execution mode
+        """
+
+        return self.__execution_mode
+
+    def isCoroutine(self) -> bool:
+        """Get whether the action is a coroutine function
+
+        :return: whether the action is a coroutine function
+        """
+
+        return inspect.iscoroutinefunction(self.__action)
+
+    def __get_arguments(self) -> dict:
+        """Get the keyword arguments the action accepts.
+        An action with an is_cancelled parameter receives a callable telling it whether it got cancelled,
+        an action with a progress parameter receives a callable to report its progress (0 to 1) with.
+        Neither is available to actions executed in a separate process.
+
+        :return: keyword arguments passed to the action
+        """
+
+        try:
+            parameters = inspect.signature(self.__action).parameters
+        except (TypeError, ValueError):
+            return {}
+
+        arguments = {}
+        if 'is_cancelled' in parameters:
+            arguments['is_cancelled'] = self.isCancelled
+        if 'progress' in parameters:
+            arguments['progress'] = self.reportProgress
+        return arguments
+
+    def start(self):
+        """Queues the action in the thread pool.
+        Coroutine functions are scheduled on the event loop instead and do not occupy a thread,
+        actions with the process execution mode are submitted to the process pool."""
+
+        self.__submit_time = time.perf_counter()
+        if self.isCoroutine():
+            self.__future = asyncio.run_coroutine_threadsafe(self.run_async(), Worker.getDefaultEventLoop())
+        elif self.__execution_mode == ExecutionMode.Process:
+            self.__process_pool = Worker.getDefaultProcessPool()
+            self.__future = self.__process_pool.submit(run_in_process, self.__action)
+            self.__future.add_done_callback(self.__handle_process_done)
+        else:
+            self.__runnable = WorkerRunnable(self)
+            self.getThreadPool().start(self.__runnable)
+
+    def cancel(self):
+        """Cancels the action.
+        Queued actions are removed from the pool, coroutines are cancelled at their next await
+        and running actions can check for cancellation through their is_cancelled parameter.
+        Actions already running in a separate process are left to finish, but their outcome is discarded."""
+
+        if self.__cancelled:
+            return
+        self.__cancelled = True
+
+        if self.__future is not None:
+            self.__future.cancel()
+        elif self.__runnable is not None and self.getThreadPool().tryTake(self.__runnable):
+            self.cancelled.emit()
+            self.finished.emit()
+
+    def abandon(self):
+        """Stops tracking an action that is stuck, e.g. because it exceeded its timeout.
+        The action gets cancelled and its outcome discarded. A thread still executing the action
+        no longer counts against the pool's maximum thread count until the action returns.
+        A process still executing the action cannot be freed, so if it belongs to the process pool
+        created by default, that pool is replaced with a new one and later actions are executed there.
+        Process pools set with setDefaultProcessPool() keep the process occupied until the action returns."""
+
+        self.cancel()
+        with self.__thread_lock:
+            if self.__running_in_pool and not self.__thread_released:
+                self.__thread_released = True
+                self.getThreadPool().releaseThread()
+
+        if self.__process_pool is not None and self.__future.running() and Worker.__owns_default_process_pool \
+                and self.__process_pool is Worker.__default_process_pool:
+            # Actions already submitted to the old pool are still executed, its processes exit afterwards
+            Worker.__default_process_pool = None
+            self.__process_pool.shutdown(wait=False)
+
+    def isCancelled(self) -> bool:
+        """Get whether the action got cancelled
+
+        :return: whether the action got cancelled
+        """
+
+        return self.__cancelled
+
+    def getQueueWaitTime(self) -> float:
+        """Get the time the action waited between being started and being executed
+
+        :return: queue wait time (in ms, None if the action has not been executed yet)
+        """
+
+        if self.__submit_time is None or self.__start_time is None:
+            return None
+        return (self.__start_time - self.__submit_time) * 1000
+
+    def getActionTime(self) -> float:
+        """Get the wall time of the action
+
+        :return: action time (in ms, None if the action has not finished yet)
+        """
+
+        if self.__start_time is None or self.__finish_time is None:
+            return None
+        return (self.__finish_time - self.__start_time) * 1000
+
+    def reportProgress(self, value: float):
+        """Report the progress of the action. Thread-safe and cheap enough to be called in tight loops,
+        since values are coalesced and only forwarded to the GUI thread at a limited rate.
+
+        :param value: progress between 0 and 1
+        """
+
+        self.__progress_value = value
+        if self.__progress_pending:
+            return
+
+        now = time.monotonic()
+        if now - self.__progress_time < Worker.__progress_interval:
+            return
+
+        self.__progress_time = now
+        self.__progress_pending = True
+        self.progressAvailable.emit()
+
+    def __flush_progress(self):
+        """Forwards the last reported progress value, even if it got throttled"""
+
+        if self.__progress_value is not None and not self.__progress_pending:
+            self.__progress_pending = True
+            self.progressAvailable.emit()
+
+    def __handle_progressAvailable(self):
+        """Emits the latest progress value in the GUI thread"""
+
+        self.__progress_pending = False
+        value = self.__progress_value
+        if value != self.__progress_emitted_value:
+            self.__progress_emitted_value = value
+            self.progress.emit(value)
 
     def run(self):
-        """Executes the specified action"""
+        """Executes the specified action.
+        Emits either result, error or cancelled and always emits finished afterwards."""
+
+        with self.__thread_lock:
+            self.__running_in_pool = True
+
+        self.__start_time = time.perf_counter()
+        self.started.emit()
+        try:
+            result = self.__action(**self.__get_arguments())
+        except Exception as exception:
+            self.__emit_outcome(error=exception)
+        else:
+            self.__emit_outcome(result=result)
+        finally:
+            self.__finish_time = time.perf_counter()
+            self.__return_thread()
+            self.__flush_progress()
+            self.finished.emit()
 
-        self.__action()
+    def __return_thread(self):
+        """Counts the thread against the pool's maximum thread count again if abandon() released it"""
+
+        with self.__thread_lock:
+            self.__running_in_pool = False
+            if self.__thread_released:
+                self.getThreadPool().reserveThread()
+
+    async def run_async(self):
+        """Awaits the specified coroutine action.
+        Emits either result, error or cancelled and always emits finished afterwards."""
+
+        self.__start_time = time.perf_counter()
+        self.started.emit()
+        try:
+            result = await self.__action(**self.__get_arguments())
+        except asyncio.CancelledError:
+            self.cancelled.emit()
+        except Exception as exception:
+            self.__emit_outcome(error=exception)
+        else:
+            self.__emit_outcome(result=result)
+        finally:
+            self.__finish_time = time.perf_counter()
+            self.__flush_progress()
+            self.finished.emit()
+
+    def __handle_process_done(self, future):
+        """Emits the outcome of an action executed in a separate process.
+        Called by the process pool once the action finished or its future got cancelled.
+
+        :param future: future of the submitted action
+        """
+
+        self.__finish_time = time.perf_counter()
+        if future.cancelled():
+            self.cancelled.emit()
+        elif future.exception() is not None:
+            # The action could not be executed, e.g. because it could not be pickled
+            self.__start_time = self.__submit_time
+            self.__emit_outcome(error=future.exception())
+        else:
+            start_time, finish_time, result, error = future.result()
+
+            # Timestamps of the other process are wall clock times
+            self.__start_time = self.__finish_time - (finish_time - start_time)
+            self.__submit_time = min(self.__submit_time, self.__start_time)
+            self.__emit_outcome(result=result, error=error)
         self.finished.emit()
+
+    def __emit_outcome(self, result: object = None, error: Exception = None):
+        """Emits the outcome of the action, unless it got cancelled
+
+        :param result: return value of the action
+        :param error: exception raised by the action
+        """
+
+        if self.__cancelled:
+            self.cancelled.emit()
+        elif error is not None:
+            self.error.emit(error)
+        else:
+            self.result.emit(result)
+
+
+def run_in_process(action: callable) -> tuple:
+    """Executes an action in a process of the process pool.
+    Exceptions are returned instead of raised, so the time the action took is still known.
+
+    :param action: action to be executed
+    :return: start time, finish time, return value and exception of the action
+    """
+
+    start_time = time.time()
+    try:
+        result = action()
+    except Exception as exception:
+        return start_time, time.time(), None, exception
+    return start_time, time.time(), result, None
+
+
+class WorkerRunnable(QRunnable):
+
+    def __init__(self, worker: Worker):
+        """Create a new WorkerRunnable instance
+
+        :param worker: worker to be run by the thread pool
+        """
+
+        super(WorkerRunnable, self).__init__()
+
+        # The worker keeps a reference, so the pool must not delete the runnable
+        self.setAutoDelete(False)
+        self.__worker = worker
+
+    def run(self):
+        """Runs the worker on a thread of the pool"""
+
+        self.__worker.run()
@@ -0,0 +1,154 @@
+import threading
+import time
+from src.pyqt_loading_button.action_cache import ActionCache
+from src.pyqt_loading_button.click_policy import ClickPolicy
+from src.pyqt_loading_button.loading_button import LoadingButton
+
+
+def test_get_set():
+    """Test storing and retrieving results"""
+
+    action_cache = ActionCache()
+    assert action_cache.get('key') == (False, None, False)
+
+    action_cache.set('key', 1)
+    assert action_cache.get('key') == (True, 1, False)
+    assert action_cache.getSize() == 1
+
+
+def test_key():
+    """Test that results are cached under the action unless a key function is given"""
+
+    def action():
+        pass
+
+    assert ActionCache().getKey(action) is action
+    assert ActionCache(key=lambda: 'key').getKey(action) == 'key'
+
+
+def test_maximum_size():
+    """Test that the least recently used result gets dropped once the cache is full"""
+
+    action_cache = ActionCache(maximum_size=2)
+    action_cache.set(1, 1)
+    action_cache.set(2, 2)
+    action_cache.get(1)
+    action_cache.set(3, 3)
+
+    assert action_cache.get(1)[0]
+    assert not action_cache.get(2)[0]
+    assert action_cache.get(3)[0]
+
+    action_cache.setMaximumSize(1)
+    assert action_cache.getMaximumSize() == 1
+    assert action_cache.getSize() == 1
+
+
+def test_time_to_live():
+    """Test that results expire and stale results are returned for the stale time"""
+
+    action_cache = ActionCache(time_to_live=50, stale_time=100)
+    action_cache.set('key', 1)
+    time.sleep(0.07)
+    assert action_cache.get('key') == (True, 1, True)
+    time.sleep(0.1)
+    assert action_cache.get('key') == (False, None, False)
+    assert action_cache.getSize() == 0
+
+
+def test_invalidate():
+    """Test removing single and all cached results"""
+
+    action_cache = ActionCache()
+    action_cache.set(1, 1)
+    action_cache.set(2, 2)
+
+    action_cache.invalidate(1)
+    assert not action_cache.get(1)[0]
+    assert action_cache.get(2)[0]
+
+    action_cache.invalidate()
+    assert action_cache.getSize() == 0
+
+
+def test_revalidation():
+    """Test that only one refresh per key runs at a time"""
+
+    action_cache = ActionCache()
+    assert action_cache.startRevalidation('key')
+    assert not action_cache.startRevalidation('key')
+    action_cache.finishRevalidation('key')
+    assert action_cache.startRevalidation('key')
+
+
+def test_cache_hit(qtbot):
+    """Test that a cached result completes the action without executing it"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    action_cache = ActionCache()
+    calls = []
+    loading_button.setAction(lambda: calls.append(True) or len(calls), action_cache)
+    assert loading_button.getActionCache() is action_cache
+
+    with qtbot.waitSignal(loading_button.finished, timeout=2000):
+        loading_button.clicked.emit()
+    assert calls == [True]
+
+    with qtbot.waitSignals([loading_button.result, loading_button.finished], timeout=2000) as blocker:
+        loading_button.clicked.emit()
+        assert not loading_button.isRunning()
+    assert blocker.all_signals_and_args[0].args[0] == 1
+    assert calls == [True]
+
+    action_cache.invalidate()
+    with qtbot.waitSignal(loading_button.finished, timeout=2000):
+        loading_button.clicked.emit()
+    assert calls == [True, True]
+
+
+def test_cache_hit_queued_click(qtbot):
+    """Test that a click queued while running completes from the cache without executing the action again"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.setClickPolicy(ClickPolicy.QueueLatest)
+    release = threading.Event()
+    calls, results, finished = [], [], []
+
+    def action():
+        calls.append(True)
+        release.wait()
+        return len(calls)
+
+    loading_button.setAction(action, ActionCache())
+    loading_button.result.connect(results.append)
+    loading_button.finished.connect(lambda: finished.append(True))
+
+    try:
+        loading_button.clicked.emit()
+        loading_button.clicked.emit()
+        assert loading_button.getQueuedClickCount() == 1
+    finally:
+        release.set()
+    qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=2000)
+    assert calls == [True]
+    assert results == [1, 1]
+    assert len(finished) == 2
+
+
+def test_stale_while_revalidate(qtbot):
+    """Test that a stale result completes the action and gets refreshed in the background"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    action_cache = ActionCache(time_to_live=0, stale_time=10000, key=lambda: 'key')
+    action_cache.set('key', 'stale')
+    loading_button.setAction(lambda: 'fresh', action_cache)
+
+    with qtbot.waitSignal(loading_button.result, timeout=2000) as blocker:
+        loading_button.clicked.emit()
+    assert blocker.args == ['stale']
+    assert not loading_button.isRunning()
+
+    qtbot.waitUntil(lambda: action_cache.get('key')[1] == 'fresh', timeout=2000)
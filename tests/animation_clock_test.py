@@ -0,0 +1,89 @@
+import time
+from PyQt6.QtTest import QTest
+from src.pyqt_loading_button.animation_clock import AnimationClock
+from src.pyqt_loading_button.loading_button import LoadingButton
+
+
+def test_shared_instance(qtbot):
+    """Test that all callers share the same clock"""
+
+    assert AnimationClock.instance() is AnimationClock.instance()
+
+
+def test_set_frame_rate(qtbot):
+    """Test setting the frame rate"""
+
+    clock = AnimationClock()
+    clock.setFrameRate(30)
+    assert clock.getFrameRate() == 30
+
+
+def test_subscribe_and_unsubscribe(qtbot):
+    """Test that the clock only runs while it has subscribers"""
+
+    clock = AnimationClock()
+    ticks = []
+
+    def subscriber(now):
+        ticks.append(now)
+
+    assert not clock.isActive()
+
+    clock.subscribe(subscriber)
+    assert clock.isActive()
+    assert clock.getSubscriberCount() == 1
+
+    QTest.qWait(100)
+    assert len(ticks) > 0
+
+    clock.unsubscribe(subscriber)
+    assert not clock.isActive()
+    assert clock.getSubscriberCount() == 0
+
+
+def test_running_buttons_share_clock(qtbot):
+    """Test that running buttons subscribe to the shared clock and idle buttons do not"""
+
+    clock = AnimationClock.instance()
+    buttons = [LoadingButton() for _ in range(3)]
+    for button in buttons:
+        qtbot.addWidget(button)
+        button.setAction(lambda: time.sleep(0.5))
+        button.show()
+
+    assert clock.getSubscriberCount() == 0
+
+    for button in buttons:
+        button.clicked.emit()
+    assert clock.getSubscriberCount() == 3
+    assert clock.isActive()
+
+    qtbot.waitUntil(lambda: not any(button.isRunning() for button in buttons), timeout=2000)
+    assert clock.getSubscriberCount() == 0
+    assert not clock.isActive()
+
+
+def test_hidden_button_suspends_animation(qtbot):
+    """Test that hidden buttons stop advancing their animation while the action keeps running"""
+
+    clock = AnimationClock.instance()
+    button = LoadingButton()
+    qtbot.addWidget(button)
+    button.setAction(lambda: time.sleep(0.5))
+
+    button.clicked.emit()
+    assert button.isRunning()
+    assert clock.getSubscriberCount() == 0
+
+    button.show()
+    assert clock.getSubscriberCount() == 1
+
+    button.hide()
+    assert clock.getSubscriberCount() == 0
+    assert button.isRunning()
+
+    button.show()
+    assert clock.getSubscriberCount() == 1
+
+    qtbot.waitUntil(lambda: not button.isRunning(), timeout=2000)
+    assert clock.getSubscriberCount() == 0
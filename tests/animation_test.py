@@ -0,0 +1,112 @@
+import pytest
+from PyQt6.QtCore import QEasingCurve
+from src.pyqt_loading_button.animation import (circle_cycle, circle_frame, dots_offsets, dots_offsets_many, ease, ease_many,
+                                               get_easing_table, get_handoff_progress)
+
+
+def test_dots_offsets_start():
+    """Test that all dots rest at the start of the animation"""
+
+    assert dots_offsets(0, 600, 3) == (0, 0, 0)
+
+
+def test_dots_offsets_handoff():
+    """Test that each dot starts once the previous one passed the hand-off threshold"""
+
+    handoff = get_handoff_progress(QEasingCurve.Type.InOutSine, 0.75)
+    assert abs(handoff - 2 / 3) < 0.001
+
+    offset_1, offset_2, offset_3 = dots_offsets(300, 600, 3)
+    assert offset_1 > 0
+    assert offset_2 == 0
+    assert offset_3 == 0
+
+    offset_1, offset_2, offset_3 = dots_offsets(600, 600, 3)
+    assert offset_1 == 3
+    assert offset_3 == 0
+
+    offset_1, offset_2, offset_3 = dots_offsets(800, 600, 3)
+    assert offset_2 > 0
+    assert offset_3 == 0
+
+
+def test_dots_offsets_loop():
+    """Test that the animation loops once the third dot is back down"""
+
+    cycle = 2 * 600 + 2 * 400
+    for elapsed in (0, 250, 700, 1400):
+        assert dots_offsets(elapsed, 600, 3) == dots_offsets(elapsed + cycle, 600, 3)
+
+
+def test_circle_frame_start():
+    """Test the circle at the start of the animation"""
+
+    assert circle_frame(0, 2000, 700) == (0, 280)
+
+
+def test_circle_frame_spans():
+    """Test that the span shrinks to the minimum and grows back to the maximum"""
+
+    assert circle_frame(700, 2000, 700)[1] == 30
+    assert circle_frame(1400, 2000, 700)[1] == 280
+    assert 30 < circle_frame(350, 2000, 700)[1] < 280
+
+
+def test_circle_frame_continuous():
+    """Test that the arc does not jump, not even where the span changes direction"""
+
+    previous_rotation, previous_span = circle_frame(0, 2000, 700)
+    for elapsed in range(1, 10000):
+        rotation, span = circle_frame(elapsed, 2000, 700)
+        rotation_change = (rotation - previous_rotation + 180) % 360 - 180
+        assert abs(rotation_change) < 5
+        assert abs(span - previous_span) < 5
+        previous_rotation, previous_span = rotation, span
+
+
+def test_circle_frame_deterministic():
+    """Test that frames only depend on the elapsed time"""
+
+    assert circle_frame(12345.6, 2000, 700) == circle_frame(12345.6, 2000, 700)
+    rotation, span = circle_frame(5000, 1000, 350)
+    assert (rotation, span) == circle_frame(10000, 2000, 700)
+
+
+def test_circle_cycle():
+    """Test that the circle repeats itself exactly after one cycle, but not after a single rotation"""
+
+    cycle = circle_cycle(2000, 700)
+    assert cycle == 126 * 2000
+    assert circle_frame(2000, 2000, 700) != circle_frame(0, 2000, 700)
+    for elapsed in (0, 500, 1234.5):
+        assert circle_frame(elapsed + cycle, 2000, 700) == pytest.approx(circle_frame(elapsed, 2000, 700))
+
+
+def test_easing_table_shared():
+    """Test that easing tables are built once per curve, duration and frame rate"""
+
+    table = get_easing_table(QEasingCurve.Type.InOutCubic, 700, 60)
+    assert get_easing_table(QEasingCurve.Type.InOutCubic, 700, 60) is table
+    assert get_easing_table(QEasingCurve.Type.InOutCubic, 700, 30) is not table
+    assert len(table) == 42 * 4 + 1
+
+
+def test_easing_table_values():
+    """Test that table lookups match the easing curve"""
+
+    curve = QEasingCurve(QEasingCurve.Type.InOutCubic)
+    table = get_easing_table(QEasingCurve.Type.InOutCubic, 700, 60)
+    assert ease(table, 0) == 0
+    assert ease(table, 1) == 1
+    for progress in (0.1, 0.25, 0.5, 0.8):
+        assert abs(ease(table, progress) - curve.valueForProgress(progress)) < 0.01
+
+    progress_values = [index / 100 for index in range(101)]
+    assert ease_many(table, progress_values) == [ease(table, progress) for progress in progress_values]
+
+
+def test_dots_offsets_many():
+    """Test that batched offsets match the offsets of single time values"""
+
+    elapsed_values = list(range(0, 3000, 37))
+    assert dots_offsets_many(elapsed_values, 600, 3) == [dots_offsets(elapsed, 600, 3) for elapsed in elapsed_values]
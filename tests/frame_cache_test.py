@@ -0,0 +1,59 @@
+from PyQt6.QtGui import QColor
+from src.pyqt_loading_button.frame_cache import FrameCache
+from src.pyqt_loading_button.loading_button import LoadingButton, AnimationType
+
+
+def test_shared_instance(qtbot):
+    """Test that all buttons share the same cache"""
+
+    assert FrameCache.instance() is FrameCache.instance()
+
+
+def test_atlas_reused(qtbot):
+    """Test that equal animation settings share a single atlas"""
+
+    frame_cache = FrameCache(frame_count=10)
+    atlas = frame_cache.getAtlas(AnimationType.Circle, 15, 3, QColor(0, 0, 0), 1.0)
+
+    assert not atlas.isNull()
+    assert atlas.width() == 10 * 18
+    assert frame_cache.getAtlas(AnimationType.Circle, 15, 3, QColor(0, 0, 0), 1.0) is atlas
+    assert frame_cache.getSize() == 1
+
+
+def test_lru_eviction(qtbot):
+    """Test that the least recently used atlas gets evicted"""
+
+    frame_cache = FrameCache(maximum_size=2, frame_count=10)
+    red = frame_cache.getAtlas(AnimationType.Dots, 15, 3, QColor(255, 0, 0), 1.0)
+    frame_cache.getAtlas(AnimationType.Dots, 15, 3, QColor(0, 255, 0), 1.0)
+    frame_cache.getAtlas(AnimationType.Dots, 15, 3, QColor(255, 0, 0), 1.0)
+    frame_cache.getAtlas(AnimationType.Dots, 15, 3, QColor(0, 0, 255), 1.0)
+
+    assert frame_cache.getSize() == 2
+    assert frame_cache.getAtlas(AnimationType.Dots, 15, 3, QColor(255, 0, 0), 1.0) is red
+
+    frame_cache.setMaximumSize(1)
+    assert frame_cache.getSize() == 1
+
+
+def test_frame_indices(qtbot):
+    """Test that frame indices stay within the atlas"""
+
+    frame_cache = FrameCache(frame_count=20)
+
+    assert frame_cache.getCircleFrameIndex(30) == 0
+    assert frame_cache.getCircleFrameIndex(280) == 19
+    for elapsed in range(0, 5000, 37):
+        assert 0 <= frame_cache.getDotsFrameIndex(elapsed, 600) < 20
+
+
+def test_set_frame_cache_enabled(qtbot):
+    """Test enabling the frame cache on a button"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+
+    assert not loading_button.isFrameCacheEnabled()
+    loading_button.setFrameCacheEnabled(True)
+    assert loading_button.isFrameCacheEnabled()
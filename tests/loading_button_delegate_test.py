@@ -0,0 +1,96 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QStandardItemModel, QStandardItem
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QTableView
+from src.pyqt_loading_button.animation_type import AnimationType
+from src.pyqt_loading_button.loading_button_delegate import LoadingButtonDelegate
+
+
+def create_view(qtbot, rows: int = 1000) -> tuple:
+    """Create a table view using the delegate for all of its cells"""
+
+    model = QStandardItemModel(rows, 1)
+    for row in range(rows):
+        model.setItem(row, 0, QStandardItem('Sync'))
+
+    view = QTableView()
+    qtbot.addWidget(view)
+    delegate = LoadingButtonDelegate(view)
+    view.setItemDelegate(delegate)
+    view.setModel(model)
+    view.resize(200, 300)
+    view.show()
+    qtbot.waitExposed(view)
+    return view, model, delegate
+
+
+def test_initial_values(qtbot):
+    """Test initial values after instantiating"""
+
+    delegate = LoadingButtonDelegate()
+    assert delegate.getRunningRole() == LoadingButtonDelegate.RunningRole
+    assert delegate.getStartTimeRole() == LoadingButtonDelegate.StartTimeRole
+    assert delegate.getAnimationType() == AnimationType.Circle
+    assert delegate.getAnimationSpeed() == 2000
+    assert delegate.getAnimationWidth() == 15
+    assert delegate.getAnimationStrokeWidth() == 3
+    assert delegate.getAnimationColor() == QColor(0, 0, 0)
+
+
+def test_set_running(qtbot):
+    """Test that the running state is stored in the model"""
+
+    view, model, delegate = create_view(qtbot, 10)
+    index = model.index(3, 0)
+
+    delegate.setRunning(index, True)
+    assert delegate.isRunning(index)
+    assert model.data(index, LoadingButtonDelegate.StartTimeRole) is not None
+
+    delegate.setRunning(index, False)
+    assert not delegate.isRunning(index)
+
+
+def test_only_visible_cells_animated(qtbot):
+    """Test that only running cells that are visible get repainted on every frame"""
+
+    view, model, delegate = create_view(qtbot)
+    for row in (0, 1, 900):
+        delegate.setRunning(model.index(row, 0), True)
+
+    qtbot.waitUntil(lambda: delegate.getAnimatedCellCount() == 2, timeout=2000)
+
+    view.scrollTo(model.index(900, 0))
+    qtbot.waitUntil(lambda: delegate.getAnimatedCellCount() == 1, timeout=2000)
+
+    delegate.setRunning(model.index(900, 0), False)
+    qtbot.waitUntil(lambda: delegate.getAnimatedCellCount() == 0, timeout=2000)
+
+
+def test_paint_animation_types(qtbot):
+    """Test painting running cells with both animation types"""
+
+    view, model, delegate = create_view(qtbot, 5)
+    delegate.setRunning(model.index(0, 0), True)
+
+    for animation_type in (AnimationType.Circle, AnimationType.Dots):
+        delegate.setAnimationType(animation_type)
+        delegate.setAnimationColor(QColor(255, 0, 0))
+        view.viewport().repaint()
+        assert not view.grab().isNull()
+
+
+def test_clicked(qtbot):
+    """Test that clicking a cell that is not running emits clicked"""
+
+    view, model, delegate = create_view(qtbot, 5)
+    index = model.index(2, 0)
+    position = view.visualRect(index).center()
+
+    with qtbot.waitSignal(delegate.clicked, timeout=1000) as blocker:
+        QTest.mouseClick(view.viewport(), Qt.MouseButton.LeftButton, pos=position)
+    assert blocker.args[0].row() == 2
+
+    delegate.setRunning(index, True)
+    with qtbot.assertNotEmitted(delegate.clicked):
+        QTest.mouseClick(view.viewport(), Qt.MouseButton.LeftButton, pos=position)
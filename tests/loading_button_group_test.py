@@ -0,0 +1,164 @@
+import threading
+from src.pyqt_loading_button.loading_button import LoadingButton
+from src.pyqt_loading_button.loading_button_group import LoadingButtonGroup
+
+
+def create_buttons(qtbot, group: LoadingButtonGroup, count: int) -> list:
+    """Create buttons and add them to the group"""
+
+    buttons = []
+    for _ in range(count):
+        loading_button = LoadingButton()
+        qtbot.addWidget(loading_button)
+        group.addButton(loading_button)
+        buttons.append(loading_button)
+    return buttons
+
+
+def test_add_remove_button(qtbot):
+    """Test adding buttons to and removing them from a group"""
+
+    group = LoadingButtonGroup()
+    loading_button_1, loading_button_2 = create_buttons(qtbot, group, 2)
+    assert group.getButtons() == [loading_button_1, loading_button_2]
+    assert loading_button_1.getGroup() is group
+
+    loading_button_1.setGroup(None)
+    assert group.getButtons() == [loading_button_2]
+    assert loading_button_1.getGroup() is None
+
+    group.removeButton(loading_button_2)
+    assert group.getButtons() == []
+    assert loading_button_2.getGroup() is None
+
+
+def test_maximum_concurrency(qtbot):
+    """Test that queued buttons keep waiting until a slot is free"""
+
+    group = LoadingButtonGroup(2)
+    release = threading.Event()
+    buttons = create_buttons(qtbot, group, 3)
+    for loading_button in buttons:
+        loading_button.setAction(release.wait)
+        loading_button.clicked.emit()
+
+    assert all(loading_button.isRunning() for loading_button in buttons)
+    assert [loading_button.isWaiting() for loading_button in buttons] == [False, False, True]
+    assert group.getRunningCount() == 2
+    assert group.getQueuedCount() == 1
+
+    release.set()
+    qtbot.waitUntil(lambda: not any(loading_button.isRunning() for loading_button in buttons), timeout=2000)
+    assert group.getRunningCount() == 0
+
+
+def test_add_button_priority(qtbot):
+    """Test that the priority passed when adding a button is kept"""
+
+    group = LoadingButtonGroup()
+    other_group = LoadingButtonGroup()
+    loading_button_1, loading_button_2 = LoadingButton(), LoadingButton()
+    qtbot.addWidget(loading_button_1)
+    qtbot.addWidget(loading_button_2)
+
+    group.addButton(loading_button_1, priority=5)
+    group.addButton(loading_button_2)
+    assert group.getPriority(loading_button_1) == 5
+    assert group.getPriority(loading_button_2) == 0
+
+    other_group.addButton(loading_button_1, priority=3)
+    assert loading_button_1.getGroup() is other_group
+    assert other_group.getPriority(loading_button_1) == 3
+    assert group.getButtons() == [loading_button_2]
+
+
+def test_priority(qtbot):
+    """Test that queued buttons with a higher priority get executed first"""
+
+    group = LoadingButtonGroup()
+    release = threading.Event()
+    calls = []
+    loading_button_1, loading_button_2, loading_button_3 = create_buttons(qtbot, group, 3)
+    group.setPriority(loading_button_3, 1)
+    assert group.getPriority(loading_button_3) == 1
+
+    loading_button_1.setAction(release.wait)
+    loading_button_2.setAction(lambda: calls.append(2))
+    loading_button_3.setAction(lambda: calls.append(3))
+    for loading_button in (loading_button_1, loading_button_2, loading_button_3):
+        loading_button.clicked.emit()
+
+    release.set()
+    qtbot.waitUntil(lambda: not loading_button_2.isRunning(), timeout=2000)
+    assert calls == [3, 2]
+
+
+def test_cancel_waiting(qtbot):
+    """Test that cancelling a waiting button removes it from the queue"""
+
+    group = LoadingButtonGroup()
+    release = threading.Event()
+    calls = []
+    loading_button_1, loading_button_2 = create_buttons(qtbot, group, 2)
+    loading_button_1.setAction(release.wait)
+    loading_button_2.setAction(lambda: calls.append(True))
+    loading_button_1.clicked.emit()
+    loading_button_2.clicked.emit()
+
+    with qtbot.waitSignals([loading_button_2.cancelled, loading_button_2.finished], timeout=2000):
+        loading_button_2.cancel()
+    assert not loading_button_2.isWaiting()
+    assert group.getQueuedCount() == 0
+
+    release.set()
+    qtbot.waitUntil(lambda: not loading_button_1.isRunning(), timeout=2000)
+    assert calls == []
+
+
+def test_batch_action(qtbot):
+    """Test that queued buttons with a batch argument get executed in a single call"""
+
+    group = LoadingButtonGroup()
+    release = threading.Event()
+    batches = []
+
+    def batch_action(arguments):
+        batches.append(arguments)
+        return [argument * 2 for argument in arguments]
+
+    group.setBatchAction(batch_action)
+    loading_button_1, loading_button_2, loading_button_3 = create_buttons(qtbot, group, 3)
+    loading_button_1.setAction(release.wait)
+    group.setBatchArgument(loading_button_2, 2)
+    group.setBatchArgument(loading_button_3, 3)
+    assert group.getBatchArgument(loading_button_3) == 3
+
+    results = []
+    for loading_button in (loading_button_2, loading_button_3):
+        loading_button.setAction(lambda: None)
+        loading_button.result.connect(results.append)
+    for loading_button in (loading_button_1, loading_button_2, loading_button_3):
+        loading_button.clicked.emit()
+
+    release.set()
+    qtbot.waitUntil(lambda: not loading_button_2.isRunning() and not loading_button_3.isRunning(), timeout=2000)
+    assert batches == [[2, 3]]
+    assert sorted(results) == [4, 6]
+
+
+def test_batch_action_error(qtbot):
+    """Test that an exception raised by the batch action is emitted by every batched button"""
+
+    group = LoadingButtonGroup()
+    group.setBatchAction(lambda arguments: [])
+    loading_button_1, loading_button_2 = create_buttons(qtbot, group, 2)
+    errors = []
+    for index, loading_button in enumerate((loading_button_1, loading_button_2)):
+        group.setBatchArgument(loading_button, index)
+        loading_button.setAction(lambda: None)
+        loading_button.error.connect(errors.append)
+        loading_button.clicked.emit()
+
+    qtbot.waitUntil(lambda: not loading_button_1.isRunning() and not loading_button_2.isRunning(), timeout=2000)
+    assert len(errors) == 2
+    assert all(isinstance(error, ValueError) for error in errors)
@@ -1,9 +1,11 @@
+import threading
 import time
-from PyQt6.QtCore import QRect
+from PyQt6.QtCore import QRect, QThreadPool
 from PyQt6.QtGui import QColor, QPaintEvent
 from PyQt6.QtTest import QTest
 from pytestqt.qt_compat import qt_api
 from src.pyqt_loading_button.loading_button import LoadingButton, AnimationType
+from src.pyqt_loading_button.click_policy import ClickPolicy
 
 
 def test_initial_values(qtbot):
@@ -130,3 +132,413 @@ def test_click_event_dots(qtbot):
 
     QTest.qWait(2250)
     assert not loading_button.isRunning()
+
+
+def test_paint_while_running_styled(qtbot):
+    """Test painting the cached background and the animation of a styled button"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.setStyleSheet('background: #23395d; border-radius: 5px;')
+    loading_button.resize(110, 30)
+    loading_button.show()
+
+    loading_button.setAction(lambda: time.sleep(0.5))
+    loading_button.clicked.emit()
+
+    for animation_type in (AnimationType.Circle, AnimationType.Dots):
+        loading_button.setAnimationType(animation_type)
+        QTest.qWait(100)
+        assert not loading_button.grab().isNull()
+
+    qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=2000)
+
+
+def test_geometry_follows_size_and_settings(qtbot):
+    """Test that the cached geometry and pen get recomputed after resizing and changing settings"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.setStyleSheet('background: #ffffff; border: none;')
+    loading_button.resize(110, 30)
+    loading_button.show()
+
+    release = threading.Event()
+    loading_button.setAction(release.wait)
+    loading_button.clicked.emit()
+    QTest.qWait(50)
+
+    def get_colored_columns(color: QColor) -> list:
+        image = loading_button.grab().toImage()
+        return [x for x in range(image.width()) for y in range(image.height())
+                if image.pixelColor(x, y) == color]
+
+    try:
+        loading_button.setAnimationColor(QColor(255, 0, 0))
+        loading_button.setAnimationStrokeWidth(4)
+        columns = get_colored_columns(QColor(255, 0, 0))
+        assert columns and abs((min(columns) + max(columns)) / 2 - 55) < 10
+
+        loading_button.resize(210, 30)
+        columns = get_colored_columns(QColor(255, 0, 0))
+        assert columns and abs((min(columns) + max(columns)) / 2 - 105) < 10
+    finally:
+        release.set()
+    qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=2000)
+
+
+def test_result(qtbot):
+    """Test that the return value of the action gets emitted"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.setAction(lambda: 42)
+
+    with qtbot.waitSignal(loading_button.result, timeout=2000) as blocker:
+        loading_button.clicked.emit()
+    assert blocker.args == [42]
+
+    qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=2000)
+
+
+def test_error(qtbot):
+    """Test that an exception raised by the action stops the animation"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+
+    def action():
+        raise ValueError('Test')
+
+    loading_button.setAction(action)
+
+    with qtbot.waitSignals([loading_button.error, loading_button.finished], timeout=2000) as blocker:
+        loading_button.clicked.emit()
+    assert isinstance(blocker.all_signals_and_args[0].args[0], ValueError)
+    assert not loading_button.isRunning()
+
+
+def test_cancel(qtbot):
+    """Test cancelling a running action"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    checks = []
+
+    def action(is_cancelled):
+        checks.append(False)
+        while not is_cancelled():
+            time.sleep(0.01)
+        checks.append(True)
+        return 'ignored'
+
+    loading_button.setAction(action)
+    loading_button.clicked.emit()
+    assert loading_button.isRunning()
+    qtbot.waitUntil(lambda: checks == [False], timeout=2000)
+
+    with qtbot.waitSignals([loading_button.cancelled, loading_button.finished], timeout=2000):
+        loading_button.cancel()
+    assert not loading_button.isRunning()
+
+    results = []
+    loading_button.result.connect(results.append)
+    qtbot.waitUntil(lambda: checks == [False, True], timeout=2000)
+    QTest.qWait(50)
+    assert results == []
+
+
+def test_progress(qtbot):
+    """Test that progress reported by the action is coalesced and ends with the last value"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    values = []
+    loading_button.progress.connect(values.append)
+
+    def action(progress):
+        for i in range(100001):
+            progress(i / 100000)
+
+    loading_button.setAction(action)
+    assert loading_button.getProgress() is None
+
+    with qtbot.waitSignal(loading_button.finished, timeout=5000):
+        loading_button.clicked.emit()
+
+    assert 0 < len(values) < 1000
+    assert values == sorted(values)
+    assert values[-1] == 1.0
+    assert loading_button.getProgress() == 1.0
+
+
+def test_set_click_policy(qtbot):
+    """Test setting the click policy settings"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+
+    assert loading_button.getClickPolicy() == ClickPolicy.Drop
+    loading_button.setClickPolicy(ClickPolicy.QueueAll)
+    loading_button.setClickQueueDepth(3)
+    loading_button.setClickInterval(100)
+    assert loading_button.getClickPolicy() == ClickPolicy.QueueAll
+    assert loading_button.getClickQueueDepth() == 3
+    assert loading_button.getClickInterval() == 100
+
+
+def run_clicks(qtbot, loading_button, clicks, delay=0):
+    """Click the button several times and count how often the action gets executed"""
+
+    calls = []
+    loading_button.setAction(lambda: (calls.append(True), time.sleep(0.2)))
+    for _ in range(clicks):
+        loading_button.clicked.emit()
+        QTest.qWait(delay)
+    QTest.qWait(50)
+    qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=5000)
+    return len(calls)
+
+
+def test_click_policy_drop(qtbot):
+    """Test that clicks while running are dropped"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+
+    assert run_clicks(qtbot, loading_button, 5) == 1
+
+
+def test_click_policy_queue_latest(qtbot):
+    """Test that clicks while running are coalesced into a single follow-up run"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.setClickPolicy(ClickPolicy.QueueLatest)
+
+    assert run_clicks(qtbot, loading_button, 5) == 2
+
+
+def test_click_policy_queue_all(qtbot):
+    """Test that clicks while running are queued up to the queue depth"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.setClickPolicy(ClickPolicy.QueueAll)
+    loading_button.setClickQueueDepth(2)
+
+    assert run_clicks(qtbot, loading_button, 5) == 3
+
+
+def test_cancel_queued(qtbot):
+    """Test that cancelling an action still queued in a saturated thread pool emits finished once"""
+
+    thread_pool = QThreadPool()
+    thread_pool.setMaxThreadCount(1)
+    release = threading.Event()
+    loading_button_1, loading_button_2 = LoadingButton(), LoadingButton()
+    qtbot.addWidget(loading_button_1)
+    qtbot.addWidget(loading_button_2)
+    finished = []
+    loading_button_2.finished.connect(lambda: finished.append(True))
+    for loading_button in (loading_button_1, loading_button_2):
+        loading_button.setThreadPool(thread_pool)
+        loading_button.setAction(release.wait)
+        loading_button.clicked.emit()
+
+    try:
+        with qtbot.waitSignal(loading_button_2.cancelled, timeout=2000):
+            loading_button_2.cancel()
+        assert not loading_button_2.isRunning()
+        qtbot.wait(50)
+        assert finished == [True]
+    finally:
+        release.set()
+    assert thread_pool.waitForDone(2000)
+
+
+def test_click_policy_debounce(qtbot):
+    """Test that a burst of clicks only runs the action once"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.setClickPolicy(ClickPolicy.Debounce)
+    loading_button.setClickInterval(100)
+
+    calls = []
+    loading_button.setAction(lambda: calls.append(True))
+    for _ in range(5):
+        loading_button.clicked.emit()
+        QTest.qWait(20)
+    assert calls == []
+
+    qtbot.waitUntil(lambda: calls == [True], timeout=2000)
+    QTest.qWait(200)
+    assert calls == [True]
+
+
+def test_click_policy_debounce_while_running(qtbot):
+    """Test that a debounced click made while running runs the action once more afterwards"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.setClickPolicy(ClickPolicy.Debounce)
+    loading_button.setClickInterval(10)
+    release = threading.Event()
+    calls = []
+
+    def action():
+        calls.append(True)
+        if len(calls) == 1:
+            release.wait()
+
+    loading_button.setAction(action)
+    try:
+        loading_button.clicked.emit()
+        qtbot.waitUntil(lambda: calls == [True], timeout=2000)
+        loading_button.clicked.emit()
+        QTest.qWait(50)
+        assert loading_button.getQueuedClickCount() == 1
+    finally:
+        release.set()
+
+    qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=2000)
+    assert calls == [True, True]
+
+
+def test_click_policy_throttle(qtbot):
+    """Test that clicks within the interval of the last run are dropped"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.setClickPolicy(ClickPolicy.Throttle)
+    loading_button.setClickInterval(1000)
+
+    assert run_clicks(qtbot, loading_button, 1) == 1
+    assert run_clicks(qtbot, loading_button, 1) == 0
+
+
+def test_switch_animation_type_while_running(qtbot):
+    """Test that a running animation migrates to a new animation type"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.resize(110, 30)
+    loading_button.show()
+    loading_button.setAnimationType(AnimationType.Dots)
+    loading_button.setAction(lambda: time.sleep(0.6))
+    loading_button.clicked.emit()
+
+    QTest.qWait(100)
+    loading_button.setAnimationType(AnimationType.Circle)
+    QTest.qWait(100)
+    assert not loading_button.grab().isNull()
+    loading_button.setAnimationSpeed(500)
+    loading_button.setAnimationType(AnimationType.Dots)
+    QTest.qWait(100)
+    assert not loading_button.grab().isNull()
+
+    qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=2000)
+
+
+def test_set_maximum_frame_rate(qtbot):
+    """Test setting the maximum frame rate"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+
+    assert loading_button.getMaximumFrameRate() == 0
+    loading_button.setMaximumFrameRate(30)
+    assert loading_button.getMaximumFrameRate() == 30
+
+
+def test_adaptive_quality(qtbot):
+    """Test that the quality gets reduced under load and restored once the load drops"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.resize(110, 30)
+    loading_button.show()
+
+    assert not loading_button.isAdaptiveQualityEnabled()
+    loading_button.setAdaptiveQualityEnabled(True)
+    loading_button.setAdaptiveQualityThresholds(0, 0)
+    assert loading_button.getAdaptiveQualityThresholds() == (0, 0)
+
+    loading_button.setAction(lambda: time.sleep(1))
+    loading_button.clicked.emit()
+    qtbot.waitUntil(loading_button.isReducedQuality, timeout=1000)
+
+    loading_button.setAdaptiveQualityThresholds(1000, 1000)
+    qtbot.waitUntil(lambda: not loading_button.isReducedQuality(), timeout=1000)
+
+    qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=2000)
+
+
+def test_timeout(qtbot):
+    """Test that an action exceeding the timeout stops the animation and emits timeout and finished"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    release = threading.Event()
+    loading_button.setAction(release.wait)
+    loading_button.setTimeout(50)
+    assert loading_button.getTimeout() == 50
+
+    try:
+        with qtbot.waitSignals([loading_button.timeout, loading_button.finished], timeout=2000):
+            loading_button.clicked.emit()
+        assert not loading_button.isRunning()
+    finally:
+        release.set()
+
+
+def test_timeout_queued(qtbot):
+    """Test that an action still queued in a saturated thread pool times out like a running one"""
+
+    thread_pool = QThreadPool()
+    thread_pool.setMaxThreadCount(1)
+    release = threading.Event()
+    loading_button_1, loading_button_2 = LoadingButton(), LoadingButton()
+    qtbot.addWidget(loading_button_1)
+    qtbot.addWidget(loading_button_2)
+    for loading_button in (loading_button_1, loading_button_2):
+        loading_button.setThreadPool(thread_pool)
+        loading_button.setAction(release.wait)
+    loading_button_2.setTimeout(50)
+    finished = []
+    loading_button_2.finished.connect(lambda: finished.append(True))
+
+    try:
+        loading_button_1.clicked.emit()
+        with qtbot.waitSignal(loading_button_2.timeout, timeout=2000):
+            loading_button_2.clicked.emit()
+        assert not loading_button_2.isRunning()
+        qtbot.wait(50)
+        assert finished == [True]
+    finally:
+        release.set()
+    assert thread_pool.waitForDone(2000)
+
+
+def test_default_timeout(qtbot):
+    """Test that buttons without a timeout of their own use the default timeout"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    release = threading.Event()
+    loading_button.setAction(release.wait)
+    assert LoadingButton.getDefaultTimeout() == 0
+    assert loading_button.getEffectiveTimeout() == 0
+
+    LoadingButton.setDefaultTimeout(50)
+    try:
+        assert loading_button.getEffectiveTimeout() == 50
+        loading_button.setTimeout(100)
+        assert loading_button.getEffectiveTimeout() == 100
+        loading_button.setTimeout(0)
+        with qtbot.waitSignal(loading_button.timeout, timeout=2000):
+            loading_button.clicked.emit()
+    finally:
+        LoadingButton.setDefaultTimeout(0)
+        release.set()
@@ -0,0 +1,142 @@
+import threading
+import time
+from src.pyqt_loading_button.loading_button import LoadingButton
+from src.pyqt_loading_button.pipeline import Pipeline
+
+
+def test_add_stage():
+    """Test adding stages with and without a name"""
+
+    def fetch():
+        pass
+
+    pipeline = Pipeline([fetch])
+    pipeline.addStage(lambda item: item, 'transform')
+    assert pipeline.getStages() == ['fetch', 'transform']
+    assert pipeline.getStageCount() == 2
+
+
+def test_single_values():
+    """Test that stages returning single values pass them on and return the last one"""
+
+    pipeline = Pipeline([lambda: 2, lambda item: item * 3, lambda item: item + 1])
+    assert pipeline() == 7
+    assert len(pipeline.getStageTimes()) == 3
+
+
+def test_streaming():
+    """Test that generator stages stream every item to the next stage before producing the next one"""
+
+    events = []
+
+    def fetch():
+        for item in range(3):
+            events.append(('fetch', item))
+            yield item
+
+    def transform(item):
+        events.append(('transform', item))
+        return item * 10
+
+    def split(item):
+        yield item
+        yield item + 1
+
+    pipeline = Pipeline([fetch, transform, split])
+    assert pipeline() == [0, 1, 10, 11, 20, 21]
+    assert events[:3] == [('fetch', 0), ('transform', 0), ('fetch', 1)]
+
+
+def test_cancel():
+    """Test that a cancelled pipeline stops before the next item"""
+
+    processed = []
+    cancelled = threading.Event()
+
+    def process(item):
+        processed.append(item)
+        cancelled.set()
+
+    pipeline = Pipeline([lambda: (item for item in range(10)), process])
+    pipeline(is_cancelled=cancelled.is_set)
+    assert processed == [0]
+
+
+def test_stage_signals(qtbot):
+    """Test that stageChanged reports the latest stage and stageFinished reports the time of every stage"""
+
+    pipeline = Pipeline([lambda: (item for item in range(3)), lambda item: item])
+    changed = []
+    finished = []
+    pipeline.stageChanged.connect(lambda index, name: changed.append(index))
+    pipeline.stageFinished.connect(lambda index, name, stage_time: finished.append((index, stage_time >= 0)))
+
+    pipeline()
+    assert changed[0] == 0
+    assert finished == [(0, True), (1, True)]
+
+
+def test_stage_signals_coalesced(qtbot):
+    """Test that streaming many items only emits stageChanged at a limited rate"""
+
+    pipeline = Pipeline([lambda: (item for item in range(10000)), lambda item: item])
+    changed = []
+    pipeline.stageChanged.connect(lambda index, name: changed.append(index))
+
+    pipeline()
+    qtbot.wait(100)
+    assert 1 <= len(changed) <= 20
+    assert all(index != previous for previous, index in zip(changed, changed[1:]))
+
+
+def test_stage_signals_current_stage(qtbot):
+    """Test that the stage doing the work is shown once streaming stages hand items back and forth"""
+
+    release = threading.Event()
+
+    def fetch():
+        yield 1
+        release.wait()
+        yield 2
+
+    def transform(item):
+        time.sleep(0.05)
+        return item
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    pipeline = Pipeline([fetch, transform, lambda item: item])
+    changed = []
+    pipeline.stageChanged.connect(lambda index, name: changed.append(name))
+    loading_button.setAction(pipeline)
+
+    try:
+        loading_button.clicked.emit()
+        qtbot.waitUntil(lambda: 'transform' in changed and loading_button.toolTip() == 'fetch', timeout=2000)
+    finally:
+        release.set()
+    qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=2000)
+
+
+def test_pipeline_button(qtbot):
+    """Test that a button executes a pipeline and shows its current stage as tool tip"""
+
+    release = threading.Event()
+
+    def wait():
+        release.wait()
+        return 'data'
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.setToolTip('Sync')
+    loading_button.setAction(Pipeline([wait, str.upper]))
+
+    with qtbot.waitSignal(loading_button.result, timeout=2000) as blocker:
+        loading_button.clicked.emit()
+        qtbot.waitUntil(lambda: loading_button.toolTip() == 'wait', timeout=2000)
+        release.set()
+    assert blocker.args == ['DATA']
+
+    qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=2000)
+    assert loading_button.toolTip() == 'Sync'
@@ -0,0 +1,133 @@
+import threading
+from src.pyqt_loading_button.loading_button import LoadingButton
+from src.pyqt_loading_button.retry_policy import RetryPolicy
+
+
+def test_should_retry():
+    """Test the maximum attempts and the retryable exception filter"""
+
+    retry_policy = RetryPolicy(maximum_attempts=3, retryable=(ConnectionError, TimeoutError))
+    assert retry_policy.shouldRetry(1, ConnectionError())
+    assert retry_policy.shouldRetry(2, TimeoutError())
+    assert not retry_policy.shouldRetry(3, ConnectionError())
+    assert not retry_policy.shouldRetry(1, ValueError())
+
+    retry_policy.setRetryable(lambda error: 'transient' in str(error))
+    assert retry_policy.shouldRetry(1, ValueError('transient'))
+    assert not retry_policy.shouldRetry(1, ValueError('permanent'))
+
+
+def test_delay():
+    """Test that the delay grows exponentially up to the maximum delay and stays within the jitter"""
+
+    retry_policy = RetryPolicy(initial_delay=100, multiplier=2, maximum_delay=300, jitter=0)
+    assert [retry_policy.getDelay(attempt) for attempt in range(1, 5)] == [100, 200, 300, 300]
+
+    retry_policy.setJitter(0.5)
+    delays = [retry_policy.getDelay(2) for _ in range(100)]
+    assert all(100 <= delay <= 200 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retry_action(qtbot):
+    """Test that a failing action gets executed again while the animation keeps running"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    calls = []
+
+    def action():
+        calls.append(True)
+        if len(calls) < 3:
+            raise ConnectionError()
+        return len(calls)
+
+    results, errors, attempts = [], [], []
+    loading_button.result.connect(results.append)
+    loading_button.error.connect(errors.append)
+    loading_button.retrying.connect(lambda attempt, delay: attempts.append(attempt))
+    loading_button.setRetryPolicy(RetryPolicy(initial_delay=10, jitter=0))
+    loading_button.setAction(action)
+
+    with qtbot.waitSignal(loading_button.retrying, timeout=2000):
+        loading_button.clicked.emit()
+    assert loading_button.isRunning()
+    qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=2000)
+    assert attempts == [2, 3]
+    assert results == [3]
+    assert errors == []
+
+
+def test_retry_exhausted(qtbot):
+    """Test that the error of the last attempt and non-retryable errors get emitted"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    calls = []
+
+    def action():
+        calls.append(True)
+        raise ConnectionError()
+
+    loading_button.setRetryPolicy(RetryPolicy(maximum_attempts=2, initial_delay=10))
+    loading_button.setAction(action)
+    with qtbot.waitSignals([loading_button.error, loading_button.finished], timeout=2000):
+        loading_button.clicked.emit()
+    assert len(calls) == 2
+
+    loading_button.getRetryPolicy().setRetryable(TimeoutError)
+    with qtbot.waitSignal(loading_button.error, timeout=2000):
+        loading_button.clicked.emit()
+    assert len(calls) == 3
+
+
+def test_retry_timeout(qtbot):
+    """Test that timeouts are retried as TimeoutError and share the attempts with failed attempts"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    release = threading.Event()
+    calls, results, attempts = [], [], []
+
+    def action():
+        calls.append(True)
+        if len(calls) == 1:
+            release.wait()
+        elif len(calls) == 2:
+            raise ConnectionError()
+        return len(calls)
+
+    loading_button.result.connect(results.append)
+    loading_button.retrying.connect(lambda attempt, delay: attempts.append(attempt))
+    loading_button.setRetryPolicy(RetryPolicy(initial_delay=10, retryable=(TimeoutError, ConnectionError)))
+    loading_button.setTimeout(50)
+    loading_button.setAction(action)
+    try:
+        with qtbot.waitSignals([loading_button.timeout, loading_button.retrying], timeout=2000):
+            loading_button.clicked.emit()
+        assert loading_button.isRunning()
+        qtbot.waitUntil(lambda: not loading_button.isRunning(), timeout=2000)
+        assert attempts == [2, 3]
+        assert results == [3]
+    finally:
+        release.set()
+
+
+def test_retry_timeout_exhausted(qtbot):
+    """Test that the animation stops once the last attempt exceeds the timeout"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    release = threading.Event()
+    loading_button.setRetryPolicy(RetryPolicy(maximum_attempts=2, initial_delay=10))
+    loading_button.setTimeout(50)
+    loading_button.setAction(release.wait)
+    timeouts = []
+    loading_button.timeout.connect(lambda: timeouts.append(True))
+    try:
+        with qtbot.waitSignal(loading_button.finished, timeout=2000):
+            loading_button.clicked.emit()
+        assert not loading_button.isRunning()
+        assert len(timeouts) == 2
+    finally:
+        release.set()
@@ -0,0 +1,96 @@
+import pytest
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QColor, QImage, QPixmap
+from src.pyqt_loading_button.animation_type import AnimationType
+from src.pyqt_loading_button.spinner_renderer import SpinnerRenderer
+
+
+def count_colored_pixels(image: QImage) -> int:
+    """Count the pixels that are not fully transparent"""
+
+    return sum(1 for x in range(image.width()) for y in range(image.height()) if image.pixelColor(x, y).alpha() > 0)
+
+
+def test_initial_values():
+    """Test initial values after instantiating"""
+
+    renderer = SpinnerRenderer()
+    assert renderer.getAnimationType() == AnimationType.Circle
+    assert renderer.getAnimationSpeed() == 2000
+    assert renderer.getAnimationWidth() == 15
+    assert renderer.getAnimationStrokeWidth() == 3
+    assert renderer.getAnimationColor() == QColor(0, 0, 0)
+    assert renderer.isAntialiasingEnabled()
+    assert renderer.getFrameSize() == QSize(18, 18)
+
+
+def test_render_image(qtbot):
+    """Test rendering single frames of both animation types"""
+
+    for animation_type in (AnimationType.Circle, AnimationType.Dots):
+        renderer = SpinnerRenderer(animation_type, color=QColor(255, 0, 0))
+        image = renderer.renderImage(250)
+        assert image.size() == renderer.getFrameSize()
+        assert count_colored_pixels(image) > 0
+        assert renderer.renderImage(250) == image
+        assert renderer.renderImage(900) != image
+
+
+def test_render_device(qtbot):
+    """Test rendering into an existing paint device"""
+
+    pixmap = QPixmap(40, 40)
+    pixmap.fill(QColor(255, 255, 255))
+    SpinnerRenderer(color=QColor(255, 0, 0)).render(pixmap, 0)
+    image = pixmap.toImage()
+    assert image.pixelColor(20, 20) == QColor(255, 255, 255)
+    assert any(image.pixelColor(x, y).red() > image.pixelColor(x, y).green()
+               for x in range(40) for y in range(40))
+
+
+def test_render_frames(qtbot):
+    """Test rendering many frames with one call"""
+
+    renderer = SpinnerRenderer(AnimationType.Dots)
+    times = renderer.getFrameTimes(frame_rate=30)
+    assert len(times) == round(renderer.getLoopDuration() * 30 / 1000)
+
+    images = renderer.renderFrames(times, QSize(30, 20), 2)
+    assert len(images) == len(times)
+    assert images[0].size() == QSize(60, 40)
+    assert images[len(images) // 4] == renderer.renderImage(times[len(images) // 4], QSize(30, 20), 2)
+
+
+def test_seamless_loop(qtbot):
+    """Test that the frame following the last frame of a loop matches the first frame"""
+
+    renderer = SpinnerRenderer(AnimationType.Dots)
+    times = renderer.getFrameTimes(frame_rate=30)
+    assert abs(times[-1] + 1000 / 30 - renderer.getLoopDuration()) < 1e-6
+    assert renderer.renderImage(renderer.getLoopDuration()) == renderer.renderImage(times[0])
+
+    renderer = SpinnerRenderer(AnimationType.Circle)
+    assert renderer.renderImage(renderer.getLoopDuration()) == renderer.renderImage(0)
+
+
+def test_frame_times_bound(qtbot):
+    """Test that loops needing too many frames require an explicit frame count"""
+
+    renderer = SpinnerRenderer(AnimationType.Circle, speed=1999)
+    with pytest.raises(ValueError):
+        renderer.getFrameTimes()
+    assert len(renderer.getFrameTimes(60)) == 60
+
+
+def test_export(qtbot, tmp_path):
+    """Test exporting frames and strips as image files"""
+
+    renderer = SpinnerRenderer()
+    times = renderer.getFrameTimes(10)
+
+    assert renderer.exportStrip(str(tmp_path / 'strip.png'), times)
+    strip = QImage(str(tmp_path / 'strip.png'))
+    assert strip.size() == QSize(18 * 10, 18)
+
+    assert renderer.exportFrames(str(tmp_path / 'frame_{:02d}.png'), times)
+    assert len(list(tmp_path.glob('frame_*.png'))) == 10
@@ -0,0 +1,62 @@
+import time
+from src.pyqt_loading_button.stats import LoadingButtonStats
+from src.pyqt_loading_button.loading_button import LoadingButton
+
+
+def test_paint_times():
+    """Test the average and percentile of the recorded paint times"""
+
+    stats = LoadingButtonStats()
+    for duration in range(1, 101):
+        stats.recordPaint(duration)
+
+    assert stats.getFramesPainted() == 100
+    assert stats.getAveragePaintTime() == 50.5
+    assert stats.getPaintTimePercentile(99) == 99
+    assert stats.getPaintTimePercentile(100) == 100
+
+
+def test_parent_stats():
+    """Test that recorded values are added up in the parent stats"""
+
+    parent = LoadingButtonStats()
+    stats = LoadingButtonStats(parent=parent)
+    stats.recordRepaintRequest()
+    stats.recordAction(2, 10)
+    stats.recordAction(4, 20)
+
+    assert parent.getRepaintsRequested() == 1
+    assert parent.getActionCount() == 2
+    assert stats.getAverageQueueWaitTime() == 3
+    assert stats.getAverageActionTime() == 15
+
+    stats.reset()
+    assert stats.toDict()['action_count'] == 0
+    assert parent.getActionCount() == 2
+
+
+def test_instrumentation(qtbot):
+    """Test that an instrumented button records paints and actions"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.resize(110, 30)
+    loading_button.show()
+
+    assert loading_button.getStats() is None
+    loading_button.setInstrumentationEnabled(True)
+    stats = loading_button.getStats()
+    assert loading_button.isInstrumentationEnabled()
+
+    loading_button.setAction(lambda: time.sleep(0.3))
+    with qtbot.waitSignal(loading_button.finished, timeout=2000):
+        loading_button.clicked.emit()
+
+    assert stats.getActionCount() == 1
+    assert stats.getAverageActionTime() >= 250
+    assert stats.getRepaintsRequested() > 0
+    assert stats.getFramesPainted() > 0
+    assert LoadingButtonStats.getAggregate().getActionCount() >= 1
+
+    loading_button.setInstrumentationEnabled(False)
+    assert loading_button.getStats() is None
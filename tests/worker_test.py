@@ -0,0 +1,234 @@
+import asyncio
+import functools
+import os
+import threading
+import time
+from PyQt6.QtCore import QThreadPool
+from src.pyqt_loading_button.execution_mode import ExecutionMode
+from src.pyqt_loading_button.worker import Worker
+from src.pyqt_loading_button.loading_button import LoadingButton
+
+
+def test_default_thread_pool(qtbot):
+    """Test that workers share the default thread pool"""
+
+    worker = Worker(lambda: None)
+    assert worker.getThreadPool() is Worker.getDefaultThreadPool()
+
+    thread_pool = QThreadPool()
+    worker = Worker(lambda: None, thread_pool)
+    assert worker.getThreadPool() is thread_pool
+
+
+def test_worker_finished(qtbot):
+    """Test that the worker executes the action in the pool"""
+
+    calls = []
+    worker = Worker(lambda: calls.append(True))
+
+    with qtbot.waitSignal(worker.finished, timeout=2000):
+        worker.start()
+    assert calls == [True]
+
+
+def test_bounded_thread_pool(qtbot):
+    """Test that queued actions keep their buttons running until they got executed"""
+
+    thread_pool = QThreadPool()
+    thread_pool.setMaxThreadCount(1)
+
+    loading_button_1 = LoadingButton()
+    loading_button_2 = LoadingButton()
+    for loading_button in (loading_button_1, loading_button_2):
+        qtbot.addWidget(loading_button)
+        loading_button.setThreadPool(thread_pool)
+        loading_button.setAction(lambda: time.sleep(0.5))
+        loading_button.clicked.emit()
+
+    assert loading_button_1.getThreadPool() is thread_pool
+    assert loading_button_1.isRunning()
+    assert loading_button_2.isRunning()
+
+    qtbot.waitUntil(lambda: not loading_button_1.isRunning(), timeout=2000)
+    assert loading_button_2.isRunning()
+
+    qtbot.waitUntil(lambda: not loading_button_2.isRunning(), timeout=2000)
+
+
+def test_coroutine_action(qtbot):
+    """Test that coroutine actions are awaited on the shared event loop"""
+
+    calls = []
+
+    async def action():
+        await asyncio.sleep(0.1)
+        calls.append(threading.current_thread().name)
+
+    worker = Worker(action)
+    assert worker.isCoroutine()
+
+    with qtbot.waitSignal(worker.finished, timeout=2000):
+        worker.start()
+    assert calls == ['LoadingButtonEventLoop']
+
+
+def test_coroutine_action_button(qtbot):
+    """Test that a button stops running once its coroutine action completed"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+
+    async def action():
+        await asyncio.sleep(0.2)
+
+    loading_button.setAction(action)
+    thread_count = threading.active_count()
+
+    with qtbot.waitSignal(loading_button.finished, timeout=2000):
+        loading_button.clicked.emit()
+        assert loading_button.isRunning()
+        assert threading.active_count() <= thread_count + 1
+    assert not loading_button.isRunning()
+
+
+def test_cancel_coroutine(qtbot):
+    """Test that cancelling a coroutine action cancels it at its next await"""
+
+    async def action():
+        await asyncio.sleep(10)
+
+    worker = Worker(action)
+
+    with qtbot.waitSignal(worker.started, timeout=2000):
+        worker.start()
+    with qtbot.waitSignals([worker.cancelled, worker.finished], timeout=2000):
+        worker.cancel()
+    assert worker.isCancelled()
+
+
+def test_cancel_queued(qtbot):
+    """Test that cancelling a queued action removes it from the pool"""
+
+    thread_pool = QThreadPool()
+    thread_pool.setMaxThreadCount(1)
+    calls = []
+
+    blocking_worker = Worker(lambda: time.sleep(0.3), thread_pool)
+    queued_worker = Worker(lambda: calls.append(True), thread_pool)
+    blocking_worker.start()
+    queued_worker.start()
+
+    with qtbot.waitSignals([queued_worker.cancelled, queued_worker.finished], timeout=2000):
+        queued_worker.cancel()
+
+    thread_pool.waitForDone()
+    assert calls == []
+
+
+def get_process_id() -> int:
+    """Action returning the id of the process it got executed in"""
+
+    return os.getpid()
+
+
+def raise_error():
+    """Action raising an exception"""
+
+    raise ValueError('Error')
+
+
+def wait_for_file(started_path: str, release_path: str):
+    """Action creating a file once it started and waiting for another file to exist"""
+
+    open(started_path, 'w').close()
+    deadline = time.monotonic() + 30
+    while not os.path.exists(release_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_process_action(qtbot):
+    """Test that actions with the process execution mode are executed in a separate process"""
+
+    worker = Worker(get_process_id, execution_mode=ExecutionMode.Process)
+    assert worker.getExecutionMode() == ExecutionMode.Process
+
+    with qtbot.waitSignals([worker.result, worker.finished], timeout=30000) as blocker:
+        worker.start()
+    assert blocker.all_signals_and_args[0].args[0] != os.getpid()
+    assert worker.getActionTime() >= 0
+    assert worker.getQueueWaitTime() >= 0
+
+
+def test_process_action_error(qtbot):
+    """Test that exceptions and unpicklable actions are reported as errors"""
+
+    worker = Worker(raise_error, execution_mode=ExecutionMode.Process)
+    with qtbot.waitSignal(worker.error, timeout=30000) as blocker:
+        worker.start()
+    assert isinstance(blocker.args[0], ValueError)
+
+    worker = Worker(lambda: None, execution_mode=ExecutionMode.Process)
+    with qtbot.waitSignals([worker.error, worker.finished], timeout=30000):
+        worker.start()
+
+
+def test_process_action_button(qtbot):
+    """Test that a button emits the result of an action executed in a separate process"""
+
+    loading_button = LoadingButton()
+    qtbot.addWidget(loading_button)
+    loading_button.setExecutionMode(ExecutionMode.Process)
+    loading_button.setAction(get_process_id)
+    assert loading_button.getExecutionMode() == ExecutionMode.Process
+
+    with qtbot.waitSignals([loading_button.result, loading_button.finished], timeout=30000):
+        loading_button.clicked.emit()
+    assert not loading_button.isRunning()
+
+
+def test_abandon(qtbot):
+    """Test that an abandoned worker no longer occupies a thread of the pool"""
+
+    thread_pool = QThreadPool()
+    thread_pool.setMaxThreadCount(1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def stuck_action():
+        started.set()
+        release.wait()
+
+    try:
+        stuck_worker = Worker(stuck_action, thread_pool)
+        stuck_worker.start()
+        assert started.wait(2)
+
+        stuck_worker.abandon()
+        assert stuck_worker.isCancelled()
+        worker = Worker(lambda: 1, thread_pool)
+        with qtbot.waitSignal(worker.result, timeout=2000):
+            worker.start()
+    finally:
+        release.set()
+    assert thread_pool.waitForDone(2000)
+    assert thread_pool.activeThreadCount() == 0
+
+
+def test_abandon_process(qtbot, tmp_path):
+    """Test that abandoning a running process action replaces the default process pool"""
+
+    started_path, release_path = str(tmp_path / 'started'), str(tmp_path / 'release')
+    process_pool = Worker.getDefaultProcessPool()
+    stuck_worker = Worker(functools.partial(wait_for_file, started_path, release_path),
+                          execution_mode=ExecutionMode.Process)
+    try:
+        stuck_worker.start()
+        qtbot.waitUntil(lambda: os.path.exists(started_path), timeout=30000)
+
+        stuck_worker.abandon()
+        assert Worker.getDefaultProcessPool() is not process_pool
+        worker = Worker(get_process_id, execution_mode=ExecutionMode.Process)
+        with qtbot.waitSignal(worker.result, timeout=30000):
+            worker.start()
+    finally:
+        open(release_path, 'w').close()